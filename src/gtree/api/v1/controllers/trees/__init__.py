@@ -3,12 +3,30 @@ from fastapi.routing import APIRouter
 from gtree.api.v1.controllers.trees.blood_relations_controller import (
     router as blood_relations_router,
 )
+from gtree.api.v1.controllers.trees.duplicates_controller import (
+    router as duplicates_router,
+)
+from gtree.api.v1.controllers.trees.events_controller import (
+    router as events_router,
+)
 from gtree.api.v1.controllers.trees.individuals_controller import (
     router as individuals_router,
 )
+from gtree.api.v1.controllers.trees.layout_controller import (
+    router as layout_router,
+)
 from gtree.api.v1.controllers.trees.marriages_controller import (
     router as marriages_router,
 )
+from gtree.api.v1.controllers.trees.relationships_controller import (
+    router as relationships_router,
+)
+from gtree.api.v1.controllers.trees.sync_controller import (
+    router as sync_router,
+)
+from gtree.api.v1.controllers.trees.transfer_controller import (
+    router as transfer_router,
+)
 from gtree.api.v1.controllers.trees.trees_controller import (
     router as trees_router,
 )
@@ -17,6 +35,12 @@ router = APIRouter()
 
 
 router.include_router(blood_relations_router, prefix="")
+router.include_router(duplicates_router, prefix="")
+router.include_router(events_router, prefix="")
 router.include_router(individuals_router, prefix="")
+router.include_router(layout_router, prefix="")
 router.include_router(marriages_router, prefix="")
+router.include_router(relationships_router, prefix="")
+router.include_router(sync_router, prefix="")
+router.include_router(transfer_router, prefix="")
 router.include_router(trees_router, prefix="")
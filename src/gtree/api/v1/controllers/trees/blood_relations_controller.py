@@ -5,6 +5,7 @@ from fastapi.param_functions import Depends
 from fastapi.routing import APIRouter
 
 from gtree.api.v1.dependencies import (
+    check_tree_etag,
     get_blood_relation_service,
     get_current_active_user,
 )
@@ -12,6 +13,7 @@ from gtree.api.v1.schemas.trees.blood_relation import (
     BloodRelationCreateRequestSchema,
     BloodRelationResponseSchema,
 )
+from gtree.application.services.trees.batch import MAX_BATCH_ITEMS
 from gtree.application.services.trees.blood_relation_service import BloodRelationService
 from gtree.domain.entities.user import UserEntity
 
@@ -21,7 +23,9 @@ router = APIRouter(
 
 
 @router.get(
-    "/{tree_id}/blood_relations", response_model=list[BloodRelationResponseSchema]
+    "/{tree_id}/blood_relations",
+    response_model=list[BloodRelationResponseSchema],
+    dependencies=[Depends(check_tree_etag)],
 )
 async def get_blood_relations(
     tree_id: UUID,
@@ -58,9 +62,34 @@ async def create_blood_relation(
     )
 
 
+@router.post(
+    "/{tree_id}/blood_relations:batch",
+    response_model=list[BloodRelationResponseSchema],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_blood_relations(
+    tree_id: UUID,
+    blood_relations: list[BloodRelationCreateRequestSchema] = Body(
+        ..., max_length=MAX_BATCH_ITEMS
+    ),
+    user: UserEntity = Depends(get_current_active_user),
+    service: BloodRelationService = Depends(get_blood_relation_service),
+) -> list[BloodRelationResponseSchema]:
+    """Create many blood_relations in one transaction."""
+    return [
+        BloodRelationResponseSchema.from_entity(e)
+        for e in await service.create_blood_relations(
+            user_id=user.id,
+            tree_id=tree_id,
+            blood_relation_schemas=blood_relations,
+        )
+    ]
+
+
 @router.get(
     "/{tree_id}/blood_relations/{parent_id}/{child_id}",
     response_model=BloodRelationResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
 )
 async def get_blood_relation(
     tree_id: UUID,
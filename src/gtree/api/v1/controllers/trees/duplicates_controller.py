@@ -0,0 +1,52 @@
+from uuid import UUID
+
+from fastapi import Depends, Query, status
+from fastapi.routing import APIRouter
+
+from gtree.api.v1.dependencies import get_current_active_user, get_duplicate_service
+from gtree.api.v1.schemas.trees.duplicate_scan import DuplicateScanResponseSchema
+from gtree.application.services.trees.duplicate_service import DuplicateService
+from gtree.domain.entities.user import UserEntity
+
+router = APIRouter(
+    tags=["Duplicates"],
+)
+
+
+@router.post(
+    "/{tree_id}/duplicates/scans",
+    response_model=DuplicateScanResponseSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_duplicate_scan(
+    tree_id: UUID,
+    user: UserEntity = Depends(get_current_active_user),
+    service: DuplicateService = Depends(get_duplicate_service),
+) -> DuplicateScanResponseSchema:
+    """Start searching a tree for duplicate individuals in the background.
+
+    Poll the returned scan for progress and, once completed, the suggestions.
+    If a scan of the tree is already running, that one is returned.
+    """
+    return DuplicateScanResponseSchema.from_entity(
+        await service.start_scan(user_id=user.id, tree_id=tree_id)
+    )
+
+
+@router.get(
+    "/{tree_id}/duplicates/scans/{scan_id}",
+    response_model=DuplicateScanResponseSchema,
+)
+async def get_duplicate_scan(
+    tree_id: UUID,
+    scan_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    user: UserEntity = Depends(get_current_active_user),
+    service: DuplicateService = Depends(get_duplicate_service),
+) -> DuplicateScanResponseSchema:
+    """Get the progress of a duplicate scan and its best suggestions, best first."""
+    return DuplicateScanResponseSchema.from_entity(
+        await service.get_scan(
+            user_id=user.id, tree_id=tree_id, scan_id=scan_id, limit=limit
+        )
+    )
@@ -0,0 +1,66 @@
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+import json
+from uuid import UUID
+
+from fastapi.param_functions import Depends
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRouter
+
+from gtree.api.v1.dependencies import (
+    get_current_active_user_for_stream,
+    get_tree_event_service,
+)
+from gtree.application.services.trees.tree_event_service import TreeEventService
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities.trees.tree_event import TreeEventEntity
+from gtree.domain.entities.user import UserEntity
+
+router = APIRouter(
+    tags=["Events"],
+)
+
+
+async def _server_sent_events(
+    batches: AsyncGenerator[list[TreeEventEntity] | None],
+) -> AsyncIterator[str]:
+    async with aclosing(batches):
+        async for batch in batches:
+            if batch is None:
+                yield "event: resync\ndata: {}\n\n"
+                continue
+            if not batch:
+                yield ": keep-alive\n\n"
+                continue
+            data = [
+                {"kind": event.kind, "action": event.action}
+                | ({"key": [str(part) for part in event.key]} if event.key else {})
+                for event in batch
+            ]
+            yield f"event: changes\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+            if any(
+                event.kind == RecordKind.TREE and event.action == ChangeAction.DELETED
+                for event in batch
+            ):
+                return
+
+
+@router.get("/{tree_id}/events", response_class=StreamingResponse)
+async def watch_tree(
+    tree_id: UUID,
+    user: UserEntity = Depends(get_current_active_user_for_stream),
+    service: TreeEventService = Depends(get_tree_event_service),
+) -> StreamingResponse:
+    """Stream the changes of a tree as server-sent events.
+
+    `changes` events carry a JSON list of `{kind, action, key}`; bursts are
+    coalesced and `key` is left out for batch writes. On `resync`, fetch
+    the tree or a delta from `/changes`. The stream ends when the tree is
+    deleted.
+    """
+    return StreamingResponse(
+        _server_sent_events(await service.watch_tree(user_id=user.id, tree_id=tree_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
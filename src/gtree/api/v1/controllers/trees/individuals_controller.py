@@ -1,16 +1,33 @@
+from datetime import date
 from uuid import UUID
 
-from fastapi import Body, status
+from fastapi import Body, Query, status
 from fastapi.param_functions import Depends
 from fastapi.routing import APIRouter
 
-from gtree.api.v1.dependencies import get_current_active_user, get_individual_service
+from gtree.api.v1.dependencies import (
+    check_tree_etag,
+    get_current_active_user,
+    get_individual_service,
+    get_merge_service,
+)
 from gtree.api.v1.schemas.trees.individual import (
     IndividualCreateRequestSchema,
+    IndividualMatchResponseSchema,
+    IndividualMergeResponseSchema,
+    IndividualPageResponseSchema,
+    IndividualRelatednessResponseSchema,
     IndividualResponseSchema,
+    IndividualTextSearchPageResponseSchema,
     IndividualUpdateRequestSchema,
 )
+from gtree.api.v1.schemas.trees.lineage import LineageResponseSchema
+from gtree.api.v1.schemas.trees.tree_graph import TreeGraphResponseSchema
+from gtree.application.services.trees.batch import MAX_BATCH_ITEMS
 from gtree.application.services.trees.individual_service import IndividualService
+from gtree.application.services.trees.merge_service import MergeService
+from gtree.domain.entities._value_objects.individual_order import IndividualOrder
+from gtree.domain.entities._value_objects.name_search_mode import NameSearchMode
 from gtree.domain.entities.user import UserEntity
 
 router = APIRouter(
@@ -18,21 +35,128 @@ router = APIRouter(
 )
 
 
-@router.get("/{tree_id}/individuals", response_model=list[IndividualResponseSchema])
+@router.get(
+    "/{tree_id}/individuals",
+    response_model=IndividualPageResponseSchema,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(check_tree_etag)],
+)
 async def get_individuals(
     tree_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None),
+    order: IndividualOrder = Query(IndividualOrder.NAME),
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to return, e.g. `first_name,last_name`",
+    ),
+    born_from: date | None = Query(None, description="Born on or after this day"),
+    born_to: date | None = Query(None, description="Born on or before this day"),
+    alive_in: int | None = Query(None, ge=1, le=9999, description="Alive in this year"),
+    died_before: date | None = Query(None, description="Died before this day"),
     user: UserEntity = Depends(get_current_active_user),
     service: IndividualService = Depends(get_individual_service),
-) -> list[IndividualResponseSchema]:
-    """Get all individuals for a tree."""
+) -> IndividualPageResponseSchema:
+    """Get a page of the individuals of a tree.
+
+    Pass `next_cursor` of a page as `cursor` to get the next one, with the
+    same filters. Date filters match every individual whose dates may
+    satisfy them given their precision: a birth in "about 1850" counts as
+    born between 1845 and 1855. Individuals without the dates a filter needs
+    are left out; a known birth or death alone is taken to bound a life of
+    at most 110 years.
+    """
+    return IndividualPageResponseSchema.from_entity(
+        await service.get_individuals_for_tree(
+            user_id=user.id,
+            tree_id=tree_id,
+            limit=limit,
+            cursor=cursor,
+            order=order,
+            fields=(
+                [name.strip() for name in fields.split(",") if name.strip()]
+                if fields
+                else None
+            ),
+            born_from=born_from,
+            born_to=born_to,
+            alive_in=alive_in,
+            died_before=died_before,
+        )
+    )
+
+
+@router.get(
+    "/{tree_id}/individuals/search",
+    response_model=list[IndividualMatchResponseSchema],
+    dependencies=[Depends(check_tree_etag)],
+)
+async def search_individuals(
+    tree_id: UUID,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    mode: NameSearchMode = Query(NameSearchMode.FUZZY),
+    user: UserEntity = Depends(get_current_active_user),
+    service: IndividualService = Depends(get_individual_service),
+) -> list[IndividualMatchResponseSchema]:
+    """Find individuals by name, tolerating typos and word order.
+
+    Queries of one or two letters match the start of first or last names.
+    With `mode=phonetic`, every query word must sound like a word of the
+    name, whatever the spelling or alphabet: "Iwanow" finds "Иванов".
+    """
     return [
-        IndividualResponseSchema.from_entity(e)
-        for e in await service.get_individuals_for_tree(
-            user_id=user.id, tree_id=tree_id
+        IndividualMatchResponseSchema.from_entity(match)
+        for match in await service.search_individuals(
+            user_id=user.id, tree_id=tree_id, query=q, limit=limit, mode=mode
         )
     ]
 
 
+@router.get(
+    "/{tree_id}/individuals/text-search",
+    response_model=IndividualTextSearchPageResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def search_individuals_text(
+    tree_id: UUID,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    user: UserEntity = Depends(get_current_active_user),
+    service: IndividualService = Depends(get_individual_service),
+) -> IndividualTextSearchPageResponseSchema:
+    """Find individuals by words of their birth or death place or biography.
+
+    Words match in any inflection, in Russian or English; "quoted phrases",
+    `or` and `-excluded` words are supported. Places weigh more than the
+    biography. `highlights` holds fragments of the matching fields with the
+    matches wrapped in `<mark>` tags; the rest of the text is not escaped.
+    Pass `next_cursor` of a page as `cursor` to get the next one.
+    """
+    return IndividualTextSearchPageResponseSchema.from_entity(
+        await service.search_individuals_text(
+            user_id=user.id, tree_id=tree_id, query=q, limit=limit, cursor=cursor
+        )
+    )
+
+
+@router.get(
+    "/{tree_id}/graph",
+    response_model=TreeGraphResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_tree_graph(
+    tree_id: UUID,
+    user: UserEntity = Depends(get_current_active_user),
+    service: IndividualService = Depends(get_individual_service),
+) -> TreeGraphResponseSchema:
+    """Get the whole tree as compact adjacency data."""
+    return TreeGraphResponseSchema.from_graph(
+        await service.get_tree_graph(user_id=user.id, tree_id=tree_id)
+    )
+
+
 @router.post(
     "/{tree_id}/individuals",
     response_model=IndividualResponseSchema,
@@ -54,8 +178,34 @@ async def create_individual(
     )
 
 
+@router.post(
+    "/{tree_id}/individuals:batch",
+    response_model=list[IndividualResponseSchema],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_individuals(
+    tree_id: UUID,
+    individuals: list[IndividualCreateRequestSchema] = Body(
+        ..., max_length=MAX_BATCH_ITEMS
+    ),
+    user: UserEntity = Depends(get_current_active_user),
+    service: IndividualService = Depends(get_individual_service),
+) -> list[IndividualResponseSchema]:
+    """Create many individuals in one transaction."""
+    return [
+        IndividualResponseSchema.from_entity(e)
+        for e in await service.create_individuals(
+            user_id=user.id,
+            tree_id=tree_id,
+            individual_schemas=individuals,
+        )
+    ]
+
+
 @router.get(
-    "/{tree_id}/individuals/{individual_id}", response_model=IndividualResponseSchema
+    "/{tree_id}/individuals/{individual_id}",
+    response_model=IndividualResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
 )
 async def get_individual(
     tree_id: UUID,
@@ -73,6 +223,77 @@ async def get_individual(
     )
 
 
+@router.get(
+    "/{tree_id}/individuals/{individual_id}/ancestors",
+    response_model=LineageResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_ancestors(
+    tree_id: UUID,
+    individual_id: UUID,
+    depth: int = Query(5, ge=1, le=64),
+    user: UserEntity = Depends(get_current_active_user),
+    service: IndividualService = Depends(get_individual_service),
+) -> LineageResponseSchema:
+    """Get ancestors of an individual up to `depth` generations."""
+    return LineageResponseSchema.from_entity(
+        await service.get_ancestors(
+            user_id=user.id,
+            tree_id=tree_id,
+            individual_id=individual_id,
+            depth=depth,
+        )
+    )
+
+
+@router.get(
+    "/{tree_id}/individuals/{individual_id}/descendants",
+    response_model=LineageResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_descendants(
+    tree_id: UUID,
+    individual_id: UUID,
+    depth: int = Query(5, ge=1, le=64),
+    user: UserEntity = Depends(get_current_active_user),
+    service: IndividualService = Depends(get_individual_service),
+) -> LineageResponseSchema:
+    """Get descendants of an individual up to `depth` generations."""
+    return LineageResponseSchema.from_entity(
+        await service.get_descendants(
+            user_id=user.id,
+            tree_id=tree_id,
+            individual_id=individual_id,
+            depth=depth,
+        )
+    )
+
+
+@router.get(
+    "/{tree_id}/individuals/{individual_id}/related/{other_id}",
+    response_model=IndividualRelatednessResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_relatedness(
+    tree_id: UUID,
+    individual_id: UUID,
+    other_id: UUID,
+    user: UserEntity = Depends(get_current_active_user),
+    service: IndividualService = Depends(get_individual_service),
+) -> IndividualRelatednessResponseSchema:
+    """Check whether two individuals are blood relatives."""
+    return IndividualRelatednessResponseSchema(
+        individual_id=individual_id,
+        other_id=other_id,
+        is_related=await service.is_related(
+            user_id=user.id,
+            tree_id=tree_id,
+            individual_id=individual_id,
+            other_id=other_id,
+        ),
+    )
+
+
 @router.patch(
     "/{tree_id}/individuals/{individual_id}",
     response_model=IndividualResponseSchema,
@@ -95,6 +316,33 @@ async def update_individual(
     )
 
 
+@router.post(
+    "/{tree_id}/individuals/{keep_id}/merge/{drop_id}",
+    response_model=IndividualMergeResponseSchema,
+)
+async def merge_individuals(
+    tree_id: UUID,
+    keep_id: UUID,
+    drop_id: UUID,
+    user: UserEntity = Depends(get_current_active_user),
+    service: MergeService = Depends(get_merge_service),
+) -> IndividualMergeResponseSchema:
+    """Merge a duplicate individual into another.
+
+    The parents, children and marriages of `drop_id` move to `keep_id`,
+    which also takes the details it lacks; `drop_id` is then deleted.
+    Relations both already had are kept once.
+    """
+    return IndividualMergeResponseSchema.from_entity(
+        await service.merge_individuals(
+            user_id=user.id,
+            tree_id=tree_id,
+            keep_id=keep_id,
+            drop_id=drop_id,
+        )
+    )
+
+
 @router.delete(
     "/{tree_id}/individuals/{individual_id}", status_code=status.HTTP_204_NO_CONTENT
 )
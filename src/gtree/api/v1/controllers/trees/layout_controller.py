@@ -0,0 +1,67 @@
+from uuid import UUID
+
+from fastapi import Query
+from fastapi.param_functions import Depends
+from fastapi.routing import APIRouter
+
+from gtree.api.v1.dependencies import (
+    check_tree_etag,
+    get_current_active_user,
+    get_layout_service,
+)
+from gtree.api.v1.schemas.trees.layout import LayoutResponseSchema, TileResponseSchema
+from gtree.application.services.trees.layout_service import MAX_ZOOM, LayoutService
+from gtree.domain.entities.user import UserEntity
+
+router = APIRouter(
+    tags=["Layout"],
+)
+
+
+@router.get(
+    "/{tree_id}/layout",
+    response_model=LayoutResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_layout(
+    tree_id: UUID,
+    user: UserEntity = Depends(get_current_active_user),
+    service: LayoutService = Depends(get_layout_service),
+) -> LayoutResponseSchema:
+    """Get precomputed coordinates of every individual and marriage in a tree."""
+    return LayoutResponseSchema.from_entity(
+        await service.get_layout(user_id=user.id, tree_id=tree_id)
+    )
+
+
+@router.get(
+    "/{tree_id}/tiles",
+    response_model=TileResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_tile(
+    tree_id: UUID,
+    x0: float = Query(..., allow_inf_nan=False),
+    y0: float = Query(..., allow_inf_nan=False),
+    x1: float = Query(..., allow_inf_nan=False),
+    y1: float = Query(..., allow_inf_nan=False),
+    zoom: int = Query(..., ge=0, le=MAX_ZOOM),
+    user: UserEntity = Depends(get_current_active_user),
+    service: LayoutService = Depends(get_layout_service),
+) -> TileResponseSchema:
+    """Get the part of the tree layout inside a viewport.
+
+    Coordinates are in layout units (`y` is the generation). At low zoom, or
+    when the viewport holds too many individuals, clusters are returned instead.
+    """
+    return TileResponseSchema.from_entity(
+        await service.get_tile(
+            user_id=user.id,
+            tree_id=tree_id,
+            x0=x0,
+            y0=y0,
+            x1=x1,
+            y1=y1,
+            zoom=zoom,
+        )
+    )
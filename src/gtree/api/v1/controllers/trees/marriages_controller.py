@@ -5,6 +5,7 @@ from fastapi.param_functions import Depends
 from fastapi.routing import APIRouter
 
 from gtree.api.v1.dependencies import (
+    check_tree_etag,
     get_current_active_user,
     get_marriage_service,
 )
@@ -13,6 +14,7 @@ from gtree.api.v1.schemas.trees.marriage import (
     MarriageResponseSchema,
     MarriageUpdateRequestSchema,
 )
+from gtree.application.services.trees.batch import MAX_BATCH_ITEMS
 from gtree.application.services.trees.marriage_service import MarriageService
 from gtree.domain.entities.user import UserEntity
 
@@ -21,7 +23,11 @@ router = APIRouter(
 )
 
 
-@router.get("/{tree_id}/marriages", response_model=list[MarriageResponseSchema])
+@router.get(
+    "/{tree_id}/marriages",
+    response_model=list[MarriageResponseSchema],
+    dependencies=[Depends(check_tree_etag)],
+)
 async def get_marriages(
     tree_id: UUID,
     user: UserEntity = Depends(get_current_active_user),
@@ -55,9 +61,34 @@ async def create_marriage(
     )
 
 
+@router.post(
+    "/{tree_id}/marriages:batch",
+    response_model=list[MarriageResponseSchema],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_marriages(
+    tree_id: UUID,
+    marriages: list[MarriageCreateRequestSchema] = Body(
+        ..., max_length=MAX_BATCH_ITEMS
+    ),
+    user: UserEntity = Depends(get_current_active_user),
+    service: MarriageService = Depends(get_marriage_service),
+) -> list[MarriageResponseSchema]:
+    """Create many marriages in one transaction."""
+    return [
+        MarriageResponseSchema.from_entity(e)
+        for e in await service.create_marriages(
+            user_id=user.id,
+            tree_id=tree_id,
+            marriage_schemas=marriages,
+        )
+    ]
+
+
 @router.get(
     "/{tree_id}/marriages/{father_id}/{mother_id}",
     response_model=MarriageResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
 )
 async def get_marriage(
     tree_id: UUID,
@@ -0,0 +1,82 @@
+from uuid import UUID
+
+from fastapi.param_functions import Depends
+from fastapi.routing import APIRouter
+
+from gtree.api.v1.dependencies import (
+    check_tree_etag,
+    get_current_active_user,
+    get_relationship_service,
+)
+from gtree.api.v1.schemas.trees.relationship import (
+    InbreedingAnnotationResponseSchema,
+    RelationshipCoefficientsResponseSchema,
+    RelationshipResponseSchema,
+)
+from gtree.application.services.trees.relationship_service import RelationshipService
+from gtree.domain.entities.user import UserEntity
+
+router = APIRouter(
+    tags=["Relationships"],
+)
+
+
+@router.get(
+    "/{tree_id}/relationships/{individual_id}/{other_id}",
+    response_model=RelationshipResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_relationship(
+    tree_id: UUID,
+    individual_id: UUID,
+    other_id: UUID,
+    user: UserEntity = Depends(get_current_active_user),
+    service: RelationshipService = Depends(get_relationship_service),
+) -> RelationshipResponseSchema:
+    """Get how an individual is related to another one."""
+    return RelationshipResponseSchema.from_entity(
+        await service.get_relationship(
+            user_id=user.id,
+            tree_id=tree_id,
+            individual_id=individual_id,
+            other_id=other_id,
+        )
+    )
+
+
+@router.get(
+    "/{tree_id}/relationships/{individual_id}/{other_id}/coefficients",
+    response_model=RelationshipCoefficientsResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_relationship_coefficients(
+    tree_id: UUID,
+    individual_id: UUID,
+    other_id: UUID,
+    user: UserEntity = Depends(get_current_active_user),
+    service: RelationshipService = Depends(get_relationship_service),
+) -> RelationshipCoefficientsResponseSchema:
+    """Get kinship, relationship and inbreeding coefficients of two individuals."""
+    return RelationshipCoefficientsResponseSchema.from_entity(
+        await service.get_coefficients(
+            user_id=user.id,
+            tree_id=tree_id,
+            individual_id=individual_id,
+            other_id=other_id,
+        )
+    )
+
+
+@router.post(
+    "/{tree_id}/inbreeding",
+    response_model=InbreedingAnnotationResponseSchema,
+)
+async def annotate_inbreeding(
+    tree_id: UUID,
+    user: UserEntity = Depends(get_current_active_user),
+    service: RelationshipService = Depends(get_relationship_service),
+) -> InbreedingAnnotationResponseSchema:
+    """Compute and store the inbreeding coefficient of every individual in a tree."""
+    return InbreedingAnnotationResponseSchema.from_entity(
+        await service.annotate_inbreeding(user_id=user.id, tree_id=tree_id)
+    )
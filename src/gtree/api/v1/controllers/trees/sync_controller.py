@@ -0,0 +1,43 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Query
+from fastapi.param_functions import Depends
+from fastapi.routing import APIRouter
+
+from gtree.api.v1.dependencies import (
+    check_tree_etag,
+    get_current_active_user,
+    get_sync_service,
+)
+from gtree.api.v1.schemas.trees.tree_changes import TreeChangesResponseSchema
+from gtree.application.services.trees.sync_service import SyncService
+from gtree.domain.entities.user import UserEntity
+
+router = APIRouter(
+    tags=["Sync"],
+)
+
+
+@router.get(
+    "/{tree_id}/changes",
+    response_model=TreeChangesResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
+async def get_tree_changes(
+    tree_id: UUID,
+    since: datetime = Query(
+        ..., description="`cursor` of the previous delta; naive values are UTC"
+    ),
+    user: UserEntity = Depends(get_current_active_user),
+    service: SyncService = Depends(get_sync_service),
+) -> TreeChangesResponseSchema:
+    """Get the records of a tree created, updated or deleted since a cursor.
+
+    Deleted records are listed in `deleted`. Records near the cursor may be
+    repeated in the next delta, so apply them as upserts. Send the ETag of
+    the previous delta as `If-None-Match` to get a 304 if nothing changed.
+    """
+    return TreeChangesResponseSchema.from_entity(
+        await service.get_changes(user_id=user.id, tree_id=tree_id, since=since)
+    )
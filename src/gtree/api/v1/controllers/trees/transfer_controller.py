@@ -0,0 +1,77 @@
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from fastapi import File, Query, UploadFile, status
+from fastapi.param_functions import Depends
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRouter
+
+from gtree.api.v1.dependencies import (
+    get_current_active_user,
+    get_export_service,
+    get_import_service,
+)
+from gtree.api.v1.schemas.trees.import_result import ImportResultResponseSchema
+from gtree.application.services.trees.export_service import (
+    ExportFormat,
+    ExportService,
+)
+from gtree.application.services.trees.import_service import ImportService
+from gtree.domain.entities.user import UserEntity
+from gtree.infrastructure.utils.gedcom import decode_lines
+
+router = APIRouter(
+    tags=["Import / Export"],
+)
+
+_CHUNK_SIZE = 64 * 1024
+_EXPORT_MEDIA_TYPES = {
+    ExportFormat.GEDCOM: ("application/x-gedcom", "ged"),
+    ExportFormat.NDJSON: ("application/x-ndjson", "ndjson"),
+}
+
+
+async def _read_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(_CHUNK_SIZE):
+        yield chunk
+
+
+@router.post(
+    "/{tree_id}/import/gedcom",
+    response_model=ImportResultResponseSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_gedcom(
+    tree_id: UUID,
+    file: UploadFile = File(...),
+    user: UserEntity = Depends(get_current_active_user),
+    service: ImportService = Depends(get_import_service),
+) -> ImportResultResponseSchema:
+    """Import individuals, blood relations and marriages from a GEDCOM file."""
+    return ImportResultResponseSchema.from_entity(
+        await service.import_gedcom(
+            user_id=user.id,
+            tree_id=tree_id,
+            lines=decode_lines(_read_chunks(file)),
+        )
+    )
+
+
+@router.get("/{tree_id}/export", response_class=StreamingResponse)
+async def export_tree(
+    tree_id: UUID,
+    export_format: ExportFormat = Query(ExportFormat.GEDCOM, alias="format"),
+    user: UserEntity = Depends(get_current_active_user),
+    service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """Download a whole tree as GEDCOM or JSON lines, streamed as it is read."""
+    media_type, extension = _EXPORT_MEDIA_TYPES[export_format]
+    return StreamingResponse(
+        await service.export_tree(
+            user_id=user.id, tree_id=tree_id, export_format=export_format
+        ),
+        media_type=f"{media_type}; charset=utf-8",
+        headers={
+            "Content-Disposition": f'attachment; filename="{tree_id}.{extension}"'
+        },
+    )
@@ -2,7 +2,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 
-from gtree.api.v1.dependencies import get_current_active_user, get_tree_service
+from gtree.api.v1.dependencies import (
+    check_tree_etag,
+    get_current_active_user,
+    get_tree_service,
+)
 from gtree.api.v1.schemas.trees.tree import (
     TreeCreateRequestSchema,
     TreeResponseSchema,
@@ -46,7 +50,11 @@ async def create_tree(
     )
 
 
-@router.get("/{tree_id}", response_model=TreeResponseSchema)
+@router.get(
+    "/{tree_id}",
+    response_model=TreeResponseSchema,
+    dependencies=[Depends(check_tree_etag)],
+)
 async def get_tree(
     tree_id: UUID,
     user: UserEntity = Depends(get_current_active_user),
@@ -1,20 +1,49 @@
-from fastapi import Depends
+from datetime import timedelta
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security.oauth2 import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from gtree.application.services.trees.blood_relation_service import BloodRelationService
+from gtree.application.services.trees.duplicate_service import DuplicateService
+from gtree.application.services.trees.export_service import ExportService
+from gtree.application.services.trees.import_service import ImportService
 from gtree.application.services.trees.individual_service import IndividualService
+from gtree.application.services.trees.layout_service import LayoutService
+from gtree.application.services.trees.marriage_service import MarriageService
+from gtree.application.services.trees.merge_service import MergeService
+from gtree.application.services.trees.relationship_service import (
+    RelationshipService,
+)
+from gtree.application.services.trees.sync_service import SyncService
+from gtree.application.services.trees.tree_event_service import TreeEventService
 from gtree.application.services.trees.tree_service import TreeService
 from gtree.application.services.user_service import UserService
+from gtree.core.config.settings import settings
 from gtree.domain.entities.user import UserEntity
+from gtree.infrastructure.db.jobs.duplicate_scan import run_duplicate_scan
+from gtree.infrastructure.db.notifications import tree_event_hub
+from gtree.infrastructure.db.repositories.trees.ancestry_closure import (
+    AncestryClosureRepository,
+)
 from gtree.infrastructure.db.repositories.trees.blood_relation import (
     BloodRelationRepository,
 )
+from gtree.infrastructure.db.repositories.trees.duplicate_scan import (
+    DuplicateScanRepository,
+)
 from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
 from gtree.infrastructure.db.repositories.trees.marriage import (
     MarriageRepository,
 )
 from gtree.infrastructure.db.repositories.trees.tree import TreeRepository
 from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_event import TreeEventRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
+from gtree.infrastructure.db.repositories.trees.tree_tombstone import (
+    TreeTombstoneRepository,
+)
 from gtree.infrastructure.db.repositories.user import UserRepository
 from gtree.infrastructure.db.session import get_db
 
@@ -27,22 +56,115 @@ def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
 
 
 def get_tree_service(db: AsyncSession = Depends(get_db)) -> TreeService:
-    return TreeService(TreeRepository(db), TreeAccessRepository(db))
+    return TreeService(
+        TreeRepository(db), TreeAccessRepository(db), TreeEventRepository(db)
+    )
 
 
 def get_individual_service(db: AsyncSession = Depends(get_db)) -> IndividualService:
-    return IndividualService(IndividualRepository(db), TreeAccessRepository(db))
+    return IndividualService(
+        IndividualRepository(db),
+        TreeAccessRepository(db),
+        TreeGraphRepository(db),
+        TreeEventRepository(db),
+        AncestryClosureRepository(db)
+        if settings.app.ancestry_closure_enabled
+        else None,
+    )
 
 
-def get_blood_relation_service(db: AsyncSession = Depends(get_db)) -> IndividualService:
+def get_blood_relation_service(
+    db: AsyncSession = Depends(get_db),
+) -> BloodRelationService:
     return BloodRelationService(
-        BloodRelationRepository(db), IndividualRepository(db), TreeAccessRepository(db)
+        BloodRelationRepository(db),
+        IndividualRepository(db),
+        TreeAccessRepository(db),
+        TreeGraphRepository(db),
+        TreeEventRepository(db),
     )
 
 
-def get_marriage_service(db: AsyncSession = Depends(get_db)) -> IndividualService:
+def get_marriage_service(db: AsyncSession = Depends(get_db)) -> MarriageService:
     return MarriageService(
-        MarriageRepository(db), IndividualRepository(db), TreeAccessRepository(db)
+        MarriageRepository(db),
+        IndividualRepository(db),
+        TreeAccessRepository(db),
+        TreeGraphRepository(db),
+        TreeEventRepository(db),
+    )
+
+
+def get_export_service(db: AsyncSession = Depends(get_db)) -> ExportService:
+    return ExportService(
+        IndividualRepository(db),
+        BloodRelationRepository(db),
+        MarriageRepository(db),
+        TreeAccessRepository(db),
+    )
+
+
+def get_import_service(db: AsyncSession = Depends(get_db)) -> ImportService:
+    return ImportService(
+        IndividualRepository(db),
+        BloodRelationRepository(db),
+        MarriageRepository(db),
+        TreeAccessRepository(db),
+        TreeGraphRepository(db),
+        TreeEventRepository(db),
+    )
+
+
+def get_layout_service(db: AsyncSession = Depends(get_db)) -> LayoutService:
+    return LayoutService(
+        TreeGraphRepository(db), IndividualRepository(db), TreeAccessRepository(db)
+    )
+
+
+def get_relationship_service(
+    db: AsyncSession = Depends(get_db),
+) -> RelationshipService:
+    return RelationshipService(
+        TreeGraphRepository(db), IndividualRepository(db), TreeAccessRepository(db)
+    )
+
+
+def get_sync_service(db: AsyncSession = Depends(get_db)) -> SyncService:
+    return SyncService(
+        TreeRepository(db),
+        IndividualRepository(db),
+        BloodRelationRepository(db),
+        MarriageRepository(db),
+        TreeTombstoneRepository(db),
+        TreeAccessRepository(db),
+        timedelta(seconds=settings.app.changes_cursor_overlap),
+    )
+
+
+def get_duplicate_service(db: AsyncSession = Depends(get_db)) -> DuplicateService:
+    return DuplicateService(
+        DuplicateScanRepository(db), TreeAccessRepository(db), run_duplicate_scan
+    )
+
+
+def get_merge_service(db: AsyncSession = Depends(get_db)) -> MergeService:
+    return MergeService(
+        IndividualRepository(db),
+        BloodRelationRepository(db),
+        MarriageRepository(db),
+        TreeAccessRepository(db),
+        TreeGraphRepository(db),
+        TreeEventRepository(db),
+    )
+
+
+# Long-lived streams take a function-scoped session: it is committed and
+# released before the response body is sent, so they hold no connection.
+def get_tree_event_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> TreeEventService:
+    return TreeEventService(
+        TreeAccessRepository(db), tree_event_hub, settings.app.tree_events_heartbeat
     )
 
 
@@ -52,3 +174,44 @@ async def get_current_active_user(
     user_service: UserService = Depends(get_user_service),
 ) -> UserEntity:
     return await user_service.get_current_active_auth_user(token)
+
+
+async def get_current_active_user_for_stream(
+    token: str = Depends(oauth2_schema),
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> UserEntity:
+    """Like get_current_active_user, on the function-scoped session of streams."""
+    return await UserService(UserRepository(db)).get_current_active_auth_user(token)
+
+
+# Conditional requests
+async def check_tree_etag(
+    tree_id: UUID,
+    request: Request,
+    response: Response,
+    user: UserEntity = Depends(get_current_active_user),
+    service: TreeService = Depends(get_tree_service),
+) -> None:
+    """Tag a tree-scoped response with the tree version as a weak ETag.
+
+    Answers 304 without running the endpoint when `If-None-Match` already
+    holds the current version. The version is read before any data, so a
+    concurrent write can only make the tag older than the body, never newer.
+    """
+    version = await service.get_tree_version(user_id=user.id, tree_id=tree_id)
+    etag = f'W/"{version}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an `If-None-Match` header against an ETag."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque
+        for tag in (part.strip() for part in if_none_match.split(","))
+    )
@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import final
+from uuid import UUID
+
+from gtree.api.v1.schemas.base import BaseSchema
+from gtree.domain.entities._value_objects.job_status import JobStatus
+from gtree.domain.entities.trees.duplicate_scan import (
+    DuplicateScanEntity,
+    DuplicateSuggestionEntity,
+)
+
+
+@final
+class DuplicateSuggestionResponseSchema(BaseSchema):
+    """Merge `duplicate_id` into `individual_id`; scores are from 0 to 1."""
+
+    individual_id: UUID
+    duplicate_id: UUID
+    score: float
+    name_score: float
+    date_score: float | None
+    place_score: float | None
+
+    @classmethod
+    def from_entity(
+        cls, entity: DuplicateSuggestionEntity
+    ) -> "DuplicateSuggestionResponseSchema":
+        return DuplicateSuggestionResponseSchema(
+            individual_id=entity.individual_id,
+            duplicate_id=entity.duplicate_id,
+            score=entity.score,
+            name_score=entity.name_score,
+            date_score=entity.date_score,
+            place_score=entity.place_score,
+        )
+
+
+@final
+class DuplicateScanResponseSchema(BaseSchema):
+    id: UUID
+    tree_id: UUID
+    status: JobStatus
+    progress: float
+    processed_blocks: int
+    total_blocks: int
+    compared_pairs: int
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
+    suggestions: list[DuplicateSuggestionResponseSchema]
+
+    @classmethod
+    def from_entity(cls, entity: DuplicateScanEntity) -> "DuplicateScanResponseSchema":
+        return DuplicateScanResponseSchema(
+            id=entity.id,
+            tree_id=entity.tree_id,
+            status=entity.status,
+            progress=entity.progress,
+            processed_blocks=entity.processed_blocks,
+            total_blocks=entity.total_blocks,
+            compared_pairs=entity.compared_pairs,
+            error=entity.error,
+            created_at=entity.created_at,
+            finished_at=entity.finished_at,
+            suggestions=[
+                DuplicateSuggestionResponseSchema.from_entity(s)
+                for s in entity.suggestions
+            ],
+        )
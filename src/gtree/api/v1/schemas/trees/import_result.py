@@ -0,0 +1,24 @@
+from typing import final
+from uuid import UUID
+
+from gtree.api.v1.schemas.base import BaseSchema
+from gtree.domain.entities.trees.import_result import ImportResultEntity
+
+
+@final
+class ImportResultResponseSchema(BaseSchema):
+    tree_id: UUID
+    individuals: int
+    blood_relations: int
+    marriages: int
+    skipped: int
+
+    @classmethod
+    def from_entity(cls, entity: ImportResultEntity) -> "ImportResultResponseSchema":
+        return ImportResultResponseSchema(
+            tree_id=entity.tree_id,
+            individuals=entity.individuals,
+            blood_relations=entity.blood_relations,
+            marriages=entity.marriages,
+            skipped=entity.skipped,
+        )
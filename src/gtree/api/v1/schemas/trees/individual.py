@@ -5,6 +5,12 @@ from uuid import UUID
 from gtree.api.v1.schemas.base import BaseSchema
 from gtree.domain.entities._value_objects.gender import Gender
 from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.entities.trees.individual_match import IndividualMatchEntity
+from gtree.domain.entities.trees.individual_match_page import (
+    IndividualMatchPageEntity,
+)
+from gtree.domain.entities.trees.individual_merge import IndividualMergeEntity
+from gtree.domain.entities.trees.individual_page import IndividualPageEntity
 
 
 @final
@@ -23,6 +29,7 @@ class IndividualResponseSchema(BaseSchema):
     death_place: str | None
     bio: str | None
     avatar_url: str | None
+    inbreeding_coefficient: float | None
 
     @classmethod
     def from_entity(cls, entity: IndividualEntity) -> "IndividualResponseSchema":
@@ -41,9 +48,56 @@ class IndividualResponseSchema(BaseSchema):
             death_place=entity.death_place,
             bio=entity.bio,
             avatar_url=entity.avatar_url,
+            inbreeding_coefficient=entity.inbreeding_coefficient,
         )
 
 
+@final
+class IndividualPartialResponseSchema(BaseSchema):
+    """Individual restricted to the fields requested by a listing.
+
+    Fields that were not requested are unset and left out of the response.
+    """
+
+    id: UUID
+    tree_id: UUID | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    patronymic: str | None = None
+    gender: Gender | None = None
+    birth_date: date | None = None
+    birth_date_precision: str | None = None
+    death_date: date | None = None
+    death_date_precision: str | None = None
+    birth_place: str | None = None
+    death_place: str | None = None
+    bio: str | None = None
+    avatar_url: str | None = None
+    inbreeding_coefficient: float | None = None
+
+
+@final
+class IndividualPageResponseSchema(BaseSchema):
+    items: list[IndividualPartialResponseSchema]
+    next_cursor: str | None
+
+    @classmethod
+    def from_entity(
+        cls, entity: IndividualPageEntity
+    ) -> "IndividualPageResponseSchema":
+        return IndividualPageResponseSchema(
+            items=[IndividualPartialResponseSchema(**item) for item in entity.items],
+            next_cursor=entity.next_cursor,
+        )
+
+
+@final
+class IndividualRelatednessResponseSchema(BaseSchema):
+    individual_id: UUID
+    other_id: UUID
+    is_related: bool
+
+
 class IndividualCreateRequestSchema(BaseSchema):
     first_name: str
     last_name: str | None
@@ -72,3 +126,76 @@ class IndividualUpdateRequestSchema(BaseSchema):
     death_place: str | None = None
     bio: str | None = None
     avatar_url: str | None = None
+
+
+@final
+class IndividualMatchResponseSchema(BaseSchema):
+    individual: IndividualResponseSchema
+    score: float
+
+    @classmethod
+    def from_entity(
+        cls, entity: IndividualMatchEntity
+    ) -> "IndividualMatchResponseSchema":
+        return IndividualMatchResponseSchema(
+            individual=IndividualResponseSchema.from_entity(entity.individual),
+            score=entity.score,
+        )
+
+
+@final
+class IndividualTextMatchResponseSchema(BaseSchema):
+    individual: IndividualResponseSchema
+    score: float
+    highlights: dict[str, str]
+
+    @classmethod
+    def from_entity(
+        cls, entity: IndividualMatchEntity
+    ) -> "IndividualTextMatchResponseSchema":
+        return IndividualTextMatchResponseSchema(
+            individual=IndividualResponseSchema.from_entity(entity.individual),
+            score=entity.score,
+            highlights=entity.highlights,
+        )
+
+
+@final
+class IndividualTextSearchPageResponseSchema(BaseSchema):
+    items: list[IndividualTextMatchResponseSchema]
+    next_cursor: str | None
+
+    @classmethod
+    def from_entity(
+        cls, entity: IndividualMatchPageEntity
+    ) -> "IndividualTextSearchPageResponseSchema":
+        return IndividualTextSearchPageResponseSchema(
+            items=[
+                IndividualTextMatchResponseSchema.from_entity(item)
+                for item in entity.items
+            ],
+            next_cursor=entity.next_cursor,
+        )
+
+
+@final
+class IndividualMergeResponseSchema(BaseSchema):
+    individual: IndividualResponseSchema
+    merged_id: UUID
+    moved_blood_relations: int
+    deleted_blood_relations: int
+    moved_marriages: int
+    deleted_marriages: int
+
+    @classmethod
+    def from_entity(
+        cls, entity: IndividualMergeEntity
+    ) -> "IndividualMergeResponseSchema":
+        return IndividualMergeResponseSchema(
+            individual=IndividualResponseSchema.from_entity(entity.individual),
+            merged_id=entity.merged_id,
+            moved_blood_relations=entity.moved_blood_relations,
+            deleted_blood_relations=entity.deleted_blood_relations,
+            moved_marriages=entity.moved_marriages,
+            deleted_marriages=entity.deleted_marriages,
+        )
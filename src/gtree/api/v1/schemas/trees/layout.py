@@ -0,0 +1,121 @@
+from datetime import date
+from typing import final
+from uuid import UUID
+
+from gtree.api.v1.schemas.base import BaseSchema
+from gtree.domain.entities._value_objects.gender import Gender
+from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.entities.trees.layout import (
+    LayoutEntity,
+    TileClusterEntity,
+    TileEntity,
+)
+
+
+@final
+class LayoutResponseSchema(BaseSchema):
+    """Parallel coordinate arrays; marriages reference positions in `individual_ids`."""
+
+    individual_ids: list[UUID]
+    x: list[float]
+    y: list[int]
+    marriage_fathers: list[int]
+    marriage_mothers: list[int]
+    marriage_x: list[float]
+    marriage_y: list[float]
+    width: float
+    height: int
+
+    @classmethod
+    def from_entity(cls, entity: LayoutEntity) -> "LayoutResponseSchema":
+        return LayoutResponseSchema(
+            individual_ids=entity.individual_ids,
+            x=entity.x,
+            y=entity.y,
+            marriage_fathers=entity.marriage_fathers,
+            marriage_mothers=entity.marriage_mothers,
+            marriage_x=entity.marriage_x,
+            marriage_y=entity.marriage_y,
+            width=entity.width,
+            height=entity.height,
+        )
+
+
+@final
+class TileIndividualSchema(BaseSchema):
+    """Just enough of an individual to draw its card."""
+
+    id: UUID
+    first_name: str
+    last_name: str | None
+    patronymic: str | None
+    gender: Gender
+    birth_date: date | None
+    death_date: date | None
+    avatar_url: str | None
+    x: float
+    y: int
+
+    @classmethod
+    def from_entity(
+        cls, entity: IndividualEntity, x: float, y: int
+    ) -> "TileIndividualSchema":
+        return TileIndividualSchema(
+            id=entity.id,
+            first_name=entity.first_name,
+            last_name=entity.last_name,
+            patronymic=entity.patronymic,
+            gender=entity.gender,
+            birth_date=entity.birth_date,
+            death_date=entity.death_date,
+            avatar_url=entity.avatar_url,
+            x=x,
+            y=y,
+        )
+
+
+@final
+class TileClusterSchema(BaseSchema):
+    count: int
+    x: float
+    y: float
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+    @classmethod
+    def from_entity(cls, entity: TileClusterEntity) -> "TileClusterSchema":
+        return TileClusterSchema(
+            count=entity.count,
+            x=entity.x,
+            y=entity.y,
+            x0=entity.x0,
+            y0=entity.y0,
+            x1=entity.x1,
+            y1=entity.y1,
+        )
+
+
+@final
+class TileResponseSchema(BaseSchema):
+    """Visible individuals or clusters; edges reference positions in `individuals`."""
+
+    individuals: list[TileIndividualSchema]
+    blood_relations: list[tuple[int, int]]
+    marriages: list[tuple[int, int]]
+    clusters: list[TileClusterSchema]
+
+    @classmethod
+    def from_entity(cls, entity: TileEntity) -> "TileResponseSchema":
+        return TileResponseSchema(
+            individuals=[
+                TileIndividualSchema.from_entity(individual, x, y)
+                for individual, x, y in zip(
+                    entity.individuals, entity.x, entity.y, strict=True
+                )
+            ],
+            blood_relations=entity.blood_relations,
+            marriages=entity.marriages,
+            clusters=[TileClusterSchema.from_entity(c) for c in entity.clusters],
+        )
@@ -0,0 +1,29 @@
+from typing import final
+from uuid import UUID
+
+from gtree.api.v1.schemas.base import BaseSchema
+from gtree.api.v1.schemas.trees.blood_relation import BloodRelationResponseSchema
+from gtree.api.v1.schemas.trees.individual import IndividualResponseSchema
+from gtree.domain.entities.trees.lineage import LineageEntity
+
+
+@final
+class LineageResponseSchema(BaseSchema):
+    root_id: UUID
+    individuals: list[IndividualResponseSchema]
+    depths: dict[UUID, int]
+    blood_relations: list[BloodRelationResponseSchema]
+
+    @classmethod
+    def from_entity(cls, entity: LineageEntity) -> "LineageResponseSchema":
+        return LineageResponseSchema(
+            root_id=entity.root_id,
+            individuals=[
+                IndividualResponseSchema.from_entity(e) for e in entity.individuals
+            ],
+            depths=entity.depths,
+            blood_relations=[
+                BloodRelationResponseSchema.from_entity(e)
+                for e in entity.blood_relations
+            ],
+        )
@@ -0,0 +1,76 @@
+from typing import final
+from uuid import UUID
+
+from gtree.api.v1.schemas.base import BaseSchema
+from gtree.domain.entities.trees.relationship import (
+    InbreedingAnnotationEntity,
+    RelationshipCoefficientsEntity,
+    RelationshipEntity,
+)
+
+
+@final
+class RelationshipResponseSchema(BaseSchema):
+    individual_id: UUID
+    other_id: UUID
+    name: str | None
+    generations_up: int | None
+    generations_down: int | None
+    common_ancestor_ids: list[UUID]
+    is_half: bool
+    via_spouse_id: UUID | None
+
+    @classmethod
+    def from_entity(cls, entity: RelationshipEntity) -> "RelationshipResponseSchema":
+        return RelationshipResponseSchema(
+            individual_id=entity.individual_id,
+            other_id=entity.other_id,
+            name=entity.name,
+            generations_up=entity.generations_up,
+            generations_down=entity.generations_down,
+            common_ancestor_ids=entity.common_ancestor_ids,
+            is_half=entity.is_half,
+            via_spouse_id=entity.via_spouse_id,
+        )
+
+
+@final
+class RelationshipCoefficientsResponseSchema(BaseSchema):
+    individual_id: UUID
+    other_id: UUID
+    kinship: float
+    relationship: float
+    individual_inbreeding: float
+    other_inbreeding: float
+
+    @classmethod
+    def from_entity(
+        cls, entity: RelationshipCoefficientsEntity
+    ) -> "RelationshipCoefficientsResponseSchema":
+        return RelationshipCoefficientsResponseSchema(
+            individual_id=entity.individual_id,
+            other_id=entity.other_id,
+            kinship=entity.kinship,
+            relationship=entity.relationship,
+            individual_inbreeding=entity.individual_inbreeding,
+            other_inbreeding=entity.other_inbreeding,
+        )
+
+
+@final
+class InbreedingAnnotationResponseSchema(BaseSchema):
+    tree_id: UUID
+    annotated: int
+    inbred: int
+    max_inbreeding: float
+
+    @classmethod
+    def from_entity(
+        cls, entity: InbreedingAnnotationEntity
+    ) -> "InbreedingAnnotationResponseSchema":
+        return InbreedingAnnotationResponseSchema(
+            tree_id=entity.tree_id,
+            annotated=entity.annotated,
+            inbred=entity.inbred,
+            max_inbreeding=entity.max_inbreeding,
+        )
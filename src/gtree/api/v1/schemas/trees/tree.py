@@ -22,6 +22,7 @@ class TreeResponseSchema(BaseSchema):
     id: UUID
     name: str
     description: str | None = None
+    version: int
 
     @classmethod
     def from_entity(cls, entity: TreeEntity) -> "TreeResponseSchema":
@@ -29,4 +30,5 @@ class TreeResponseSchema(BaseSchema):
             id=entity.id,
             name=entity.name,
             description=entity.description,
+            version=entity.version,
         )
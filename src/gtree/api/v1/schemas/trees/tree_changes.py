@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import final
+from uuid import UUID
+
+from gtree.api.v1.schemas.base import BaseSchema
+from gtree.api.v1.schemas.trees.blood_relation import BloodRelationResponseSchema
+from gtree.api.v1.schemas.trees.individual import IndividualResponseSchema
+from gtree.api.v1.schemas.trees.marriage import MarriageResponseSchema
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities.trees.tree_changes import TombstoneEntity, TreeChangesEntity
+
+
+@final
+class TombstoneResponseSchema(BaseSchema):
+    """A deleted record, identified by its primary key columns in order."""
+
+    kind: RecordKind
+    key: list[UUID]
+    deleted_at: datetime
+
+    @classmethod
+    def from_entity(cls, entity: TombstoneEntity) -> "TombstoneResponseSchema":
+        return TombstoneResponseSchema(
+            kind=entity.kind,
+            key=list(entity.key),
+            deleted_at=entity.deleted_at,
+        )
+
+
+@final
+class TreeChangesResponseSchema(BaseSchema):
+    version: int
+    cursor: datetime
+    individuals: list[IndividualResponseSchema]
+    blood_relations: list[BloodRelationResponseSchema]
+    marriages: list[MarriageResponseSchema]
+    deleted: list[TombstoneResponseSchema]
+
+    @classmethod
+    def from_entity(cls, entity: TreeChangesEntity) -> "TreeChangesResponseSchema":
+        return TreeChangesResponseSchema(
+            version=entity.version,
+            cursor=entity.cursor,
+            individuals=[
+                IndividualResponseSchema.from_entity(i) for i in entity.individuals
+            ],
+            blood_relations=[
+                BloodRelationResponseSchema.from_entity(r)
+                for r in entity.blood_relations
+            ],
+            marriages=[MarriageResponseSchema.from_entity(m) for m in entity.marriages],
+            deleted=[TombstoneResponseSchema.from_entity(t) for t in entity.deleted],
+        )
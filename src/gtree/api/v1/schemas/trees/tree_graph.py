@@ -0,0 +1,22 @@
+from typing import final
+from uuid import UUID
+
+from gtree.api.v1.schemas.base import BaseSchema
+from gtree.domain.graph.tree_graph import TreeGraph
+
+
+@final
+class TreeGraphResponseSchema(BaseSchema):
+    """Compact tree graph: edges reference positions in `individual_ids`."""
+
+    individual_ids: list[UUID]
+    blood_relations: list[tuple[int, int]]
+    marriages: list[tuple[int, int]]
+
+    @classmethod
+    def from_graph(cls, graph: TreeGraph) -> "TreeGraphResponseSchema":
+        return TreeGraphResponseSchema(
+            individual_ids=graph.ids,
+            blood_relations=list(graph.blood_relations()),
+            marriages=list(graph.marriages()),
+        )
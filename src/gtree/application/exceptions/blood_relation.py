@@ -0,0 +1,11 @@
+from typing import final
+
+from gtree.application.exceptions.base import ApplicationException
+
+
+@final
+class BloodRelationCycleException(ApplicationException):
+    """Raised when a blood relation would make an individual their own ancestor."""
+
+    def __init__(self, message: str = "Blood relation would create a cycle"):
+        super().__init__(message, status_code=409)
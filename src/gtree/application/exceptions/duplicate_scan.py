@@ -0,0 +1,11 @@
+from typing import final
+
+from gtree.application.exceptions.base import ApplicationException
+
+
+@final
+class UnknownDuplicateScanForTreeException(ApplicationException):
+    """Raised when a duplicate scan is unknown for a tree."""
+
+    def __init__(self, message: str = "Unknown duplicate scan for tree"):
+        super().__init__(message, status_code=404)
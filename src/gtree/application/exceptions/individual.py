@@ -9,3 +9,30 @@ class UnknownIndividualForTreeException(ApplicationException):
 
     def __init__(self, message: str = "Unknown individual for tree"):
         super().__init__(message, status_code=403)
+
+
+@final
+class UnknownIndividualFieldException(ApplicationException):
+    """Raised when a projection names a field individuals do not have."""
+
+    def __init__(self, message: str = "Unknown individual field"):
+        super().__init__(message, status_code=400)
+
+
+@final
+class IndividualSelfMergeException(ApplicationException):
+    """Raised when an individual would be merged into itself."""
+
+    def __init__(self, message: str = "Cannot merge an individual into itself"):
+        super().__init__(message, status_code=400)
+
+
+@final
+class IndividualMergeCycleException(ApplicationException):
+    """Raised when a merge would make an individual their own ancestor."""
+
+    def __init__(
+        self,
+        message: str = "Cannot merge an individual with their ancestor or descendant",
+    ):
+        super().__init__(message, status_code=409)
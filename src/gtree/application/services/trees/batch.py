@@ -0,0 +1,16 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from gtree.domain.exceptions import DomainValidationException
+
+# Largest number of items accepted by a batch endpoint.
+MAX_BATCH_ITEMS = 5000
+
+
+@contextmanager
+def batch_item(index: int) -> Iterator[None]:
+    """Prefix validation errors raised for one item of a batch with its index."""
+    try:
+        yield
+    except DomainValidationException as e:
+        raise DomainValidationException(f"Item {index}: {e.message}") from e
@@ -4,11 +4,20 @@ from gtree.api.v1.schemas.trees.blood_relation import (
     BloodRelationCreateRequestSchema,
 )
 from gtree.application.authorization.tree_access import access_to_tree
+from gtree.application.exceptions.blood_relation import BloodRelationCycleException
 from gtree.application.exceptions.individual import UnknownIndividualForTreeException
+from gtree.application.services.trees.batch import batch_item
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.record_kind import RecordKind
 from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
-from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.entities.trees.blood_relation import BloodRelationEntity
+from gtree.infrastructure.db.repositories.trees.blood_relation import (
+    BloodRelationRepository,
+)
 from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
 from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_event import TreeEventRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
 
 
 class BloodRelationService:
@@ -17,10 +26,14 @@ class BloodRelationService:
         blood_relation_repository: BloodRelationRepository,
         individual_repository: IndividualRepository,
         tree_access_repository: TreeAccessRepository,
+        tree_graph_repository: TreeGraphRepository,
+        tree_event_repository: TreeEventRepository,
     ):
         self.blood_relation_repository = blood_relation_repository
         self.individual_repository = individual_repository
         self.tree_access_repository = tree_access_repository
+        self.tree_graph_repository = tree_graph_repository
+        self.tree_event_repository = tree_event_repository
 
     @access_to_tree(TreeAccessLevel.VIEWER)
     async def get_blood_relations_for_tree(
@@ -38,55 +51,102 @@ class BloodRelationService:
         parent_id: UUID,
         child_id: UUID,
     ) -> BloodRelationEntity:
-        parent = await self.individual_repository.get_by_id(parent_id)
-        if parent.tree_id != tree_id:
-            raise UnknownIndividualForTreeException
-        child = await self.individual_repository.get_by_id(child_id)
-        if child.tree_id != tree_id:
-            raise UnknownIndividualForTreeException
-
+        await self._check_individuals_in_tree(tree_id, parent_id, child_id)
         return await self.blood_relation_repository.get_by_id(parent_id, child_id)
 
     @access_to_tree(TreeAccessLevel.EDITOR)
-    async def create_individual(
+    async def create_blood_relation(
         self,
         user_id: UUID,  # noqa: ARG002
         tree_id: UUID,
-        parent_id: UUID,
-        child_id: UUID,
-    ) -> IndividualEntity:
-        parent = await self.individual_repository.get_by_id(parent_id)
-        if parent.tree_id != tree_id:
-            raise UnknownIndividualForTreeException
-        child = await self.individual_repository.get_by_id(child_id)
-        if child.tree_id != tree_id:
+        # TODO: Remove schema from service
+        blood_relation_schema: BloodRelationCreateRequestSchema,
+    ) -> BloodRelationEntity:
+        blood_relation = BloodRelationEntity.create_blood_relation(
+            **blood_relation_schema.model_dump()
+        )
+        graph = await self.tree_graph_repository.load(tree_id)
+        if (
+            blood_relation.parent_id not in graph
+            or blood_relation.child_id not in graph
+        ):
             raise UnknownIndividualForTreeException
+        if graph.is_ancestor(
+            graph.index_of(blood_relation.child_id),
+            graph.index_of(blood_relation.parent_id),
+        ):
+            raise BloodRelationCycleException
 
-        return await self.individual_repository.create(individual)
+        created = await self.blood_relation_repository.create(blood_relation)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id,
+            RecordKind.BLOOD_RELATION,
+            ChangeAction.CREATED,
+            (created.parent_id, created.child_id),
+        )
+        return created
 
     @access_to_tree(TreeAccessLevel.EDITOR)
-    async def update_individual(
+    async def create_blood_relations(
         self,
         user_id: UUID,  # noqa: ARG002
         tree_id: UUID,
-        individual_id: UUID,
         # TODO: Remove schema from service
-        individual_schema: IndividualUpdateRequestSchema,
-    ) -> IndividualEntity:
-        individual = await self.individual_repository.get_by_id(individual_id)
-        if individual.tree_id != tree_id:
+        blood_relation_schemas: list[BloodRelationCreateRequestSchema],
+    ) -> list[BloodRelationEntity]:
+        """Create many blood relations at once, all or nothing.
+
+        Membership and cycles are checked against the tree graph in one pass,
+        and the relations are written with one multi-row INSERT.
+        """
+        blood_relations: dict[tuple[UUID, UUID], BloodRelationEntity] = {}
+        for index, schema in enumerate(blood_relation_schemas):
+            with batch_item(index):
+                relation = BloodRelationEntity.create_blood_relation(
+                    **schema.model_dump()
+                )
+            blood_relations[(relation.parent_id, relation.child_id)] = relation
+
+        graph = await self.tree_graph_repository.load(tree_id)
+        if any(
+            parent_id not in graph or child_id not in graph
+            for parent_id, child_id in blood_relations
+        ):
             raise UnknownIndividualForTreeException
-        individual.update_individual(**individual_schema.model_dump())
-        return await self.individual_repository.update(individual)
+        if graph.would_create_cycle(
+            (graph.index_of(parent_id), graph.index_of(child_id))
+            for parent_id, child_id in blood_relations
+        ):
+            raise BloodRelationCycleException
+
+        created = list(blood_relations.values())
+        await self.blood_relation_repository.create_many(created, skip_existing=False)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.BLOOD_RELATION, ChangeAction.CREATED
+        )
+        return created
 
     @access_to_tree(TreeAccessLevel.EDITOR)
-    async def delete_individual(
+    async def delete_blood_relation(
         self,
         user_id: UUID,  # noqa: ARG002
         tree_id: UUID,
-        individual_id: UUID,
+        parent_id: UUID,
+        child_id: UUID,
     ) -> None:
-        individual = await self.individual_repository.get_by_id(individual_id)
-        if individual.tree_id != tree_id:
+        await self._check_individuals_in_tree(tree_id, parent_id, child_id)
+        await self.blood_relation_repository.delete(parent_id, child_id)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id,
+            RecordKind.BLOOD_RELATION,
+            ChangeAction.DELETED,
+            (parent_id, child_id),
+        )
+
+    async def _check_individuals_in_tree(self, tree_id: UUID, *ids: UUID) -> None:
+        found = await self.individual_repository.get_ids_in_tree(tree_id, set(ids))
+        if len(found) != len(set(ids)):
             raise UnknownIndividualForTreeException
-        return await self.individual_repository.delete(individual_id)
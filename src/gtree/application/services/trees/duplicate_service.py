@@ -0,0 +1,77 @@
+from collections.abc import Callable, Coroutine
+from datetime import timedelta
+from functools import partial
+from typing import Any
+from uuid import UUID
+
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.application.exceptions.duplicate_scan import (
+    UnknownDuplicateScanForTreeException,
+)
+from gtree.domain.entities._value_objects.job_status import JobStatus
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.trees.duplicate_scan import DuplicateScanEntity
+from gtree.domain.funcs.time import get_current_time
+from gtree.infrastructure.db.exceptions import NotFoundException
+from gtree.infrastructure.db.repositories.trees.duplicate_scan import (
+    DuplicateScanRepository,
+)
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+
+# A running scan reports progress every few seconds; one that has not been
+# updated for this long was interrupted and no longer blocks a new scan.
+_STALE_SCAN_AFTER = timedelta(minutes=10)
+
+
+class DuplicateService:
+    def __init__(
+        self,
+        duplicate_scan_repository: DuplicateScanRepository,
+        tree_access_repository: TreeAccessRepository,
+        run_scan: Callable[[UUID], Coroutine[Any, Any, None]],
+    ):
+        self.duplicate_scan_repository = duplicate_scan_repository
+        self.tree_access_repository = tree_access_repository
+        self.run_scan = run_scan
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def start_scan(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+    ) -> DuplicateScanEntity:
+        """Start a background search for duplicates in a tree.
+
+        Returns the scan already running for the tree, if there is one.
+        """
+        active = await self.duplicate_scan_repository.get_active(
+            tree_id, get_current_time() - _STALE_SCAN_AFTER
+        )
+        if active is not None:
+            return active
+        scan = await self.duplicate_scan_repository.create(
+            DuplicateScanEntity.create_scan(tree_id)
+        )
+        self.duplicate_scan_repository.run_after_commit(partial(self.run_scan, scan.id))
+        return scan
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_scan(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        scan_id: UUID,
+        limit: int,
+    ) -> DuplicateScanEntity:
+        """A scan with its best `limit` suggestions once it has completed."""
+        try:
+            scan = await self.duplicate_scan_repository.get_by_id(scan_id)
+        except NotFoundException as e:
+            raise UnknownDuplicateScanForTreeException from e
+        if scan.tree_id != tree_id:
+            raise UnknownDuplicateScanForTreeException
+        if scan.status == JobStatus.COMPLETED:
+            scan.suggestions = await self.duplicate_scan_repository.get_suggestions(
+                scan_id, limit
+            )
+        return scan
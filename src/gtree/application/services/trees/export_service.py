@@ -0,0 +1,235 @@
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import fields
+from enum import StrEnum, auto
+import json
+from uuid import UUID
+
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.domain.entities._value_objects.gender import Gender
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.base import BaseEntity
+from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.entities.trees.marriage import MarriageEntity
+from gtree.infrastructure.db.repositories.trees.blood_relation import (
+    BloodRelationRepository,
+)
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.repositories.trees.marriage import MarriageRepository
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.utils.gedcom import format_date, format_line
+
+# Output is sent in chunks of roughly this many characters.
+_CHUNK_SIZE = 64 * 1024
+_SEXES = {Gender.MALE: "M", Gender.FEMALE: "F"}
+
+# A family is keyed by (husband, wife) GEDCOM xref numbers, 0 if unknown.
+_FamilyKey = tuple[int, int]
+
+
+class ExportFormat(StrEnum):
+    GEDCOM = auto()
+    NDJSON = auto()
+
+
+class ExportService:
+    def __init__(
+        self,
+        individual_repository: IndividualRepository,
+        blood_relation_repository: BloodRelationRepository,
+        marriage_repository: MarriageRepository,
+        tree_access_repository: TreeAccessRepository,
+    ):
+        self.individual_repository = individual_repository
+        self.blood_relation_repository = blood_relation_repository
+        self.marriage_repository = marriage_repository
+        self.tree_access_repository = tree_access_repository
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def export_tree(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        export_format: ExportFormat,
+    ) -> AsyncIterator[str]:
+        """Check access and return a lazy stream of the exported tree.
+
+        Rows are read from server-side cursors while the stream is consumed,
+        so the session must stay open until it is exhausted.
+        """
+        if export_format == ExportFormat.GEDCOM:
+            return _chunked(self._export_gedcom(tree_id))
+        return _chunked(self._export_ndjson(tree_id))
+
+    async def _export_ndjson(self, tree_id: UUID) -> AsyncIterator[str]:
+        """One JSON object per line: individuals, then blood relations, marriages."""
+        async for individual in self.individual_repository.stream_by_tree_id(tree_id):
+            yield _json_line("individual", _entity_fields(individual))
+        repository = self.blood_relation_repository
+        async for relation in repository.stream_by_tree_id(tree_id):
+            yield _json_line(
+                "blood_relation",
+                {"parent_id": relation.parent_id, "child_id": relation.child_id},
+            )
+        async for marriage in self.marriage_repository.stream_by_tree_id(tree_id):
+            yield _json_line("marriage", _entity_fields(marriage))
+
+    async def _export_gedcom(self, tree_id: UUID) -> AsyncIterator[str]:
+        """GEDCOM 5.5.1: INDI records, then FAM records built from the links.
+
+        Only compact ids are kept in memory: the xref number and gender of
+        each individual, and the xref numbers that make up each family.
+        """
+        for line in _gedcom_header():
+            yield line
+
+        xrefs: dict[UUID, int] = {}
+        genders: dict[int, Gender] = {}
+        async for individual in self.individual_repository.stream_by_tree_id(tree_id):
+            number = xrefs[individual.id] = len(xrefs) + 1
+            genders[number] = individual.gender
+            for line in _gedcom_individual(number, individual):
+                yield line
+
+        families: dict[_FamilyKey, list[int]] = {}
+        child, parents = None, []
+        repository = self.blood_relation_repository
+        async for relation in repository.stream_by_tree_id(tree_id):
+            if relation.child_id != child:
+                _add_child(families, genders, xrefs.get(child), parents)
+                child, parents = relation.child_id, []
+            if relation.parent_id in xrefs:
+                parents.append(xrefs[relation.parent_id])
+        _add_child(families, genders, xrefs.get(child), parents)
+
+        marriages: dict[_FamilyKey, MarriageEntity] = {}
+        async for marriage in self.marriage_repository.stream_by_tree_id(tree_id):
+            father, mother = (
+                xrefs.get(marriage.father_id),
+                xrefs.get(marriage.mother_id),
+            )
+            if father is None or mother is None:
+                continue
+            key = (mother, father) if (mother, father) in families else (father, mother)
+            families.setdefault(key, [])
+            marriages[key] = marriage
+
+        for number, (key, children) in enumerate(families.items(), start=1):
+            for line in _gedcom_family(number, key, children, marriages.get(key)):
+                yield line
+        yield "0 TRLR\n"
+
+
+def _add_child(
+    families: dict[_FamilyKey, list[int]],
+    genders: dict[int, Gender],
+    child: int | None,
+    parents: list[int],
+) -> None:
+    """Put a child into the family of its (first two) parents, husband first."""
+    if child is None or not parents:
+        return
+    parents = sorted(parents[:2], key=lambda p: genders[p] == Gender.FEMALE)
+    if len(parents) == 2:
+        key = (parents[0], parents[1])
+    elif genders[parents[0]] == Gender.FEMALE:
+        key = (0, parents[0])
+    else:
+        key = (parents[0], 0)
+    families.setdefault(key, []).append(child)
+
+
+def _gedcom_header() -> Iterator[str]:
+    yield "0 HEAD\n"
+    yield "1 SOUR GTREE\n"
+    yield "1 GEDC\n"
+    yield "2 VERS 5.5.1\n"
+    yield "2 FORM LINEAGE-LINKED\n"
+    yield "1 CHAR UTF-8\n"
+
+
+def _gedcom_individual(number: int, individual: IndividualEntity) -> Iterator[str]:
+    given = " ".join(filter(None, (individual.first_name, individual.patronymic)))
+    surname = individual.last_name or ""
+    yield from format_line(0, "INDI", xref=f"@I{number}@")
+    yield from format_line(1, "NAME", f"{given} /{surname}/")
+    yield from format_line(2, "GIVN", given)
+    if surname:
+        yield from format_line(2, "SURN", surname)
+    yield from format_line(1, "SEX", _SEXES.get(individual.gender, "U"))
+    for tag, event_date, precision, place in (
+        (
+            "BIRT",
+            individual.birth_date,
+            individual.birth_date_precision,
+            individual.birth_place,
+        ),
+        (
+            "DEAT",
+            individual.death_date,
+            individual.death_date_precision,
+            individual.death_place,
+        ),
+    ):
+        if event_date is None and place is None:
+            continue
+        yield from format_line(1, tag)
+        if event_date is not None:
+            yield from format_line(2, "DATE", format_date(event_date, precision))
+        if place:
+            yield from format_line(2, "PLAC", place)
+    if individual.bio:
+        yield from format_line(1, "NOTE", individual.bio)
+    if individual.avatar_url:
+        yield from format_line(1, "OBJE")
+        yield from format_line(2, "FILE", individual.avatar_url)
+
+
+def _gedcom_family(
+    number: int,
+    key: _FamilyKey,
+    children: list[int],
+    marriage: MarriageEntity | None,
+) -> Iterator[str]:
+    husband, wife = key
+    yield from format_line(0, "FAM", xref=f"@F{number}@")
+    if husband:
+        yield from format_line(1, "HUSB", f"@I{husband}@")
+    if wife:
+        yield from format_line(1, "WIFE", f"@I{wife}@")
+    for child in children:
+        yield from format_line(1, "CHIL", f"@I{child}@")
+    if marriage is None:
+        return
+    yield from format_line(1, "MARR")
+    if marriage.start_date is not None:
+        yield from format_line(2, "DATE", format_date(marriage.start_date, None))
+    if marriage.marriage_place:
+        yield from format_line(2, "PLAC", marriage.marriage_place)
+    if marriage.end_date is not None:
+        yield from format_line(1, "DIV")
+        yield from format_line(2, "DATE", format_date(marriage.end_date, None))
+    if marriage.notes:
+        yield from format_line(1, "NOTE", marriage.notes)
+
+
+def _entity_fields(entity: BaseEntity) -> dict[str, object]:
+    """Data fields of an entity, without bookkeeping such as the dirty set."""
+    return {f.name: getattr(entity, f.name) for f in fields(entity) if f.init}
+
+
+def _json_line(kind: str, data: dict) -> str:
+    return json.dumps({"type": kind, **data}, default=str, ensure_ascii=False) + "\n"
+
+
+async def _chunked(lines: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Join small lines into larger chunks to cut per-write overhead."""
+    buffer: list[str] = []
+    size = 0
+    async for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= _CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
@@ -0,0 +1,273 @@
+from collections.abc import AsyncIterable
+import re
+from uuid import UUID
+
+import structlog
+
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.gender import Gender
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.trees.blood_relation import BloodRelationEntity
+from gtree.domain.entities.trees.import_result import ImportResultEntity
+from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.entities.trees.marriage import MarriageEntity
+from gtree.domain.exceptions import DomainValidationException
+from gtree.infrastructure.db.repositories.trees.blood_relation import (
+    BloodRelationRepository,
+)
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.repositories.trees.marriage import MarriageRepository
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_event import TreeEventRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
+from gtree.infrastructure.utils.gedcom import (
+    GedcomNode,
+    parse_date,
+    parse_records_async,
+)
+
+logger = structlog.get_logger(__name__)
+
+_INDIVIDUAL_BATCH_SIZE = 1000
+_RELATION_BATCH_SIZE = 5000
+_NAME_LENGTH = 100
+_SEXES = {"M": Gender.MALE, "F": Gender.FEMALE}
+_PATRONYMIC = re.compile(r"(ович|евич|ич|овна|евна|ична|ovich|evich|ovna|evna|ichna)$")
+
+# Pending links reference individuals by GEDCOM xref until they are resolved.
+_Link = tuple[str, str]
+
+
+class ImportService:
+    def __init__(
+        self,
+        individual_repository: IndividualRepository,
+        blood_relation_repository: BloodRelationRepository,
+        marriage_repository: MarriageRepository,
+        tree_access_repository: TreeAccessRepository,
+        tree_graph_repository: TreeGraphRepository,
+        tree_event_repository: TreeEventRepository,
+    ):
+        self.individual_repository = individual_repository
+        self.blood_relation_repository = blood_relation_repository
+        self.marriage_repository = marriage_repository
+        self.tree_access_repository = tree_access_repository
+        self.tree_graph_repository = tree_graph_repository
+        self.tree_event_repository = tree_event_repository
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def import_gedcom(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        lines: AsyncIterable[str],
+    ) -> ImportResultEntity:
+        """Import INDI and FAM records of a GEDCOM stream into a tree.
+
+        Records are consumed one at a time and written in multi-row batches.
+        Only the xref -> id map grows with the file. Links to individuals that
+        appear later in the file are kept until the end of the stream.
+        """
+        state = _GedcomImport(self, tree_id)
+        async for record in parse_records_async(lines):
+            if record.tag == "INDI" and record.xref:
+                await state.add_individual(record)
+            elif record.tag == "FAM":
+                await state.add_family(record)
+        result = await state.finish()
+
+        self.tree_graph_repository.invalidate(tree_id)
+        for kind, created in (
+            (RecordKind.INDIVIDUAL, result.individuals),
+            (RecordKind.BLOOD_RELATION, result.blood_relations),
+            (RecordKind.MARRIAGE, result.marriages),
+        ):
+            if created:
+                await self.tree_event_repository.publish(
+                    tree_id, kind, ChangeAction.CREATED
+                )
+        logger.info(
+            "GEDCOM imported",
+            tree_id=str(tree_id),
+            individuals=result.individuals,
+            blood_relations=result.blood_relations,
+            marriages=result.marriages,
+            skipped=result.skipped,
+        )
+        return result
+
+
+class _GedcomImport:
+    """Buffers of a single import run."""
+
+    def __init__(self, service: ImportService, tree_id: UUID):
+        self.service = service
+        self.tree_id = tree_id
+        self.result = ImportResultEntity(tree_id=tree_id)
+        self.xrefs: dict[str, UUID] = {}
+        self.individuals: list[IndividualEntity] = []
+        self.blood_relations: list[_Link] = []
+        self.marriages: list[tuple[_Link, GedcomNode]] = []
+        # Links left unresolved by the last flush. They do not count towards
+        # the next batch, so forward references cannot cause a flush per family.
+        self.unresolved = 0
+
+    async def add_individual(self, record: GedcomNode) -> None:
+        try:
+            individual = _individual_from_record(self.tree_id, record)
+        except DomainValidationException:
+            self.result.skipped += 1
+            return
+        self.xrefs[record.xref] = individual.id
+        self.individuals.append(individual)
+        if len(self.individuals) >= _INDIVIDUAL_BATCH_SIZE:
+            await self._flush_individuals()
+
+    async def add_family(self, record: GedcomNode) -> None:
+        husband, wife = record.value_of("HUSB"), record.value_of("WIFE")
+        for child in record.all("CHIL"):
+            for parent in (husband, wife):
+                if parent and child.value:
+                    self.blood_relations.append((parent, child.value))
+        if husband and wife:
+            # Keep only what the marriage row needs, not the whole record.
+            details = GedcomNode(
+                "FAM",
+                children=[
+                    n for n in record.children if n.tag in ("MARR", "DIV", "NOTE")
+                ],
+            )
+            self.marriages.append(((husband, wife), details))
+        links = len(self.blood_relations) + len(self.marriages)
+        if links - self.unresolved >= _RELATION_BATCH_SIZE:
+            await self._flush_links(final=False)
+
+    async def finish(self) -> ImportResultEntity:
+        await self._flush_links(final=True)
+        return self.result
+
+    async def _flush_individuals(self) -> None:
+        self.result.individuals += await self.service.individual_repository.create_many(
+            self.individuals
+        )
+        self.individuals = []
+
+    async def _flush_links(self, *, final: bool) -> None:
+        """Write links whose individuals are known; on `final`, drop the rest."""
+        await self._flush_individuals()
+
+        relations: list[BloodRelationEntity] = []
+        pending_relations: list[_Link] = []
+        for link in self.blood_relations:
+            ids = self._resolve(link)
+            if ids is None:
+                pending_relations.append(link)
+            elif ids[0] != ids[1]:
+                relations.append(BloodRelationEntity.create_blood_relation(*ids))
+            else:
+                self.result.skipped += 1
+
+        marriages: list[MarriageEntity] = []
+        pending_marriages: list[tuple[_Link, GedcomNode]] = []
+        for link, details in self.marriages:
+            ids = self._resolve(link)
+            if ids is None:
+                pending_marriages.append((link, details))
+                continue
+            try:
+                marriages.append(_marriage_from_record(*ids, details))
+            except DomainValidationException:
+                self.result.skipped += 1
+
+        repositories = self.service
+        self.result.blood_relations += (
+            await repositories.blood_relation_repository.create_many(relations)
+        )
+        self.result.marriages += await repositories.marriage_repository.create_many(
+            marriages
+        )
+        if final:
+            self.result.skipped += len(pending_relations) + len(pending_marriages)
+            pending_relations, pending_marriages = [], []
+        self.blood_relations = pending_relations
+        self.marriages = pending_marriages
+        self.unresolved = len(pending_relations) + len(pending_marriages)
+
+    def _resolve(self, link: _Link) -> tuple[UUID, UUID] | None:
+        first, second = self.xrefs.get(link[0]), self.xrefs.get(link[1])
+        if first is None or second is None:
+            return None
+        return first, second
+
+
+def _individual_from_record(tree_id: UUID, record: GedcomNode) -> IndividualEntity:
+    given, surname, patronymic = _split_name(record)
+    birth = record.first("BIRT") or record.first("CHR") or record.first("BAPM")
+    death = record.first("DEAT") or record.first("BURI")
+    birth_date, birth_precision = parse_date(birth.value_of("DATE") if birth else None)
+    death_date, death_precision = parse_date(death.value_of("DATE") if death else None)
+    if birth_date and death_date and birth_date > death_date:
+        death_date, death_precision = None, None
+    note = record.value_of("NOTE")
+    avatar_url = record.value_of("OBJE", "FILE")
+
+    return IndividualEntity.create_individual(
+        tree_id=tree_id,
+        first_name=given or "Unknown",
+        last_name=surname,
+        patronymic=patronymic,
+        gender=_SEXES.get((record.value_of("SEX") or "").upper(), Gender.OTHER),
+        birth_date=birth_date,
+        birth_date_precision=birth_precision,
+        death_date=death_date,
+        death_date_precision=death_precision,
+        birth_place=birth.value_of("PLAC") if birth else None,
+        death_place=death.value_of("PLAC") if death else None,
+        bio=note if note and not note.startswith("@") else None,
+        avatar_url=(
+            avatar_url
+            if avatar_url and avatar_url.startswith(("http://", "https://"))
+            else None
+        ),
+    )
+
+
+def _split_name(record: GedcomNode) -> tuple[str | None, str | None, str | None]:
+    """Return (given names, surname, patronymic) of an INDI record."""
+    name = record.first("NAME")
+    if name is None:
+        return None, None, None
+    given, _, rest = name.value.partition("/")
+    surname = rest.partition("/")[0].strip() or None
+    given = name.value_of("GIVN") or given.strip()
+    surname = name.value_of("SURN") or surname
+
+    parts = given.split()
+    patronymic = None
+    if len(parts) >= 2 and _PATRONYMIC.search(parts[-1].lower()):
+        patronymic = parts.pop()
+    return (
+        " ".join(parts)[:_NAME_LENGTH] or None,
+        surname[:_NAME_LENGTH] if surname else None,
+        patronymic[:_NAME_LENGTH] if patronymic else None,
+    )
+
+
+def _marriage_from_record(
+    father_id: UUID, mother_id: UUID, details: GedcomNode
+) -> MarriageEntity:
+    start_date, _ = parse_date(details.value_of("MARR", "DATE"))
+    end_date, _ = parse_date(details.value_of("DIV", "DATE"))
+    if start_date and end_date and start_date > end_date:
+        end_date = None
+    note = details.value_of("NOTE")
+    return MarriageEntity.create_marriage(
+        father_id=father_id,
+        mother_id=mother_id,
+        start_date=start_date,
+        end_date=end_date,
+        marriage_place=details.value_of("MARR", "PLAC"),
+        notes=note if note and not note.startswith("@") else None,
+    )
@@ -1,3 +1,4 @@
+from datetime import date
 from uuid import UUID
 
 from gtree.api.v1.schemas.trees.individual import (
@@ -5,11 +6,57 @@ from gtree.api.v1.schemas.trees.individual import (
     IndividualUpdateRequestSchema,
 )
 from gtree.application.authorization.tree_access import access_to_tree
-from gtree.application.exceptions.individual import UnknownIndividualForTreeException
+from gtree.application.exceptions.individual import (
+    UnknownIndividualFieldException,
+    UnknownIndividualForTreeException,
+)
+from gtree.application.services.trees.batch import batch_item
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.individual_order import IndividualOrder
+from gtree.domain.entities._value_objects.name_search_mode import NameSearchMode
+from gtree.domain.entities._value_objects.record_kind import RecordKind
 from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
 from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.entities.trees.individual_match import IndividualMatchEntity
+from gtree.domain.entities.trees.individual_match_page import (
+    IndividualMatchPageEntity,
+)
+from gtree.domain.entities.trees.individual_page import IndividualPageEntity
+from gtree.domain.entities.trees.lineage import LineageEntity
+from gtree.domain.exceptions import DomainValidationException
+from gtree.domain.graph.tree_graph import TreeGraph
+from gtree.infrastructure.db.repositories.trees.ancestry_closure import (
+    AncestryClosureRepository,
+)
 from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
 from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_event import TreeEventRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
+from gtree.infrastructure.utils.cursor import decode_cursor, encode_cursor
+from gtree.infrastructure.utils.phonetics import query_codes
+
+# Fields a listing may project to. `id` is always returned.
+INDIVIDUAL_FIELDS = (
+    "id",
+    "tree_id",
+    "first_name",
+    "last_name",
+    "patronymic",
+    "gender",
+    "birth_date",
+    "birth_date_precision",
+    "death_date",
+    "death_date_precision",
+    "birth_place",
+    "death_place",
+    "bio",
+    "avatar_url",
+    "inbreeding_coefficient",
+)
+
+# Cursors of full-text search results are tagged with this instead of an
+# IndividualOrder.
+_TEXT_SEARCH_CURSOR = "text"
 
 
 class IndividualService:
@@ -17,17 +64,132 @@ class IndividualService:
         self,
         individual_repository: IndividualRepository,
         tree_access_repository: TreeAccessRepository,
+        tree_graph_repository: TreeGraphRepository,
+        tree_event_repository: TreeEventRepository,
+        ancestry_closure_repository: AncestryClosureRepository | None = None,
     ):
         self.tree_access_repository = tree_access_repository
         self.individual_repository = individual_repository
+        self.tree_graph_repository = tree_graph_repository
+        self.tree_event_repository = tree_event_repository
+        self.ancestry_closure_repository = ancestry_closure_repository
 
     @access_to_tree(TreeAccessLevel.VIEWER)
     async def get_individuals_for_tree(
         self,
         user_id: UUID,  # noqa: ARG002
         tree_id: UUID,
-    ) -> list[IndividualEntity]:
-        return await self.individual_repository.get_by_tree_id(tree_id)
+        limit: int,
+        cursor: str | None = None,
+        order: IndividualOrder = IndividualOrder.NAME,
+        fields: list[str] | None = None,
+        born_from: date | None = None,
+        born_to: date | None = None,
+        alive_in: int | None = None,
+        died_before: date | None = None,
+    ) -> IndividualPageEntity:
+        """Return a page of individuals, keyset-paginated by `order`.
+
+        `fields` restricts the selected columns; None selects all of them.
+        The date filters keep individuals who may have been born between
+        `born_from` and `born_to`, alive in year `alive_in` or died before
+        `died_before`, given the precision of their dates.
+        """
+        if born_from is not None and born_to is not None and born_from > born_to:
+            raise DomainValidationException("born_from must not be after born_to")
+        if fields is None:
+            fields = list(INDIVIDUAL_FIELDS)
+        else:
+            unknown = set(fields).difference(INDIVIDUAL_FIELDS)
+            if unknown:
+                raise UnknownIndividualFieldException(
+                    f"Unknown individual fields: {', '.join(sorted(unknown))}"
+                )
+            fields = ["id", *dict.fromkeys(f for f in fields if f != "id")]
+
+        items, last_key = await self.individual_repository.get_page(
+            tree_id,
+            fields=fields,
+            order=order,
+            after=decode_cursor(order, cursor) if cursor else None,
+            limit=limit,
+            born_between=(
+                (born_from, born_to)
+                if born_from is not None or born_to is not None
+                else None
+            ),
+            alive_in=alive_in,
+            died_before=died_before,
+        )
+        return IndividualPageEntity(
+            items=items,
+            next_cursor=encode_cursor(order, last_key) if last_key else None,
+        )
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def search_individuals(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        query: str,
+        limit: int,
+        mode: NameSearchMode = NameSearchMode.FUZZY,
+    ) -> list[IndividualMatchEntity]:
+        """Search over first name, patronymic and last name, best first."""
+        query = " ".join(query.lower().split())
+        if not query:
+            return []
+        if mode == NameSearchMode.PHONETIC:
+            codes = query_codes(query)
+            if not codes:
+                return []
+            matches = await self.individual_repository.search_by_name_codes(
+                tree_id, query, codes, limit
+            )
+        else:
+            matches = await self.individual_repository.search_by_name(
+                tree_id, query, limit
+            )
+        return [
+            IndividualMatchEntity(individual=individual, score=score)
+            for individual, score in matches
+        ]
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def search_individuals_text(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> IndividualMatchPageEntity:
+        """Full-text search over places and biographies, best first."""
+        matches, last_key = await self.individual_repository.search_by_text(
+            tree_id,
+            query,
+            after=decode_cursor(_TEXT_SEARCH_CURSOR, cursor) if cursor else None,
+            limit=limit,
+        )
+        return IndividualMatchPageEntity(
+            items=[
+                IndividualMatchEntity(
+                    individual=individual, score=score, highlights=highlights
+                )
+                for individual, score, highlights in matches
+            ],
+            next_cursor=(
+                encode_cursor(_TEXT_SEARCH_CURSOR, last_key) if last_key else None
+            ),
+        )
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_tree_graph(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+    ) -> TreeGraph:
+        return await self.tree_graph_repository.load(tree_id)
 
     @access_to_tree(TreeAccessLevel.VIEWER)
     async def get_individual_by_id(
@@ -41,6 +203,65 @@ class IndividualService:
             raise UnknownIndividualForTreeException
         return individual
 
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_ancestors(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        individual_id: UUID,
+        depth: int,
+    ) -> LineageEntity:
+        individual = await self.individual_repository.get_by_id(individual_id)
+        if individual.tree_id != tree_id:
+            raise UnknownIndividualForTreeException
+        if self.ancestry_closure_repository is not None:
+            return await self.ancestry_closure_repository.get_ancestors(
+                individual_id, depth
+            )
+        return await self.individual_repository.get_ancestors(individual_id, depth)
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_descendants(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        individual_id: UUID,
+        depth: int,
+    ) -> LineageEntity:
+        individual = await self.individual_repository.get_by_id(individual_id)
+        if individual.tree_id != tree_id:
+            raise UnknownIndividualForTreeException
+        if self.ancestry_closure_repository is not None:
+            return await self.ancestry_closure_repository.get_descendants(
+                individual_id, depth
+            )
+        return await self.individual_repository.get_descendants(individual_id, depth)
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def is_related(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        individual_id: UUID,
+        other_id: UUID,
+    ) -> bool:
+        """Check whether two individuals are blood relatives."""
+        if self.ancestry_closure_repository is not None:
+            for checked_id in (individual_id, other_id):
+                individual = await self.individual_repository.get_by_id(checked_id)
+                if individual.tree_id != tree_id:
+                    raise UnknownIndividualForTreeException
+            return await self.ancestry_closure_repository.is_related(
+                individual_id, other_id
+            )
+
+        graph = await self.tree_graph_repository.load(tree_id)
+        if individual_id not in graph or other_id not in graph:
+            raise UnknownIndividualForTreeException
+        node, other = graph.index_of(individual_id), graph.index_of(other_id)
+        ancestors = graph.ancestors(node).keys() | {node}
+        return other in ancestors or not ancestors.isdisjoint(graph.ancestors(other))
+
     @access_to_tree(TreeAccessLevel.EDITOR)
     async def create_individual(
         self,
@@ -52,7 +273,36 @@ class IndividualService:
         individual = IndividualEntity.create_individual(
             tree_id=tree_id, **individual_schema.model_dump()
         )
-        return await self.individual_repository.create(individual)
+        created = await self.individual_repository.create(individual)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.INDIVIDUAL, ChangeAction.CREATED, (created.id,)
+        )
+        return created
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def create_individuals(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        # TODO: Remove schema from service
+        individual_schemas: list[IndividualCreateRequestSchema],
+    ) -> list[IndividualEntity]:
+        """Create many individuals with one multi-row INSERT, all or nothing."""
+        individuals = []
+        for index, schema in enumerate(individual_schemas):
+            with batch_item(index):
+                individuals.append(
+                    IndividualEntity.create_individual(
+                        tree_id=tree_id, **schema.model_dump()
+                    )
+                )
+        await self.individual_repository.create_many(individuals)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.INDIVIDUAL, ChangeAction.CREATED
+        )
+        return individuals
 
     @access_to_tree(TreeAccessLevel.EDITOR)
     async def update_individual(
@@ -67,7 +317,14 @@ class IndividualService:
         if individual.tree_id != tree_id:
             raise UnknownIndividualForTreeException
         individual.update_individual(**individual_schema.model_dump())
-        return await self.individual_repository.update(individual)
+        updated = await self.individual_repository.update(individual)
+        if individual.dirty_fields:
+            # The cached graph holds genders, which relationship names use.
+            self.tree_graph_repository.invalidate(tree_id)
+            await self.tree_event_repository.publish(
+                tree_id, RecordKind.INDIVIDUAL, ChangeAction.UPDATED, (individual.id,)
+            )
+        return updated
 
     @access_to_tree(TreeAccessLevel.EDITOR)
     async def delete_individual(
@@ -79,4 +336,8 @@ class IndividualService:
         individual = await self.individual_repository.get_by_id(individual_id)
         if individual.tree_id != tree_id:
             raise UnknownIndividualForTreeException
-        return await self.individual_repository.delete(individual_id)
+        await self.individual_repository.delete(individual_id)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.INDIVIDUAL, ChangeAction.DELETED, (individual_id,)
+        )
@@ -0,0 +1,192 @@
+from dataclasses import dataclass, replace
+from uuid import UUID
+
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.trees.layout import (
+    LayoutEntity,
+    TileClusterEntity,
+    TileEntity,
+)
+from gtree.domain.graph.layout import Layout, compute_layout
+from gtree.domain.graph.spatial import GridIndex
+from gtree.domain.graph.tree_graph import TreeGraph
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
+from gtree.infrastructure.utils.cache import TTLCache
+
+# From this zoom level on tiles contain individuals; below it, clusters whose
+# cells double in size with every level.
+DETAIL_ZOOM = 4
+MAX_ZOOM = 8
+_CLUSTER_CELL_SIZE = 4.0
+# Viewports with more individuals than this fall back to clusters.
+_MAX_TILE_INDIVIDUALS = 2000
+
+
+@dataclass(slots=True)
+class _CachedLayout:
+    version: int
+    graph: TreeGraph
+    fingerprint: bytes
+    layout: Layout
+    entity: LayoutEntity
+    index: GridIndex
+
+
+# A layout serves the tree version it was looked up for. On a new version it
+# is reused if the graph fingerprint is unchanged (e.g. only names were edited)
+# and recomputed otherwise.
+_layouts: TTLCache[UUID, _CachedLayout] = TTLCache(maxsize=16, ttl=3600)
+
+
+class LayoutService:
+    def __init__(
+        self,
+        tree_graph_repository: TreeGraphRepository,
+        individual_repository: IndividualRepository,
+        tree_access_repository: TreeAccessRepository,
+    ):
+        self.tree_graph_repository = tree_graph_repository
+        self.individual_repository = individual_repository
+        self.tree_access_repository = tree_access_repository
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_layout(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+    ) -> LayoutEntity:
+        _, cached = await self._get_cached_layout(tree_id)
+        return cached.entity
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_tile(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+        zoom: int,
+    ) -> TileEntity:
+        graph, cached = await self._get_cached_layout(tree_id)
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+
+        visible = cached.index.query(x0, y0, x1, y1) if zoom >= DETAIL_ZOOM else []
+        if zoom < DETAIL_ZOOM or len(visible) > _MAX_TILE_INDIVIDUALS:
+            cell_size = _CLUSTER_CELL_SIZE * 2 ** max(DETAIL_ZOOM - zoom, 1)
+            return TileEntity(
+                tree_id=tree_id,
+                clusters=[
+                    TileClusterEntity(
+                        count=cluster.count,
+                        x=cluster.x,
+                        y=cluster.y,
+                        x0=cluster.x0,
+                        y0=cluster.y0,
+                        x1=cluster.x1,
+                        y1=cluster.y1,
+                    )
+                    for cluster in cached.index.clusters(x0, y0, x1, y1, cell_size)
+                ],
+            )
+
+        nodes, blood_relations, marriages = self._with_neighbours(graph, visible)
+        individuals = {
+            individual.id: individual
+            for individual in await self.individual_repository.get_by_ids(
+                tree_id, [graph.ids[node] for node in nodes]
+            )
+        }
+        # Keep positions aligned with edges even if a row vanished meanwhile.
+        nodes = [node for node in nodes if graph.ids[node] in individuals]
+        position = {node: i for i, node in enumerate(nodes)}
+        return TileEntity(
+            tree_id=tree_id,
+            individuals=[individuals[graph.ids[node]] for node in nodes],
+            x=[cached.layout.x[node] for node in nodes],
+            y=[cached.layout.y[node] for node in nodes],
+            blood_relations=[
+                (position[a], position[b])
+                for a, b in blood_relations
+                if a in position and b in position
+            ],
+            marriages=[
+                (position[a], position[b])
+                for a, b in marriages
+                if a in position and b in position
+            ],
+        )
+
+    async def _get_cached_layout(
+        self, tree_id: UUID
+    ) -> tuple[TreeGraph, _CachedLayout]:
+        version, graph = await self.tree_graph_repository.load_shared(tree_id)
+        cached = _layouts.get(tree_id)
+        if cached is not None and cached.version == version:
+            return cached.graph, cached
+
+        fingerprint = graph.fingerprint()
+        if cached is not None and cached.fingerprint == fingerprint:
+            fresh = replace(cached, version=version, graph=graph)
+        else:
+            layout = compute_layout(graph)
+            fresh = _CachedLayout(
+                version=version,
+                graph=graph,
+                fingerprint=fingerprint,
+                layout=layout,
+                entity=self._to_entity(tree_id, graph, layout),
+                index=GridIndex(layout.x, layout.y),
+            )
+        # A request that read an older version must not evict a newer layout.
+        if cached is None or version > cached.version:
+            _layouts.set(tree_id, fresh)
+        return graph, fresh
+
+    @staticmethod
+    def _with_neighbours(
+        graph: TreeGraph, visible: list[int]
+    ) -> tuple[list[int], list[tuple[int, int]], list[tuple[int, int]]]:
+        """Visible nodes plus their direct relatives, and the edges touching them.
+
+        Blood relations are (parent, child) and marriages (father, mother) pairs.
+        """
+        nodes = dict.fromkeys(visible)
+        blood_relations: dict[tuple[int, int], None] = {}
+        marriages: dict[tuple[int, int], None] = {}
+        for node in visible:
+            for parent in graph.parents(node):
+                blood_relations[(parent, node)] = None
+                nodes[parent] = None
+            for child in graph.children(node):
+                blood_relations[(node, child)] = None
+                nodes[child] = None
+            wives = graph.wives(node)
+            for spouse in graph.spouses(node):
+                marriages[(node, spouse) if spouse in wives else (spouse, node)] = None
+                nodes[spouse] = None
+        return list(nodes), list(blood_relations), list(marriages)
+
+    @staticmethod
+    def _to_entity(tree_id: UUID, graph: TreeGraph, layout: Layout) -> LayoutEntity:
+        fathers, mothers = [], []
+        for father, mother in graph.marriages():
+            fathers.append(father)
+            mothers.append(mother)
+        return LayoutEntity(
+            tree_id=tree_id,
+            individual_ids=list(graph.ids),
+            x=layout.x.tolist(),
+            y=layout.y.tolist(),
+            marriage_fathers=fathers,
+            marriage_mothers=mothers,
+            marriage_x=layout.marriage_x.tolist(),
+            marriage_y=layout.marriage_y.tolist(),
+            width=layout.width,
+            height=layout.height,
+        )
@@ -0,0 +1,148 @@
+from uuid import UUID
+
+from gtree.api.v1.schemas.trees.marriage import (
+    MarriageCreateRequestSchema,
+    MarriageUpdateRequestSchema,
+)
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.application.exceptions.individual import UnknownIndividualForTreeException
+from gtree.application.services.trees.batch import batch_item
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.trees.marriage import MarriageEntity
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.repositories.trees.marriage import MarriageRepository
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_event import TreeEventRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
+
+
+class MarriageService:
+    def __init__(
+        self,
+        marriage_repository: MarriageRepository,
+        individual_repository: IndividualRepository,
+        tree_access_repository: TreeAccessRepository,
+        tree_graph_repository: TreeGraphRepository,
+        tree_event_repository: TreeEventRepository,
+    ):
+        self.marriage_repository = marriage_repository
+        self.individual_repository = individual_repository
+        self.tree_access_repository = tree_access_repository
+        self.tree_graph_repository = tree_graph_repository
+        self.tree_event_repository = tree_event_repository
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_marriages_for_tree(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+    ) -> list[MarriageEntity]:
+        return await self.marriage_repository.get_by_tree_id(tree_id)
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_marriage_by_id(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        father_id: UUID,
+        mother_id: UUID,
+    ) -> MarriageEntity:
+        await self._check_individuals_in_tree(tree_id, father_id, mother_id)
+        return await self.marriage_repository.get_by_id(father_id, mother_id)
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def create_marriage(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        # TODO: Remove schema from service
+        marriage_schema: MarriageCreateRequestSchema,
+    ) -> MarriageEntity:
+        marriage = MarriageEntity.create_marriage(**marriage_schema.model_dump())
+        await self._check_individuals_in_tree(
+            tree_id, marriage.father_id, marriage.mother_id
+        )
+        created = await self.marriage_repository.create(marriage)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id,
+            RecordKind.MARRIAGE,
+            ChangeAction.CREATED,
+            (created.father_id, created.mother_id),
+        )
+        return created
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def create_marriages(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        # TODO: Remove schema from service
+        marriage_schemas: list[MarriageCreateRequestSchema],
+    ) -> list[MarriageEntity]:
+        """Create many marriages at once, all or nothing.
+
+        All spouses are checked with one query and the marriages are written
+        with one multi-row INSERT.
+        """
+        marriages: dict[tuple[UUID, UUID], MarriageEntity] = {}
+        for index, schema in enumerate(marriage_schemas):
+            with batch_item(index):
+                marriage = MarriageEntity.create_marriage(**schema.model_dump())
+            marriages[(marriage.father_id, marriage.mother_id)] = marriage
+
+        await self._check_individuals_in_tree(
+            tree_id, *{spouse for pair in marriages for spouse in pair}
+        )
+        created = list(marriages.values())
+        await self.marriage_repository.create_many(created, skip_existing=False)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.MARRIAGE, ChangeAction.CREATED
+        )
+        return created
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def update_marriage(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        father_id: UUID,
+        mother_id: UUID,
+        # TODO: Remove schema from service
+        marriage_schema: MarriageUpdateRequestSchema,
+    ) -> MarriageEntity:
+        await self._check_individuals_in_tree(tree_id, father_id, mother_id)
+        marriage = await self.marriage_repository.get_by_id(father_id, mother_id)
+        marriage.update_marriage(**marriage_schema.model_dump())
+        updated = await self.marriage_repository.update(marriage)
+        if marriage.dirty_fields:
+            await self.tree_event_repository.publish(
+                tree_id,
+                RecordKind.MARRIAGE,
+                ChangeAction.UPDATED,
+                (father_id, mother_id),
+            )
+        return updated
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def delete_marriage(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        father_id: UUID,
+        mother_id: UUID,
+    ) -> None:
+        await self._check_individuals_in_tree(tree_id, father_id, mother_id)
+        await self.marriage_repository.delete(father_id, mother_id)
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.MARRIAGE, ChangeAction.DELETED, (father_id, mother_id)
+        )
+
+    async def _check_individuals_in_tree(self, tree_id: UUID, *ids: UUID) -> None:
+        found = await self.individual_repository.get_ids_in_tree(tree_id, set(ids))
+        if len(found) != len(set(ids)):
+            raise UnknownIndividualForTreeException
@@ -0,0 +1,104 @@
+from uuid import UUID
+
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.application.exceptions.individual import (
+    IndividualMergeCycleException,
+    IndividualSelfMergeException,
+    UnknownIndividualForTreeException,
+)
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.trees.individual_merge import IndividualMergeEntity
+from gtree.infrastructure.db.repositories.trees.blood_relation import (
+    BloodRelationRepository,
+)
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.repositories.trees.marriage import MarriageRepository
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_event import TreeEventRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
+
+
+class MergeService:
+    def __init__(
+        self,
+        individual_repository: IndividualRepository,
+        blood_relation_repository: BloodRelationRepository,
+        marriage_repository: MarriageRepository,
+        tree_access_repository: TreeAccessRepository,
+        tree_graph_repository: TreeGraphRepository,
+        tree_event_repository: TreeEventRepository,
+    ):
+        self.individual_repository = individual_repository
+        self.blood_relation_repository = blood_relation_repository
+        self.marriage_repository = marriage_repository
+        self.tree_access_repository = tree_access_repository
+        self.tree_graph_repository = tree_graph_repository
+        self.tree_event_repository = tree_event_repository
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def merge_individuals(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        keep_id: UUID,
+        drop_id: UUID,
+    ) -> IndividualMergeEntity:
+        """Merge a duplicate individual into another, in the request's transaction.
+
+        The relations and marriages of `drop_id` are moved to `keep_id` with a
+        few set-based statements, `keep_id` takes what it lacks from it, and
+        `drop_id` is deleted. Both rows are locked first, so concurrent merges
+        of the same individuals run one after the other.
+        """
+        if keep_id == drop_id:
+            raise IndividualSelfMergeException
+        individuals = await self.individual_repository.lock_in_tree(
+            tree_id, (keep_id, drop_id)
+        )
+        if len(individuals) != 2:
+            raise UnknownIndividualForTreeException
+        # A relation between the two would become a self-parent row, a longer
+        # line of descent a cycle.
+        if await self.individual_repository.is_ancestor(
+            keep_id, drop_id
+        ) or await self.individual_repository.is_ancestor(drop_id, keep_id):
+            raise IndividualMergeCycleException
+
+        (
+            moved_blood_relations,
+            deleted_blood_relations,
+        ) = await self.blood_relation_repository.move_individual(drop_id, keep_id)
+        (
+            moved_marriages,
+            deleted_marriages,
+        ) = await self.marriage_repository.move_individual(drop_id, keep_id)
+        keep = individuals[keep_id]
+        keep.absorb(individuals[drop_id])
+        keep = await self.individual_repository.update(keep)
+        await self.individual_repository.delete(drop_id)
+
+        self.tree_graph_repository.invalidate(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.INDIVIDUAL, ChangeAction.UPDATED, (keep_id,)
+        )
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.INDIVIDUAL, ChangeAction.DELETED, (drop_id,)
+        )
+        if moved_blood_relations:
+            await self.tree_event_repository.publish(
+                tree_id, RecordKind.BLOOD_RELATION, ChangeAction.UPDATED
+            )
+        if moved_marriages:
+            await self.tree_event_repository.publish(
+                tree_id, RecordKind.MARRIAGE, ChangeAction.UPDATED
+            )
+        return IndividualMergeEntity(
+            individual=keep,
+            merged_id=drop_id,
+            moved_blood_relations=moved_blood_relations,
+            deleted_blood_relations=deleted_blood_relations,
+            moved_marriages=moved_marriages,
+            deleted_marriages=deleted_marriages,
+        )
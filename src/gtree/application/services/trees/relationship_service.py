@@ -0,0 +1,135 @@
+from uuid import UUID
+
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.application.exceptions.individual import UnknownIndividualForTreeException
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.trees.relationship import (
+    InbreedingAnnotationEntity,
+    RelationshipCoefficientsEntity,
+    RelationshipEntity,
+)
+from gtree.domain.graph.coefficients import RelationshipCoefficients
+from gtree.domain.graph.kinship import KinshipIndex
+from gtree.domain.graph.tree_graph import TreeGraph
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
+from gtree.infrastructure.utils.cache import TTLCache
+
+# Keyed by tree and version, like the shared graphs they are built from.
+_kinship_indexes: TTLCache[tuple[UUID, int], KinshipIndex] = TTLCache(
+    maxsize=32, ttl=600
+)
+_coefficients: TTLCache[tuple[UUID, int], RelationshipCoefficients] = TTLCache(
+    maxsize=32, ttl=600
+)
+
+
+class RelationshipService:
+    def __init__(
+        self,
+        tree_graph_repository: TreeGraphRepository,
+        individual_repository: IndividualRepository,
+        tree_access_repository: TreeAccessRepository,
+    ):
+        self.tree_graph_repository = tree_graph_repository
+        self.individual_repository = individual_repository
+        self.tree_access_repository = tree_access_repository
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_relationship(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        individual_id: UUID,
+        other_id: UUID,
+    ) -> RelationshipEntity:
+        index = await self._get_kinship_index(tree_id)
+        graph = index.graph
+        node, other = self._nodes_of(graph, individual_id, other_id)
+
+        kinship = index.kinship(node, other)
+        return RelationshipEntity(
+            individual_id=individual_id,
+            other_id=other_id,
+            name=kinship.name,
+            generations_up=kinship.generations_up,
+            generations_down=kinship.generations_down,
+            common_ancestor_ids=[graph.ids[a] for a in kinship.common_ancestors],
+            is_half=kinship.is_half,
+            via_spouse_id=(
+                graph.ids[kinship.via_spouse]
+                if kinship.via_spouse is not None
+                else None
+            ),
+        )
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_coefficients(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        individual_id: UUID,
+        other_id: UUID,
+    ) -> RelationshipCoefficientsEntity:
+        coefficients = await self._get_coefficients(tree_id)
+        node, other = self._nodes_of(coefficients.graph, individual_id, other_id)
+        return RelationshipCoefficientsEntity(
+            individual_id=individual_id,
+            other_id=other_id,
+            kinship=coefficients.kinship(node, other),
+            relationship=coefficients.relationship(node, other),
+            individual_inbreeding=coefficients.inbreeding(node),
+            other_inbreeding=coefficients.inbreeding(other),
+        )
+
+    @access_to_tree(TreeAccessLevel.EDITOR)
+    async def annotate_inbreeding(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+    ) -> InbreedingAnnotationEntity:
+        return await self.annotate_tree_inbreeding(tree_id)
+
+    async def annotate_tree_inbreeding(
+        self, tree_id: UUID
+    ) -> InbreedingAnnotationEntity:
+        """Store the inbreeding coefficient of every individual of a tree.
+
+        Does not check access: meant for batch jobs and authorized callers.
+        """
+        graph = await self.tree_graph_repository.load(tree_id)
+        inbreeding = RelationshipCoefficients(graph).inbreeding_all()
+        annotated = await self.individual_repository.set_inbreeding_coefficients(
+            dict(zip(graph.ids, inbreeding, strict=True))
+        )
+        return InbreedingAnnotationEntity(
+            tree_id=tree_id,
+            annotated=annotated,
+            inbred=sum(1 for value in inbreeding if value > 0),
+            max_inbreeding=max(inbreeding, default=0.0),
+        )
+
+    async def _get_kinship_index(self, tree_id: UUID) -> KinshipIndex:
+        version, graph = await self.tree_graph_repository.load_shared(tree_id)
+        index = _kinship_indexes.get((tree_id, version))
+        if index is None:
+            index = KinshipIndex(graph)
+            _kinship_indexes.set((tree_id, version), index)
+        return index
+
+    async def _get_coefficients(self, tree_id: UUID) -> RelationshipCoefficients:
+        version, graph = await self.tree_graph_repository.load_shared(tree_id)
+        coefficients = _coefficients.get((tree_id, version))
+        if coefficients is None:
+            coefficients = RelationshipCoefficients(graph)
+            _coefficients.set((tree_id, version), coefficients)
+        return coefficients
+
+    @staticmethod
+    def _nodes_of(
+        graph: TreeGraph, individual_id: UUID, other_id: UUID
+    ) -> tuple[int, int]:
+        if individual_id not in graph or other_id not in graph:
+            raise UnknownIndividualForTreeException
+        return graph.index_of(individual_id), graph.index_of(other_id)
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.trees.tree_changes import TombstoneEntity, TreeChangesEntity
+from gtree.domain.funcs.time import to_naive_utc
+from gtree.infrastructure.db.repositories.trees.blood_relation import (
+    BloodRelationRepository,
+)
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.repositories.trees.marriage import MarriageRepository
+from gtree.infrastructure.db.repositories.trees.tree import TreeRepository
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_tombstone import (
+    TreeTombstoneRepository,
+)
+
+
+class SyncService:
+    def __init__(
+        self,
+        tree_repository: TreeRepository,
+        individual_repository: IndividualRepository,
+        blood_relation_repository: BloodRelationRepository,
+        marriage_repository: MarriageRepository,
+        tree_tombstone_repository: TreeTombstoneRepository,
+        tree_access_repository: TreeAccessRepository,
+        cursor_overlap: timedelta,
+    ):
+        self.tree_repository = tree_repository
+        self.individual_repository = individual_repository
+        self.blood_relation_repository = blood_relation_repository
+        self.marriage_repository = marriage_repository
+        self.tree_tombstone_repository = tree_tombstone_repository
+        self.tree_access_repository = tree_access_repository
+        self.cursor_overlap = cursor_overlap
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_changes(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+        since: datetime,
+    ) -> TreeChangesEntity:
+        """Return the records of a tree created, updated or deleted after `since`.
+
+        Rows are selected by `updated_at`, which is stamped before the writing
+        transaction commits, so the returned cursor lags the database clock
+        by `cursor_overlap`. Records in the overlap are sent again;
+        clients apply deltas as upserts. Inactive records count as deleted.
+        """
+        since = to_naive_utc(since)
+        version, now = await self.tree_repository.get_sync_point(tree_id)
+        changes = TreeChangesEntity(
+            version=version,
+            cursor=now - self.cursor_overlap,
+            deleted=await self.tree_tombstone_repository.get_since(tree_id, since),
+        )
+
+        for individual in await self.individual_repository.get_changed_since(
+            tree_id, since
+        ):
+            if individual.is_active:
+                changes.individuals.append(individual)
+            else:
+                changes.deleted.append(
+                    TombstoneEntity(
+                        kind=RecordKind.INDIVIDUAL,
+                        key=(individual.id,),
+                        deleted_at=individual.updated_at,
+                    )
+                )
+
+        for relation in await self.blood_relation_repository.get_changed_since(
+            tree_id, since
+        ):
+            if relation.is_active:
+                changes.blood_relations.append(relation)
+            else:
+                changes.deleted.append(
+                    TombstoneEntity(
+                        kind=RecordKind.BLOOD_RELATION,
+                        key=(relation.parent_id, relation.child_id),
+                        deleted_at=relation.updated_at,
+                    )
+                )
+
+        for marriage in await self.marriage_repository.get_changed_since(
+            tree_id, since
+        ):
+            if marriage.is_active:
+                changes.marriages.append(marriage)
+            else:
+                changes.deleted.append(
+                    TombstoneEntity(
+                        kind=RecordKind.MARRIAGE,
+                        key=(marriage.father_id, marriage.mother_id),
+                        deleted_at=marriage.updated_at,
+                    )
+                )
+        return changes
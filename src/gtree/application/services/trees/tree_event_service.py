@@ -0,0 +1,41 @@
+from collections.abc import AsyncGenerator
+from uuid import UUID
+
+from gtree.application.authorization.tree_access import access_to_tree
+from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
+from gtree.domain.entities.trees.tree_event import TreeEventEntity
+from gtree.infrastructure.db.notifications import TreeEventHub
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+
+
+class TreeEventService:
+    def __init__(
+        self,
+        tree_access_repository: TreeAccessRepository,
+        hub: TreeEventHub,
+        heartbeat: float,
+    ):
+        self.tree_access_repository = tree_access_repository
+        self.hub = hub
+        self.heartbeat = heartbeat
+
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def watch_tree(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+    ) -> AsyncGenerator[list[TreeEventEntity] | None]:
+        """Check access and return a lazy stream of event batches of a tree.
+
+        The stream subscribes when it is first consumed and yields an empty
+        batch after `heartbeat` idle seconds and None when the subscriber
+        has to resync. It needs no database session.
+        """
+        return self._watch(tree_id)
+
+    async def _watch(
+        self, tree_id: UUID
+    ) -> AsyncGenerator[list[TreeEventEntity] | None]:
+        async with self.hub.subscribe(tree_id) as feed:
+            while True:
+                yield await feed.get(self.heartbeat)
@@ -1,11 +1,14 @@
 from uuid import UUID
 
 from gtree.application.authorization.tree_access import access_to_tree
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.record_kind import RecordKind
 from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
 from gtree.domain.entities.trees.tree import TreeEntity
 from gtree.domain.entities.trees.tree_access import TreeAccessEntity
 from gtree.infrastructure.db.repositories.trees.tree import TreeRepository
 from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_event import TreeEventRepository
 
 
 class TreeService:
@@ -13,9 +16,11 @@ class TreeService:
         self,
         tree_repository: TreeRepository,
         tree_access_repository: TreeAccessRepository,
+        tree_event_repository: TreeEventRepository,
     ):
         self.tree_repository = tree_repository
         self.tree_access_repository = tree_access_repository
+        self.tree_event_repository = tree_event_repository
 
     async def get_accessible_trees(self, user_id: UUID) -> list[TreeEntity]:
         return await self.tree_repository.get_accessible_trees(
@@ -30,6 +35,15 @@ class TreeService:
     ) -> TreeEntity:
         return await self.tree_repository.get_by_id(tree_id)
 
+    @access_to_tree(TreeAccessLevel.VIEWER)
+    async def get_tree_version(
+        self,
+        user_id: UUID,  # noqa: ARG002
+        tree_id: UUID,
+    ) -> int:
+        """Return the version of a tree, which changes on every write to it."""
+        return await self.tree_repository.get_version(tree_id)
+
     async def create_tree(
         self, owner_id: UUID, name: str, description: str
     ) -> TreeEntity:
@@ -51,8 +65,12 @@ class TreeService:
     ) -> TreeEntity:
         tree = await self.tree_repository.get_by_id(tree_id)
         tree.update_tree(name, description)
-        await self.tree_repository.update(tree)
-        return tree
+        updated = await self.tree_repository.update(tree)
+        if tree.dirty_fields:
+            await self.tree_event_repository.publish(
+                tree_id, RecordKind.TREE, ChangeAction.UPDATED, (tree_id,)
+            )
+        return updated
 
     @access_to_tree(TreeAccessLevel.OWNER)
     async def delete_tree(
@@ -61,6 +79,9 @@ class TreeService:
         tree_id: UUID,
     ) -> None:
         await self.tree_repository.delete(tree_id)
+        await self.tree_event_repository.publish(
+            tree_id, RecordKind.TREE, ChangeAction.DELETED, (tree_id,)
+        )
 
     @access_to_tree(TreeAccessLevel.OWNER)
     async def share_access(
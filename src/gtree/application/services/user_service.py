@@ -23,14 +23,14 @@ class UserService:
             user = await self.user_repository.get_by_username(username)
         except NotFoundException as e:
             raise InvalidCredentialsException("Invalid email or password") from e
-        if not auth_utils.verify_password(password, user.password_hash):
+        if not await auth_utils.verify_password(password, user.password_hash):
             raise InvalidCredentialsException("Invalid email or password")
         if not user.is_active:
             raise UserInactiveException("User account is inactive")
         return user
 
     async def register(self, username: str, password: str, email: str) -> TokenEntity:
-        hashed_password = auth_utils.hash_password(password)
+        hashed_password = await auth_utils.hash_password(password)
         created_user = UserEntity.create_user(
             username=username, email=email, password_hash=hashed_password
         )
@@ -63,11 +63,11 @@ class UserService:
 
     async def get_current_auth_user(self, token: str) -> UserEntity:
         try:
-            payload = auth_utils.decode_jwt(token=token)
+            payload = auth_utils.decode_jwt_cached(token)
             sub: str | None = payload.get("sub")
             if sub is not None:
                 user_id = UUID(sub)
-                if user := await self.user_repository.get_by_id(user_id):
+                if user := await self.user_repository.get_by_id_cached(user_id):
                     return user
         except (ValueError, auth_utils.InvalidTokenError):
             pass
@@ -13,12 +13,55 @@ class AppSettings(BaseSettings):
         environment (Literal["local", "dev", "development", "prod"]): Application environment.
         log_level (Literal["DEBUG", "INFO", "WARNING", "ERROR"]): Logging level.
         debug (bool): Debug mode flag.
+        ancestry_closure_enabled (bool): Serve ancestry queries from the
+            precomputed `ancestry_closure` table instead of recursive CTEs.
+        access_cache_ttl (float): Seconds a worker may reuse a user's tree
+            access level across requests; 0 disables the process-wide cache.
+        access_cache_size (int): Maximum number of cached access levels.
+        user_cache_ttl (float): Seconds a worker may reuse an authenticated
+            user across requests; 0 disables the cache.
+        user_cache_size (int): Maximum number of cached users.
+        changes_cursor_overlap (float): Seconds the delta sync cursor is
+            moved back, so rows stamped before a slow transaction committed
+            are delivered again rather than missed.
+        tree_events_coalesce_window (float): Seconds a tree event feed waits
+            after an event to deliver the rest of a burst along with it.
+        tree_events_max_pending (int): Distinct pending events per feed
+            subscriber; beyond that the subscriber is told to resync.
+        tree_events_heartbeat (float): Seconds between keep-alive comments on
+            an idle tree event feed.
+        duplicate_scan_min_score (float): Lowest score, from 0 to 1, of a
+            pair of individuals suggested as duplicates.
+        duplicate_scan_max_block_size (int): Largest group of similar names
+            and birth decade, or of similar names without a birth date,
+            compared pairwise; larger ones are skipped.
+        duplicate_scan_max_suggestions (int): Suggestions kept per scan.
     """
 
     app_name: str = "Antiquarium Service"
     environment: Literal["local", "dev", "development", "prod"] = "local"
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
     debug: bool = Field(False, alias="DEBUG")
+    ancestry_closure_enabled: bool = Field(False, alias="ANCESTRY_CLOSURE_ENABLED")
+    access_cache_ttl: float = Field(0, ge=0, alias="ACCESS_CACHE_TTL")
+    access_cache_size: int = Field(10_000, ge=1, alias="ACCESS_CACHE_SIZE")
+    user_cache_ttl: float = Field(10, ge=0, alias="USER_CACHE_TTL")
+    user_cache_size: int = Field(10_000, ge=1, alias="USER_CACHE_SIZE")
+    changes_cursor_overlap: float = Field(60, ge=0, alias="CHANGES_CURSOR_OVERLAP")
+    tree_events_coalesce_window: float = Field(
+        0.2, ge=0, alias="TREE_EVENTS_COALESCE_WINDOW"
+    )
+    tree_events_max_pending: int = Field(100, ge=1, alias="TREE_EVENTS_MAX_PENDING")
+    tree_events_heartbeat: float = Field(15, gt=0, alias="TREE_EVENTS_HEARTBEAT")
+    duplicate_scan_min_score: float = Field(
+        0.8, ge=0, le=1, alias="DUPLICATE_SCAN_MIN_SCORE"
+    )
+    duplicate_scan_max_block_size: int = Field(
+        500, ge=2, alias="DUPLICATE_SCAN_MAX_BLOCK_SIZE"
+    )
+    duplicate_scan_max_suggestions: int = Field(
+        1000, ge=1, alias="DUPLICATE_SCAN_MAX_SUGGESTIONS"
+    )
 
     class Config:
         env_file = ".env"
@@ -47,6 +47,17 @@ class DatabaseSettings(BaseSettings):
         """
         return str(self.database_url)
 
+    @computed_field
+    def asyncpg_dsn(self) -> str:
+        """Returns the database URL for direct asyncpg connections.
+
+        Returns:
+            str: The database URL without the SQLAlchemy driver suffix.
+        """
+        return str(self.database_url).replace(
+            "postgresql+asyncpg://", "postgresql://", 1
+        )
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
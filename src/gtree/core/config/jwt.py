@@ -13,13 +13,19 @@ def import_cert(path: Path) -> str:
 
 @final
 class JWTSettings(BaseSettings):
-    """JWT settings."""
+    """JWT settings.
+
+    Decoded tokens are cached for `decoded_token_cache_ttl` seconds (0 disables
+    the cache), but never past their own expiry.
+    """
 
     algorithm: Literal["RS256", "HS256"] = "RS256"
     access_token_expire_minutes: int = 60 * 24 * 8
     refresh_token_expire_minutes: int = 60 * 24 * 7
     private_key: str = import_cert(BASE_PATH / ".certs" / "jwt-private.pem")
     public_key: str = import_cert(BASE_PATH / ".certs" / "jwt-public.pem")
+    decoded_token_cache_ttl: float = 300
+    decoded_token_cache_size: int = 10_000
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,25 @@
+from typing import final
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+@final
+class PasswordSettings(BaseSettings):
+    """Password hashing settings.
+
+    Attributes:
+        bcrypt_rounds (int): bcrypt cost factor (log2 of the iterations) of new hashes.
+        password_hash_workers (int): Threads per worker process running bcrypt.
+        password_hash_queue_size (int): Hash operations allowed to wait for a
+            thread; further ones are rejected with 503.
+    """
+
+    bcrypt_rounds: int = Field(12, ge=4, le=31, alias="BCRYPT_ROUNDS")
+    password_hash_workers: int = Field(2, ge=1, alias="PASSWORD_HASH_WORKERS")
+    password_hash_queue_size: int = Field(32, ge=0, alias="PASSWORD_HASH_QUEUE_SIZE")
+
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
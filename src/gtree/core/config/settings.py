@@ -5,6 +5,7 @@ from gtree.core.config.app import AppSettings
 from gtree.core.config.cors import CORSSettings
 from gtree.core.config.database import DatabaseSettings
 from gtree.core.config.jwt import JWTSettings
+from gtree.core.config.password import PasswordSettings
 
 
 class Settings(BaseSettings):
@@ -19,6 +20,7 @@ class Settings(BaseSettings):
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     cors: CORSSettings = Field(default_factory=CORSSettings)
     jwt: JWTSettings = Field(default_factory=JWTSettings)
+    password: PasswordSettings = Field(default_factory=PasswordSettings)
 
 
 settings = Settings()
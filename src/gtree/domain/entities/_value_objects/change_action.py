@@ -0,0 +1,9 @@
+from enum import StrEnum, auto
+
+
+class ChangeAction(StrEnum):
+    """Value object naming what a write did to a record."""
+
+    CREATED = auto()
+    UPDATED = auto()
+    DELETED = auto()
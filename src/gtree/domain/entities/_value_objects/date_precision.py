@@ -0,0 +1,32 @@
+from enum import StrEnum, auto
+
+from gtree.domain.exceptions import DomainValidationException
+
+
+class DatePrecision(StrEnum):
+    """Value object describing how exactly a stored date is known.
+
+    DAY, MONTH and YEAR mean the date is known up to that unit (the stored
+    date is the first day of it). ABOUT, BEFORE and AFTER qualify a year.
+    """
+
+    DAY = auto()
+    MONTH = auto()
+    YEAR = auto()
+    ABOUT = auto()
+    BEFORE = auto()
+    AFTER = auto()
+
+    @classmethod
+    def from_string(cls, value: str | None) -> "DatePrecision | None":
+        """Create DatePrecision from string."""
+        try:
+            if value is None:
+                return None
+            return cls(value.lower())
+        except ValueError as e:
+            valid_values = [precision.value for precision in cls]
+            raise DomainValidationException(
+                f"Invalid date precision: '{value}'. "
+                f"Must be one of: {', '.join(valid_values)}"
+            ) from e
@@ -0,0 +1,11 @@
+from enum import StrEnum, auto
+
+
+class IndividualOrder(StrEnum):
+    """Value object naming the sort keys of paginated individual listings.
+
+    NAME orders by (last name, first name, id), CREATED by (creation time, id).
+    """
+
+    NAME = auto()
+    CREATED = auto()
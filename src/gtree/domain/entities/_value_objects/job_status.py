@@ -0,0 +1,14 @@
+from enum import StrEnum, auto
+
+
+class JobStatus(StrEnum):
+    """Value object describing the state of a background job."""
+
+    PENDING = auto()
+    RUNNING = auto()
+    COMPLETED = auto()
+    FAILED = auto()
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED)
@@ -0,0 +1,12 @@
+from enum import StrEnum, auto
+
+
+class NameSearchMode(StrEnum):
+    """Value object naming how individuals are matched by name.
+
+    FUZZY tolerates typos by trigram similarity, PHONETIC matches names that
+    sound alike across spellings and alphabets (Ivanov, Iwanow, Иванов).
+    """
+
+    FUZZY = auto()
+    PHONETIC = auto()
@@ -0,0 +1,10 @@
+from enum import StrEnum, auto
+
+
+class RecordKind(StrEnum):
+    """Value object naming the kinds of records a tree is made of."""
+
+    TREE = auto()
+    INDIVIDUAL = auto()
+    BLOOD_RELATION = auto()
+    MARRIAGE = auto()
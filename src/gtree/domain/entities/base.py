@@ -13,6 +13,20 @@ class BaseEntity:
     updated_at: datetime = field(default_factory=get_current_time)
     is_active: bool = field(default=True)
 
+    _dirty: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        """Fields changed by update methods since the entity was loaded."""
+        return frozenset(self._dirty)
+
+    def _assign(self, **values: object) -> None:
+        """Set fields to the given values, skipping empty ones; track changes."""
+        for name, value in values.items():
+            if value and getattr(self, name) != value:
+                setattr(self, name, value)
+                self._dirty.add(name)
+
 
 @dataclass(kw_only=True, slots=True)
 class ObjectBaseEntity(BaseEntity):
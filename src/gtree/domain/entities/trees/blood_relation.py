@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from gtree.domain.entities.base import AssociationBaseEntity
+from gtree.domain.exceptions import DomainValidationException
+
+
+@dataclass(kw_only=True, slots=True)
+class BloodRelationEntity(AssociationBaseEntity):
+    """Blood relation entity linking a parent to a child."""
+
+    parent_id: UUID
+    child_id: UUID
+
+    def __post_init__(self) -> None:
+        if self.parent_id == self.child_id:
+            raise DomainValidationException("Individual cannot be their own parent")
+
+    @classmethod
+    def create_blood_relation(
+        cls,
+        parent_id: UUID,
+        child_id: UUID,
+    ) -> "BloodRelationEntity":
+        """Create a new blood relation entity."""
+        try:
+            return cls(
+                parent_id=parent_id,
+                child_id=child_id,
+            )
+        except DomainValidationException:
+            raise
+
+    def __str__(self) -> str:
+        return f"BloodRelation(parent={self.parent_id}, child={self.child_id})"
@@ -0,0 +1,78 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from gtree.domain.entities._value_objects.job_status import JobStatus
+from gtree.domain.entities.base import ObjectBaseEntity
+from gtree.domain.funcs.time import get_current_time
+
+
+@dataclass(kw_only=True, slots=True)
+class DuplicateSuggestionEntity:
+    """Two individuals that are probably the same person.
+
+    `individual_id` is the better documented one, suggested to be kept when
+    `duplicate_id` is merged into it. Scores are from 0 to 1; a component is
+    None when neither pair of records has data for it.
+    """
+
+    individual_id: UUID
+    duplicate_id: UUID
+    score: float
+    name_score: float
+    date_score: float | None
+    place_score: float | None
+
+
+@dataclass(kw_only=True, slots=True)
+class DuplicateScanEntity(ObjectBaseEntity):
+    """A background search for duplicate individuals in a tree.
+
+    Progress is counted in blocks: groups of individuals with similar
+    sounding names born around the same decade, compared pairwise.
+    """
+
+    tree_id: UUID
+    status: JobStatus = JobStatus.PENDING
+    processed_blocks: int = 0
+    total_blocks: int = 0
+    compared_pairs: int = 0
+    error: str | None = None
+    finished_at: datetime | None = None
+
+    suggestions: list[DuplicateSuggestionEntity] = field(default_factory=list)
+
+    def __post_init__(self):
+        if isinstance(self.status, str):
+            self.status = JobStatus(self.status)
+
+    @property
+    def progress(self) -> float:
+        if self.status == JobStatus.COMPLETED:
+            return 1.0
+        if not self.total_blocks:
+            return 0.0
+        return self.processed_blocks / self.total_blocks
+
+    @classmethod
+    def create_scan(cls, tree_id: UUID) -> "DuplicateScanEntity":
+        return cls(tree_id=tree_id)
+
+    def start(self, total_blocks: int) -> None:
+        self.status = JobStatus.RUNNING
+        self.total_blocks = total_blocks
+
+    def advance(self, processed_blocks: int, compared_pairs: int) -> None:
+        self.processed_blocks = processed_blocks
+        self.compared_pairs = compared_pairs
+
+    def complete(self, suggestions: list[DuplicateSuggestionEntity]) -> None:
+        self.status = JobStatus.COMPLETED
+        self.processed_blocks = self.total_blocks
+        self.suggestions = suggestions
+        self.finished_at = get_current_time()
+
+    def fail(self, error: str) -> None:
+        self.status = JobStatus.FAILED
+        self.error = error
+        self.finished_at = get_current_time()
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(kw_only=True, slots=True)
+class ImportResultEntity:
+    """Counts of rows created by an import and of records that were skipped."""
+
+    tree_id: UUID
+    individuals: int = 0
+    blood_relations: int = 0
+    marriages: int = 0
+    skipped: int = 0
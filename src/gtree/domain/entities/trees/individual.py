@@ -28,6 +28,8 @@ class IndividualEntity(ObjectBaseEntity):
 
     avatar_url: str
 
+    inbreeding_coefficient: float | None = None
+
     def __post_init__(self):
         if not (1 <= len(self.first_name) <= 128):
             raise DomainValidationException(
@@ -95,16 +97,46 @@ class IndividualEntity(ObjectBaseEntity):
         bio: str | None = None,
         avatar_url: str | None = None,
     ) -> None:
-        self.first_name = first_name or self.first_name
-        self.gender = gender or self.gender
-        self.last_name = last_name or self.last_name
-        self.patronymic = patronymic or self.patronymic
-        self.birth_date = birth_date or self.birth_date
-        self.birth_date_precision = birth_date_precision or self.birth_date_precision
-        self.death_date = death_date or self.death_date
-        self.death_date_precision = death_date_precision or self.death_date_precision
-        self.birth_place = birth_place or self.birth_place
-        self.death_place = death_place or self.death_place
-        self.bio = bio or self.bio
-        self.avatar_url = avatar_url or self.avatar_url
+        self._assign(
+            first_name=first_name,
+            gender=gender,
+            last_name=last_name,
+            patronymic=patronymic,
+            birth_date=birth_date,
+            birth_date_precision=birth_date_precision,
+            death_date=death_date,
+            death_date_precision=death_date_precision,
+            birth_place=birth_place,
+            death_place=death_place,
+            bio=bio,
+            avatar_url=avatar_url,
+        )
+        self.__post_init__()
+
+    def absorb(self, duplicate: "IndividualEntity") -> None:
+        """Fill in what is unknown about this individual from a duplicate record.
+
+        Known values are kept; a date is taken together with its precision.
+        """
+        values: dict[str, object] = {
+            name: getattr(duplicate, name)
+            for name in (
+                "last_name",
+                "patronymic",
+                "birth_place",
+                "death_place",
+                "bio",
+                "avatar_url",
+            )
+            if getattr(self, name) is None
+        }
+        if self.gender in (None, Gender.OTHER):
+            values["gender"] = duplicate.gender
+        for date_field in ("birth_date", "death_date"):
+            if getattr(self, date_field) is None:
+                values[date_field] = getattr(duplicate, date_field)
+                values[f"{date_field}_precision"] = getattr(
+                    duplicate, f"{date_field}_precision"
+                )
+        self._assign(**values)
         self.__post_init__()
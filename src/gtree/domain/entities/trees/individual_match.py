@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+
+from gtree.domain.entities.trees.individual import IndividualEntity
+
+
+@dataclass(kw_only=True, slots=True)
+class IndividualMatchEntity:
+    """An individual found by a search, with its relevance from 0 to 1.
+
+    Full-text matches also carry highlighted fragments of the matching
+    fields, by field name.
+    """
+
+    individual: IndividualEntity
+    score: float
+    highlights: dict[str, str] = field(default_factory=dict)
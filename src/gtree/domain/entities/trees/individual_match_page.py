@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+from gtree.domain.entities.trees.individual_match import IndividualMatchEntity
+
+
+@dataclass(kw_only=True, slots=True)
+class IndividualMatchPageEntity:
+    """One page of search results, best first.
+
+    `next_cursor` is None on the last page.
+    """
+
+    items: list[IndividualMatchEntity] = field(default_factory=list)
+    next_cursor: str | None = None
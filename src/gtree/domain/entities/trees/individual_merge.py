@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from gtree.domain.entities.trees.individual import IndividualEntity
+
+
+@dataclass(kw_only=True, slots=True)
+class IndividualMergeEntity:
+    """The kept individual after a duplicate was merged into it.
+
+    Relations the kept individual already had are deleted from the duplicate
+    instead of moved; they are counted as deleted.
+    """
+
+    individual: IndividualEntity
+    merged_id: UUID
+    moved_blood_relations: int
+    deleted_blood_relations: int
+    moved_marriages: int
+    deleted_marriages: int
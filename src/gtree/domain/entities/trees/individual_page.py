@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(kw_only=True, slots=True)
+class IndividualPageEntity:
+    """One page of an individual listing.
+
+    `items` hold only the requested fields of each individual. `next_cursor`
+    is None on the last page.
+    """
+
+    items: list[dict[str, Any]] = field(default_factory=list)
+    next_cursor: str | None = None
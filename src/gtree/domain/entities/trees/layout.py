@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from gtree.domain.entities.trees.individual import IndividualEntity
+
+
+@dataclass(kw_only=True, slots=True)
+class LayoutEntity:
+    """Coordinates of a tree as parallel arrays.
+
+    `x[i]`, `y[i]` belong to `individual_ids[i]`; marriages reference
+    individuals by their position in `individual_ids`. `y` is the generation.
+    """
+
+    tree_id: UUID
+    individual_ids: list[UUID]
+    x: list[float]
+    y: list[int]
+    marriage_fathers: list[int]
+    marriage_mothers: list[int]
+    marriage_x: list[float]
+    marriage_y: list[float]
+    width: float
+    height: int
+
+
+@dataclass(kw_only=True, slots=True)
+class TileClusterEntity:
+    """Individuals aggregated into one cell at low zoom."""
+
+    count: int
+    x: float
+    y: float
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+
+@dataclass(kw_only=True, slots=True)
+class TileEntity:
+    """Part of a tree layout visible in a viewport.
+
+    Either `individuals` (with coordinates in `x`, `y`) or `clusters` is
+    filled. Edges reference positions in `individuals`, which also holds the
+    direct neighbours of visible individuals so edges can leave the viewport.
+    Blood relations are (parent, child) and marriages (father, mother) pairs.
+    """
+
+    tree_id: UUID
+    individuals: list[IndividualEntity] = field(default_factory=list)
+    x: list[float] = field(default_factory=list)
+    y: list[int] = field(default_factory=list)
+    blood_relations: list[tuple[int, int]] = field(default_factory=list)
+    marriages: list[tuple[int, int]] = field(default_factory=list)
+    clusters: list[TileClusterEntity] = field(default_factory=list)
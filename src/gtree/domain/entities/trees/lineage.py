@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from gtree.domain.entities.trees.blood_relation import BloodRelationEntity
+from gtree.domain.entities.trees.individual import IndividualEntity
+
+
+@dataclass(kw_only=True, slots=True)
+class LineageEntity:
+    """Ancestors or descendants of an individual, up to a depth limit.
+
+    `depths` maps each reached individual to its shortest generation distance
+    from the root, `blood_relations` holds the edges walked to reach them.
+    """
+
+    root_id: UUID
+    individuals: list[IndividualEntity] = field(default_factory=list)
+    depths: dict[UUID, int] = field(default_factory=dict)
+    blood_relations: list[BloodRelationEntity] = field(default_factory=list)
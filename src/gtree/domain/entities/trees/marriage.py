@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from datetime import date
+from uuid import UUID
+
+from gtree.domain.entities.base import AssociationBaseEntity
+from gtree.domain.exceptions import DomainValidationException
+
+
+@dataclass(kw_only=True, slots=True)
+class MarriageEntity(AssociationBaseEntity):
+    """Marriage entity linking two individuals."""
+
+    father_id: UUID
+    mother_id: UUID
+    start_date: date | None = field(default=None)
+    end_date: date | None = field(default=None)
+    marriage_place: str | None = field(default=None)
+    notes: str | None = field(default=None)
+
+    def __post_init__(self) -> None:
+        if self.father_id == self.mother_id:
+            raise DomainValidationException("Individual cannot marry themselves")
+        if (
+            self.start_date is not None
+            and self.end_date is not None
+            and self.start_date > self.end_date
+        ):
+            raise DomainValidationException("Start date must be before end date")
+
+    @classmethod
+    def create_marriage(
+        cls,
+        father_id: UUID,
+        mother_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        marriage_place: str | None = None,
+        notes: str | None = None,
+    ) -> "MarriageEntity":
+        """Create a new marriage entity."""
+        try:
+            return cls(
+                father_id=father_id,
+                mother_id=mother_id,
+                start_date=start_date,
+                end_date=end_date,
+                marriage_place=marriage_place,
+                notes=notes,
+            )
+        except DomainValidationException:
+            raise
+
+    def update_marriage(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        marriage_place: str | None = None,
+        notes: str | None = None,
+    ) -> None:
+        self._assign(
+            start_date=start_date,
+            end_date=end_date,
+            marriage_place=marriage_place,
+            notes=notes,
+        )
+        self.__post_init__()
+
+    def __str__(self) -> str:
+        return f"Marriage(father={self.father_id}, mother={self.mother_id})"
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+
+@dataclass(kw_only=True, slots=True)
+class RelationshipEntity:
+    """Named relationship: what `individual_id` is to `other_id`.
+
+    `name` is None when no blood or marital connection is recorded.
+    Generations are counted from each individual up to the closest common
+    ancestors; `via_spouse_id` is set for relationships by marriage.
+    """
+
+    individual_id: UUID
+    other_id: UUID
+    name: str | None
+    generations_up: int | None = None
+    generations_down: int | None = None
+    common_ancestor_ids: list[UUID] = field(default_factory=list)
+    is_half: bool = False
+    via_spouse_id: UUID | None = None
+
+
+@dataclass(kw_only=True, slots=True)
+class RelationshipCoefficientsEntity:
+    """Wright's coefficients for a pair of individuals."""
+
+    individual_id: UUID
+    other_id: UUID
+    kinship: float
+    relationship: float
+    individual_inbreeding: float
+    other_inbreeding: float
+
+
+@dataclass(kw_only=True, slots=True)
+class InbreedingAnnotationEntity:
+    """Outcome of annotating every individual of a tree with its inbreeding."""
+
+    tree_id: UUID
+    annotated: int
+    inbred: int
+    max_inbreeding: float
@@ -10,6 +10,7 @@ class TreeEntity(ObjectBaseEntity):
 
     name: str
     description: str | None = field(default=None)
+    version: int = field(default=0)
 
     def __post_init__(self):
         if not (1 <= len(self.name) <= 128):
@@ -44,8 +45,7 @@ class TreeEntity(ObjectBaseEntity):
     ) -> "TreeEntity":
         """Update a new tree entity."""
         try:
-            self.name = name or self.name
-            self.description = description or self.description
+            self._assign(name=name, description=description)
             self.__post_init__()
             return self
         except DomainValidationException:
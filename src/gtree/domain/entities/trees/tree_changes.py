@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities.trees.blood_relation import BloodRelationEntity
+from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.entities.trees.marriage import MarriageEntity
+
+
+@dataclass(kw_only=True, slots=True)
+class TombstoneEntity:
+    """A deleted record of a tree.
+
+    `key` is the primary key of the record: (id,) for individuals,
+    (parent_id, child_id) for blood relations and (father_id, mother_id)
+    for marriages.
+    """
+
+    kind: RecordKind
+    key: tuple[UUID, ...]
+    deleted_at: datetime
+
+
+@dataclass(kw_only=True, slots=True)
+class TreeChangesEntity:
+    """Records of a tree created, updated or deleted since a point in time.
+
+    `cursor` is the `since` to pass for the next delta; `version` is the tree
+    version the delta was read at.
+    """
+
+    version: int
+    cursor: datetime
+    individuals: list[IndividualEntity] = field(default_factory=list)
+    blood_relations: list[BloodRelationEntity] = field(default_factory=list)
+    marriages: list[MarriageEntity] = field(default_factory=list)
+    deleted: list[TombstoneEntity] = field(default_factory=list)
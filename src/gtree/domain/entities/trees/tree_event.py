@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class TreeEventEntity:
+    """A change to a tree, published to the editors watching it.
+
+    `key` is the primary key of the changed record, as in TombstoneEntity;
+    None when a batch write changed many records at once.
+    """
+
+    tree_id: UUID
+    kind: RecordKind
+    action: ChangeAction
+    key: tuple[UUID, ...] | None = field(default=None)
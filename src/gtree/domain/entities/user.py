@@ -60,7 +60,7 @@ class UserEntity(ObjectBaseEntity):
             raise
 
     def update_last_login(self):
-        self.last_login = get_current_time()
+        self._assign(last_login=get_current_time())
         self.__post_init__()
 
     def __repr__(self) -> str:
@@ -0,0 +1,62 @@
+import calendar
+from datetime import date
+
+from gtree.domain.entities._value_objects.date_precision import DatePrecision
+from gtree.domain.exceptions import DomainValidationException
+
+# Years either side of a date qualified as ABOUT.
+ABOUT_YEARS = 5
+
+# Longest life assumed when only one end of it is known.
+MAX_LIFESPAN_YEARS = 110
+
+
+def date_bounds(value: date, precision: str | None) -> tuple[date | None, date | None]:
+    """Earliest and latest day a stored date with `precision` may stand for.
+
+    None is an open bound (BEFORE and AFTER). Dates without a precision, or
+    with one that is not a DatePrecision, are taken to be exact.
+    """
+    try:
+        parsed = DatePrecision.from_string(precision)
+    except DomainValidationException:
+        parsed = None
+    match parsed:
+        case DatePrecision.MONTH:
+            last_day = calendar.monthrange(value.year, value.month)[1]
+            return value.replace(day=1), value.replace(day=last_day)
+        case DatePrecision.YEAR:
+            return date(value.year, 1, 1), date(value.year, 12, 31)
+        case DatePrecision.ABOUT:
+            return (
+                date(max(value.year - ABOUT_YEARS, 1), 1, 1),
+                date(min(value.year + ABOUT_YEARS, 9999), 12, 31),
+            )
+        case DatePrecision.BEFORE:
+            return None, value
+        case DatePrecision.AFTER:
+            return value, None
+        case _:
+            return value, value
+
+
+def lifespan_bounds(
+    birth: tuple[date | None, date | None] | None,
+    death: tuple[date | None, date | None] | None,
+) -> tuple[date, date] | None:
+    """Earliest and latest day an individual may have been alive.
+
+    `birth` and `death` are `date_bounds` of the dates, None if unknown. An
+    unknown or open end of a life is put MAX_LIFESPAN_YEARS from the nearest
+    known day. None if neither date is known.
+    """
+    known = [day for bounds in (birth, death) if bounds for day in bounds if day]
+    if not known:
+        return None
+    start = birth[0] if birth and birth[0] else None
+    end = death[1] if death and death[1] else None
+    if start is None:
+        start = date(max(max(known).year - MAX_LIFESPAN_YEARS, 1), 1, 1)
+    if end is None:
+        end = date(min(min(known).year + MAX_LIFESPAN_YEARS, 9999), 12, 31)
+    return min(start, min(known)), max(end, max(known))
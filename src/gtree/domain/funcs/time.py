@@ -4,3 +4,10 @@ from datetime import UTC, datetime
 def get_current_time():
     """Returns the current time in UTC without timezone information."""
     return datetime.now(UTC).replace(tzinfo=None)
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Convert a datetime to naive UTC; naive values are taken to be UTC."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
@@ -0,0 +1,141 @@
+from array import array
+from collections import deque
+from math import sqrt
+
+from gtree.domain.graph.tree_graph import TreeGraph
+
+
+def topological_order(graph: TreeGraph) -> list[int]:
+    """Order individuals so that every parent comes before its children.
+
+    Individuals caught in a (corrupt) parent cycle are appended at the end.
+    """
+    size = len(graph)
+    pending = array("i", (len(graph.parents(node)) for node in range(size)))
+    queue = deque(node for node in range(size) if pending[node] == 0)
+    order: list[int] = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for child in graph.children(node):
+            pending[child] -= 1
+            if pending[child] == 0:
+                queue.append(child)
+    if len(order) < size:
+        placed = set(order)
+        order.extend(node for node in range(size) if node not in placed)
+    return order
+
+
+class RelationshipCoefficients:
+    """Wright's kinship, inbreeding and relationship coefficients over a `TreeGraph`.
+
+    Uses the tabular recursion over a topological order instead of
+    enumerating paths through common ancestors, which blows up exponentially
+    under pedigree collapse:
+
+        phi(a, a) = (1 + F(a)) / 2
+        phi(a, b) = (phi(a, father(b)) + phi(a, mother(b))) / 2, b after a
+        F(a)      = phi(father(a), mother(a))
+
+    Every pair is computed once and memoised. Only the first two recorded
+    parents of an individual are considered, and a missing parent is treated
+    as an unrelated founder.
+    """
+
+    def __init__(self, graph: TreeGraph):
+        self.graph = graph
+        self._rank = array("i", [0]) * len(graph)
+        for rank, node in enumerate(topological_order(graph)):
+            self._rank[node] = rank
+        self._kinship: dict[tuple[int, int], float] = {}
+        self._inbreeding: dict[int, float] = {}
+
+    def kinship(self, node: int, other: int) -> float:
+        """Probability that random alleles of both individuals are identical by descent."""
+        if node == other:
+            return (1 + self.inbreeding(node)) / 2
+        key = self._key(node, other)
+        if (cached := self._kinship.get(key)) is not None:
+            return cached
+
+        # Explicit stack instead of recursion: deep pedigrees would otherwise
+        # hit the interpreter recursion limit.
+        stack = [key]
+        while stack:
+            earlier, later = stack[-1]
+            missing = [
+                pair
+                for parent in self._parents(later)
+                if parent != earlier
+                and (pair := self._key(earlier, parent)) not in self._kinship
+            ]
+            if earlier in self._parents(later) and earlier not in self._inbreeding:
+                missing.extend(self._inbreeding_dependencies(earlier))
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            self._kinship[(earlier, later)] = (
+                sum(
+                    self._self_kinship(earlier)
+                    if parent == earlier
+                    else self._kinship[self._key(earlier, parent)]
+                    for parent in self._parents(later)
+                )
+                / 2
+            )
+        return self._kinship[key]
+
+    def inbreeding(self, node: int) -> float:
+        """Inbreeding coefficient F: the kinship of the individual's parents."""
+        if (cached := self._inbreeding.get(node)) is not None:
+            return cached
+        parents = self._parents(node)
+        value = self.kinship(parents[0], parents[1]) if len(parents) == 2 else 0.0
+        self._inbreeding[node] = value
+        return value
+
+    def relationship(self, node: int, other: int) -> float:
+        """Wright's coefficient of relationship, corrected for inbreeding."""
+        if node == other:
+            return 1.0
+        return (
+            2
+            * self.kinship(node, other)
+            / sqrt((1 + self.inbreeding(node)) * (1 + self.inbreeding(other)))
+        )
+
+    def inbreeding_all(self) -> array:
+        """Inbreeding coefficients of every individual, indexed by compact id.
+
+        Individuals are visited in topological order so that every lookup
+        hits pairs memoised for earlier generations.
+        """
+        result = array("d", [0.0]) * len(self.graph)
+        for node in sorted(range(len(self.graph)), key=self._rank.__getitem__):
+            result[node] = self.inbreeding(node)
+        return result
+
+    def _parents(self, node: int) -> list[int]:
+        """First two parents placed before `node`; others would form a cycle."""
+        rank = self._rank[node]
+        return [p for p in self.graph.parents(node) if self._rank[p] < rank][:2]
+
+    def _key(self, node: int, other: int) -> tuple[int, int]:
+        """Order a pair so that the second one cannot be an ancestor of the first."""
+        return (node, other) if self._rank[node] < self._rank[other] else (other, node)
+
+    def _self_kinship(self, node: int) -> float:
+        return (1 + self._inbreeding[node]) / 2
+
+    def _inbreeding_dependencies(self, node: int) -> list[tuple[int, int]]:
+        parents = self._parents(node)
+        if len(parents) != 2:
+            self._inbreeding[node] = 0.0
+            return []
+        pair = self._key(parents[0], parents[1])
+        if pair in self._kinship:
+            self._inbreeding[node] = self._kinship[pair]
+            return []
+        return [pair]
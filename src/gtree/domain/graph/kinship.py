@@ -0,0 +1,218 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from gtree.domain.entities._value_objects.gender import Gender
+from gtree.domain.graph.tree_graph import TreeGraph
+
+_TERMS = {
+    "parent": ("father", "mother", "parent"),
+    "child": ("son", "daughter", "child"),
+    "sibling": ("brother", "sister", "sibling"),
+    "pibling": ("uncle", "aunt", "pibling"),
+    "nibling": ("nephew", "niece", "nibling"),
+    "spouse": ("husband", "wife", "spouse"),
+}
+_ORDINALS = (
+    "first",
+    "second",
+    "third",
+    "fourth",
+    "fifth",
+    "sixth",
+    "seventh",
+    "eighth",
+    "ninth",
+    "tenth",
+)
+_REMOVALS = ("once", "twice", "thrice")
+
+
+def _term(kind: str, gender: Gender) -> str:
+    male, female, other = _TERMS[kind]
+    if gender == Gender.MALE:
+        return male
+    if gender == Gender.FEMALE:
+        return female
+    return other
+
+
+def _ordinal(n: int) -> str:
+    return _ORDINALS[n - 1] if n <= len(_ORDINALS) else f"{n}th"
+
+
+def _removal(n: int) -> str:
+    return _REMOVALS[n - 1] if n <= len(_REMOVALS) else f"{n} times"
+
+
+def name_blood_relationship(up: int, down: int, gender: Gender, half: bool) -> str:
+    """Name what A is to B.
+
+    A is `up` generations and B `down` generations below their closest
+    common ancestor.
+    """
+    if up == 0 and down == 0:
+        return "self"
+    if up == 0 or down == 0:
+        distance = up or down
+        term = _term("parent" if up == 0 else "child", gender)
+        if distance == 1:
+            return term
+        return "great-" * (distance - 2) + "grand" + term
+
+    prefix = "half-" if half else ""
+    if up == 1 and down == 1:
+        return prefix + _term("sibling", gender)
+    if up == 1:
+        return prefix + "great-" * (down - 2) + _term("pibling", gender)
+    if down == 1:
+        return prefix + "great-" * (up - 2) + _term("nibling", gender)
+
+    name = f"{prefix}{_ordinal(min(up, down) - 1)} cousin"
+    if up != down:
+        name += f" {_removal(abs(up - down))} removed"
+    return name
+
+
+@dataclass(kw_only=True, slots=True)
+class Kinship:
+    """What individual `node` is to individual `other`, in compact ids."""
+
+    node: int
+    other: int
+    name: str | None
+    generations_up: int | None = None
+    generations_down: int | None = None
+    common_ancestors: list[int] = field(default_factory=list)
+    is_half: bool = False
+    via_spouse: int | None = None
+
+
+class KinshipIndex:
+    """Lowest-common-ancestor index over a `TreeGraph`.
+
+    A pedigree is a DAG (two parents per person, pedigree collapse), so
+    tree-only LCA schemes do not apply. Instead the index memoises each
+    individual's {ancestor: distance} map and intersects the smaller map with
+    the larger one; both maps and pair results are kept in bounded LRU caches.
+    """
+
+    def __init__(self, graph: TreeGraph, max_cached: int = 4096):
+        self.graph = graph
+        self.max_cached = max_cached
+        self._ancestors: OrderedDict[int, dict[int, int]] = OrderedDict()
+        self._kinships: OrderedDict[tuple[int, int], Kinship] = OrderedDict()
+
+    def ancestors(self, node: int) -> dict[int, int]:
+        """Return {ancestor: distance} for `node`, including itself at distance 0."""
+        if (cached := self._ancestors.get(node)) is not None:
+            self._ancestors.move_to_end(node)
+            return cached
+        ancestors = self.graph.ancestors(node)
+        ancestors[node] = 0
+        self._remember(self._ancestors, node, ancestors)
+        return ancestors
+
+    def lowest_common_ancestors(
+        self, node: int, other: int
+    ) -> tuple[list[int], int, int] | None:
+        """Return (ancestors, distance from node, distance from other) or None.
+
+        Closest means the smallest combined distance, then the most even split.
+        """
+        mine, theirs = self.ancestors(node), self.ancestors(other)
+        smaller, larger = (mine, theirs) if len(mine) <= len(theirs) else (theirs, mine)
+
+        best: tuple[int, int, int, int] | None = None
+        found: list[int] = []
+        for ancestor in smaller:
+            if ancestor not in larger:
+                continue
+            up, down = mine[ancestor], theirs[ancestor]
+            key = (up + down, abs(up - down), up, down)
+            if best is None or key < best:
+                best, found = key, [ancestor]
+            elif key == best:
+                found.append(ancestor)
+        if best is None:
+            return None
+        return found, best[2], best[3]
+
+    def kinship(self, node: int, other: int) -> Kinship:
+        if (cached := self._kinships.get((node, other))) is not None:
+            self._kinships.move_to_end((node, other))
+            return cached
+        result = (
+            self._blood_kinship(node, other)
+            or self._marital_kinship(node, other)
+            or Kinship(node=node, other=other, name=None)
+        )
+        self._remember(self._kinships, (node, other), result)
+        return result
+
+    def _blood_kinship(
+        self, node: int, other: int, *, named_as: int | None = None
+    ) -> Kinship | None:
+        """Blood kinship of `node` to `other`, worded for the gender of `named_as`."""
+        lca = self.lowest_common_ancestors(node, other)
+        if lca is None:
+            return None
+        ancestors, up, down = lca
+        is_half = up > 0 and down > 0 and self._is_half(ancestors)
+        gender = self.graph.gender(node if named_as is None else named_as)
+        return Kinship(
+            node=node,
+            other=other,
+            name=name_blood_relationship(up, down, gender, is_half),
+            generations_up=up,
+            generations_down=down,
+            common_ancestors=ancestors,
+            is_half=is_half,
+        )
+
+    def _marital_kinship(self, node: int, other: int) -> Kinship | None:
+        graph = self.graph
+        gender = graph.gender(node)
+        if other in graph.spouses(node):
+            return Kinship(
+                node=node, other=other, name=_term("spouse", gender), via_spouse=other
+            )
+
+        candidates: list[Kinship] = []
+        # node's spouse is a blood relative of other: in-law or step-parent
+        for spouse in graph.spouses(node):
+            blood = self._blood_kinship(spouse, other, named_as=node)
+            if blood is None:
+                continue
+            if (blood.generations_up, blood.generations_down) == (0, 1):
+                blood.name = "step" + _term("parent", gender)
+            else:
+                blood.name = f"{blood.name}-in-law"
+            blood.node, blood.via_spouse = node, spouse
+            candidates.append(blood)
+        # node is a blood relative of other's spouse: in-law or step-child
+        for spouse in graph.spouses(other):
+            blood = self._blood_kinship(node, spouse)
+            if blood is None:
+                continue
+            if (blood.generations_up, blood.generations_down) == (1, 0):
+                blood.name = "step" + _term("child", gender)
+            else:
+                blood.name = f"{blood.name}-in-law"
+            blood.other, blood.via_spouse = other, spouse
+            candidates.append(blood)
+
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda k: (k.generations_up or 0) + (k.generations_down or 0),
+        )
+
+    def _is_half(self, ancestors: list[int]) -> bool:
+        """A single common ancestor whose recorded spouse is not shared means half-kin."""
+        return len(ancestors) == 1 and len(self.graph.spouses(ancestors[0])) > 0
+
+    def _remember(self, cache: OrderedDict, key: object, value: object) -> None:
+        cache[key] = value
+        if len(cache) > self.max_cached:
+            cache.popitem(last=False)
@@ -0,0 +1,261 @@
+from array import array
+from collections import deque
+from dataclasses import dataclass
+
+from gtree.domain.graph.coefficients import topological_order
+from gtree.domain.graph.tree_graph import TreeGraph
+
+# Horizontal distance between the centres of two neighbouring units.
+_UNIT_GAP = 1.5
+
+
+@dataclass(kw_only=True, slots=True)
+class Layout:
+    """Coordinates indexed by compact ids; `y` is the generation band."""
+
+    x: array
+    y: array
+    marriage_x: array
+    marriage_y: array
+
+    @property
+    def width(self) -> float:
+        return max(self.x, default=0.0)
+
+    @property
+    def height(self) -> int:
+        return max(self.y, default=0)
+
+
+class _Contour:
+    """Leftmost and rightmost occupied x of a subtree in every generation.
+
+    Positions are stored relative to `shift`, so a whole subtree can be moved
+    in O(1), and contours are merged smaller-into-larger.
+    """
+
+    __slots__ = ("rows", "shift")
+
+    def __init__(self, generation: int, width: int):
+        self.rows: dict[int, list[float]] = {generation: [0.0, width - 1.0]}
+        self.shift = 0.0
+
+    def separation(self, right: "_Contour") -> float:
+        """Smallest offset of `right` that keeps it clear of this contour."""
+        smaller, larger = (
+            (self.rows, right.rows)
+            if len(self.rows) <= len(right.rows)
+            else (right.rows, self.rows)
+        )
+        offset = float("-inf")
+        for generation in smaller:
+            if generation in larger:
+                needed = (
+                    self.rows[generation][1]
+                    + self.shift
+                    + _UNIT_GAP
+                    - right.rows[generation][0]
+                    - right.shift
+                )
+                offset = max(offset, needed)
+        return offset
+
+    def merge(self, other: "_Contour") -> "_Contour":
+        """Union of both contours, reusing the larger one."""
+        base, extra = (
+            (self, other) if len(self.rows) >= len(other.rows) else (other, self)
+        )
+        delta = extra.shift - base.shift
+        for generation, (left, right) in extra.rows.items():
+            row = base.rows.get(generation)
+            if row is None:
+                base.rows[generation] = [left + delta, right + delta]
+            else:
+                row[0] = min(row[0], left + delta)
+                row[1] = max(row[1], right + delta)
+        return base
+
+
+def generations(graph: TreeGraph) -> array:
+    """Assign generation bands: parents strictly above children.
+
+    Founders are pulled down next to their earliest child and childless
+    founders next to their spouse, so in-laws share their partner's band.
+    """
+    order = topological_order(graph)
+    generation = array("i", [0]) * len(graph)
+    for node in order:
+        parents = graph.parents(node)
+        if parents:
+            generation[node] = max(generation[p] for p in parents) + 1
+    for node in reversed(order):
+        children = graph.children(node)
+        if not graph.parents(node) and children:
+            generation[node] = min(generation[c] for c in children) - 1
+    for node in order:
+        spouses = graph.spouses(node)
+        if not graph.parents(node) and not graph.children(node) and spouses:
+            generation[node] = generation[spouses[0]]
+
+    lowest = min(generation, default=0)
+    return array("i", (g - lowest for g in generation))
+
+
+def compute_layout(graph: TreeGraph) -> Layout:
+    """Tidy generation-banded layout of a whole pedigree.
+
+    Walker/Buchheim-style: subtrees are laid out bottom-up, pushed apart by
+    comparing their contours in every generation, and parents are centred
+    over their children. To handle two parents and marriages, individuals are
+    grouped into units (a person followed by spouses who married into the
+    tree) and every unit hangs below the unit of its anchor's first parent;
+    the remaining parent links are drawn as cross edges.
+    """
+    size = len(graph)
+    generation = generations(graph)
+    order = topological_order(graph)
+    rank = array("i", [0]) * size
+    for position, node in enumerate(order):
+        rank[node] = position
+
+    units, unit_of = _build_units(graph, order, generation)
+    parent_unit = array("i", [-1]) * len(units)
+    for unit, members in enumerate(units):
+        anchor = members[0]
+        parents = sorted(
+            (p for p in graph.parents(anchor) if rank[p] < rank[anchor]),
+            key=rank.__getitem__,
+        )
+        if parents:
+            parent_unit[unit] = unit_of[parents[0]]
+    visit_order, children = _spanning_forest(parent_unit)
+
+    # Bottom-up: lay out each unit's children side by side, centre the unit
+    # above them and express the children relative to the unit's left edge.
+    contours: list[_Contour | None] = [None] * len(units)
+    offset = array("d", [0.0]) * len(units)
+    for unit in reversed(visit_order):
+        width = len(units[unit])
+        kids = children[unit]
+        own = _Contour(generation[units[unit][0]], width)
+        if kids:
+            placed = _place_side_by_side(kids, contours, offset)
+            first, last = kids[0], kids[-1]
+            centre = (
+                offset[first]
+                + (len(units[first]) - 1) / 2
+                + offset[last]
+                + (len(units[last]) - 1) / 2
+            ) / 2
+            left = centre - (width - 1) / 2
+            for kid in kids:
+                offset[kid] -= left
+            placed.shift -= left
+            own = own.merge(placed)
+        contours[unit] = own
+        for kid in kids:
+            contours[kid] = None
+
+    roots = [unit for unit in visit_order if parent_unit[unit] == -1]
+    _place_side_by_side(roots, contours, offset)
+
+    # Top-down: absolute positions.
+    origin = array("d", [0.0]) * len(units)
+    for unit in visit_order:
+        parent = parent_unit[unit]
+        origin[unit] = offset[unit] + (origin[parent] if parent != -1 else 0.0)
+
+    x = array("d", [0.0]) * size
+    for unit, members in enumerate(units):
+        for position, node in enumerate(members):
+            x[node] = origin[unit] + position
+    leftmost = min(x, default=0.0)
+    for node in range(size):
+        x[node] -= leftmost
+
+    marriage_x = array("d")
+    marriage_y = array("d")
+    for father, mother in graph.marriages():
+        marriage_x.append((x[father] + x[mother]) / 2)
+        marriage_y.append(max(generation[father], generation[mother]))
+    return Layout(x=x, y=generation, marriage_x=marriage_x, marriage_y=marriage_y)
+
+
+def _build_units(
+    graph: TreeGraph, order: list[int], generation: array
+) -> tuple[list[list[int]], array]:
+    """Group every individual with the spouses that married into the tree."""
+    units: list[list[int]] = []
+    unit_of = array("i", [-1]) * len(graph)
+    # Individuals with parents anchor first, so founders join them as in-laws.
+    anchors = [n for n in order if graph.parents(n)]
+    anchors += [n for n in order if not graph.parents(n)]
+    for node in anchors:
+        if unit_of[node] != -1:
+            continue
+        unit = len(units)
+        members = [node]
+        unit_of[node] = unit
+        for spouse in graph.spouses(node):
+            if (
+                unit_of[spouse] == -1
+                and not graph.parents(spouse)
+                and generation[spouse] == generation[node]
+            ):
+                members.append(spouse)
+                unit_of[spouse] = unit
+        units.append(members)
+    return units, unit_of
+
+
+def _spanning_forest(parent_unit: array) -> tuple[list[int], list[list[int]]]:
+    """Breadth-first order and child lists; units caught in cycles become roots."""
+    count = len(parent_unit)
+    children: list[list[int]] = [[] for _ in range(count)]
+    for unit in range(count):
+        if parent_unit[unit] != -1:
+            children[parent_unit[unit]].append(unit)
+
+    visited = bytearray(count)
+    visit_order: list[int] = []
+
+    def visit(root: int) -> None:
+        queue = deque([root])
+        visited[root] = 1
+        while queue:
+            unit = queue.popleft()
+            visit_order.append(unit)
+            for child in children[unit]:
+                if not visited[child]:
+                    visited[child] = 1
+                    queue.append(child)
+
+    for unit in range(count):
+        if parent_unit[unit] == -1:
+            visit(unit)
+    for unit in range(count):
+        if not visited[unit]:
+            children[parent_unit[unit]].remove(unit)
+            parent_unit[unit] = -1
+            visit(unit)
+    return visit_order, children
+
+
+def _place_side_by_side(
+    units: list[int], contours: list[_Contour | None], offset: array
+) -> _Contour:
+    """Set `offset` of each unit left to right and return their merged contour."""
+    merged: _Contour | None = None
+    previous = 0.0
+    for unit in units:
+        contour = contours[unit]
+        if contour is None:
+            continue
+        if merged is None:
+            offset[unit] = 0.0
+        else:
+            offset[unit] = max(previous, merged.separation(contour))
+        contour.shift += offset[unit]
+        previous = offset[unit]
+        merged = contour if merged is None else merged.merge(contour)
+    return merged if merged is not None else _Contour(0, 1)
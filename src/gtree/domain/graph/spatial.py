@@ -0,0 +1,113 @@
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from math import floor
+
+Cell = tuple[int, int]
+
+
+@dataclass(kw_only=True, slots=True)
+class Cluster:
+    """Aggregate of the points that fall into one cell of a coarse grid."""
+
+    count: int
+    x: float
+    y: float
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+
+class GridIndex:
+    """Uniform grid over 2D points for viewport queries.
+
+    Points are bucketed into square cells of `cell_size`; a query visits only
+    the cells overlapping the viewport. Cluster grids for coarser cell sizes
+    are aggregated on first use and kept for later queries.
+    """
+
+    def __init__(self, x: array, y: array, cell_size: float = 16.0):
+        self.x = x
+        self.y = y
+        self.cell_size = cell_size
+        self._cells = self._bucket(cell_size)
+        self._clusters: dict[float, dict[Cell, Cluster]] = {}
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> list[int]:
+        """Return the points inside the rectangle, inclusive."""
+        x, y = self.x, self.y
+        return [
+            point
+            for cell in self._overlapping(self._cells, self.cell_size, x0, y0, x1, y1)
+            for point in self._cells[cell]
+            if x0 <= x[point] <= x1 and y0 <= y[point] <= y1
+        ]
+
+    def clusters(
+        self, x0: float, y0: float, x1: float, y1: float, cell_size: float
+    ) -> list[Cluster]:
+        """Return clusters of `cell_size` cells whose bounds meet the rectangle."""
+        grid = self._clusters.get(cell_size)
+        if grid is None:
+            grid = self._clusters[cell_size] = self._aggregate(cell_size)
+        return [
+            cluster
+            for cell in self._overlapping(grid, cell_size, x0, y0, x1, y1)
+            if (cluster := grid[cell]).x1 >= x0
+            and cluster.x0 <= x1
+            and cluster.y1 >= y0
+            and cluster.y0 <= y1
+        ]
+
+    def _bucket(self, cell_size: float) -> dict[Cell, array]:
+        cells: dict[Cell, array] = {}
+        for point, (px, py) in enumerate(zip(self.x, self.y, strict=True)):
+            cell = (floor(px / cell_size), floor(py / cell_size))
+            bucket = cells.get(cell)
+            if bucket is None:
+                bucket = cells[cell] = array("i")
+            bucket.append(point)
+        return cells
+
+    def _aggregate(self, cell_size: float) -> dict[Cell, Cluster]:
+        grid: dict[Cell, Cluster] = {}
+        for cell, points in self._bucket(cell_size).items():
+            xs = [self.x[p] for p in points]
+            ys = [self.y[p] for p in points]
+            grid[cell] = Cluster(
+                count=len(points),
+                x=sum(xs) / len(points),
+                y=sum(ys) / len(points),
+                x0=min(xs),
+                y0=min(ys),
+                x1=max(xs),
+                y1=max(ys),
+            )
+        return grid
+
+    @staticmethod
+    def _overlapping(
+        grid: dict[Cell, object],
+        cell_size: float,
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+    ) -> Iterator[Cell]:
+        """Occupied cells overlapping the rectangle.
+
+        Walks the rectangle's cells, or the occupied cells when there are fewer
+        of them, so huge viewports stay cheap on sparse grids.
+        """
+        cx0, cy0 = floor(x0 / cell_size), floor(y0 / cell_size)
+        cx1, cy1 = floor(x1 / cell_size), floor(y1 / cell_size)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(grid):
+            for cell in grid:
+                if cx0 <= cell[0] <= cx1 and cy0 <= cell[1] <= cy1:
+                    yield cell
+            return
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                if (cx, cy) in grid:
+                    yield cx, cy
@@ -0,0 +1,228 @@
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+import hashlib
+from itertools import chain
+from uuid import UUID
+
+from gtree.domain.entities._value_objects.gender import Gender
+
+Edge = tuple[int, int]
+
+
+def _build_csr(size: int, edges: list[Edge]) -> tuple[array, array]:
+    """Pack directed edges into CSR (offsets, targets) arrays via counting sort."""
+    offsets = array("i", [0]) * (size + 1)
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+
+    targets = array("i", [0]) * len(edges)
+    cursor = offsets[:-1]
+    for source, target in edges:
+        targets[cursor[source]] = target
+        cursor[source] += 1
+    return offsets, targets
+
+
+class TreeGraph:
+    """In-memory graph of a single tree.
+
+    Individuals are addressed by compact integer ids (their position in `ids`).
+    Parents, children and spouses are stored as CSR adjacency arrays, so
+    membership checks are O(1) and neighbour lookups are O(degree).
+    """
+
+    __slots__ = (
+        "_child_offsets",
+        "_children",
+        "_fathers",
+        "_genders",
+        "_index",
+        "_mothers",
+        "_parent_offsets",
+        "_parents",
+        "_spouse_offsets",
+        "_spouses",
+        "_wife_offsets",
+        "_wives",
+        "ids",
+    )
+
+    def __init__(
+        self,
+        ids: list[UUID],
+        blood_relations: list[Edge],
+        marriages: list[Edge],
+        genders: list[Gender] | None = None,
+    ):
+        self.ids = ids
+        self._genders = genders or [Gender.OTHER] * len(ids)
+        self._index = {individual_id: i for i, individual_id in enumerate(ids)}
+
+        size = len(ids)
+        self._child_offsets, self._children = _build_csr(size, blood_relations)
+        self._parent_offsets, self._parents = _build_csr(
+            size, [(child, parent) for parent, child in blood_relations]
+        )
+        self._spouse_offsets, self._spouses = _build_csr(
+            size, marriages + [(mother, father) for father, mother in marriages]
+        )
+        self._wife_offsets, self._wives = _build_csr(size, marriages)
+        self._fathers = array("i", (father for father, _ in marriages))
+        self._mothers = array("i", (mother for _, mother in marriages))
+
+    @classmethod
+    def build(
+        cls,
+        individuals: Iterable[tuple[UUID, str | None]],
+        blood_relations: Iterable[tuple[UUID, UUID]],
+        marriages: Iterable[tuple[UUID, UUID]],
+    ) -> "TreeGraph":
+        """Build a graph from (id, gender) rows and (parent, child) / (father, mother) pairs.
+
+        Edges referencing unknown individuals are dropped.
+        """
+        ids: list[UUID] = []
+        genders: list[Gender] = []
+        for individual_id, gender in individuals:
+            ids.append(individual_id)
+            genders.append(Gender.from_string(gender))
+        index = {individual_id: i for i, individual_id in enumerate(ids)}
+        return cls(
+            ids,
+            [
+                (index[parent], index[child])
+                for parent, child in blood_relations
+                if parent in index and child in index
+            ],
+            [
+                (index[father], index[mother])
+                for father, mother in marriages
+                if father in index and mother in index
+            ],
+            genders,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, individual_id: object) -> bool:
+        return individual_id in self._index
+
+    def index_of(self, individual_id: UUID) -> int:
+        """Return the compact id of an individual. Raises KeyError if unknown."""
+        return self._index[individual_id]
+
+    def fingerprint(self) -> bytes:
+        """Digest of the individuals and edges, for caching derived data."""
+        digest = hashlib.blake2b(digest_size=16)
+        for individual_id in self.ids:
+            digest.update(individual_id.bytes)
+        for part in (
+            self._child_offsets,
+            self._children,
+            self._fathers,
+            self._mothers,
+        ):
+            digest.update(part.tobytes())
+        return digest.digest()
+
+    def gender(self, node: int) -> Gender:
+        return self._genders[node]
+
+    def parents(self, node: int) -> array:
+        return self._parents[
+            self._parent_offsets[node] : self._parent_offsets[node + 1]
+        ]
+
+    def children(self, node: int) -> array:
+        return self._children[self._child_offsets[node] : self._child_offsets[node + 1]]
+
+    def spouses(self, node: int) -> array:
+        return self._spouses[
+            self._spouse_offsets[node] : self._spouse_offsets[node + 1]
+        ]
+
+    def wives(self, node: int) -> array:
+        """Spouses of `node` in marriages where it is the father."""
+        return self._wives[self._wife_offsets[node] : self._wife_offsets[node + 1]]
+
+    def blood_relations(self) -> Iterator[Edge]:
+        """Iterate over (parent, child) pairs of compact ids."""
+        offsets, children = self._child_offsets, self._children
+        for parent in range(len(self.ids)):
+            for i in range(offsets[parent], offsets[parent + 1]):
+                yield parent, children[i]
+
+    def marriages(self) -> Iterator[Edge]:
+        """Iterate over (father, mother) pairs of compact ids."""
+        return zip(self._fathers, self._mothers, strict=True)
+
+    def ancestors(self, node: int, max_depth: int | None = None) -> dict[int, int]:
+        """Return {ancestor: generation distance} using breadth-first search."""
+        return self._walk(node, self._parent_offsets, self._parents, max_depth)
+
+    def descendants(self, node: int, max_depth: int | None = None) -> dict[int, int]:
+        """Return {descendant: generation distance} using breadth-first search."""
+        return self._walk(node, self._child_offsets, self._children, max_depth)
+
+    def is_ancestor(self, ancestor: int, descendant: int) -> bool:
+        return ancestor in self.ancestors(descendant)
+
+    def would_create_cycle(self, blood_relations: Iterable[Edge]) -> bool:
+        """Whether adding (parent, child) edges makes someone their own ancestor.
+
+        One topological sort over the existing and new edges, O(V + E) however
+        many edges are added. If the graph already has a (corrupt) cycle, the
+        edges are rejected only if they leave more individuals unordered than
+        before, which includes edges hanging new children below that cycle.
+        """
+        extra: dict[int, list[int]] = {}
+        for parent, child in blood_relations:
+            extra.setdefault(parent, []).append(child)
+        if not extra:
+            return False
+        sortable = self._count_sortable(extra)
+        return sortable < len(self.ids) and sortable < self._count_sortable({})
+
+    def _count_sortable(self, extra: dict[int, list[int]]) -> int:
+        """Number of nodes Kahn's algorithm orders, i.e. not in or under a cycle."""
+        offsets = self._parent_offsets
+        pending = array(
+            "i", (offsets[node + 1] - offsets[node] for node in range(len(self.ids)))
+        )
+        for children in extra.values():
+            for child in children:
+                pending[child] += 1
+        queue = deque(node for node in range(len(self.ids)) if pending[node] == 0)
+        count = 0
+        while queue:
+            node = queue.popleft()
+            count += 1
+            for child in chain(self.children(node), extra.get(node, ())):
+                pending[child] -= 1
+                if pending[child] == 0:
+                    queue.append(child)
+        return count
+
+    @staticmethod
+    def _walk(
+        node: int,
+        offsets: array,
+        targets: array,
+        max_depth: int | None,
+    ) -> dict[int, int]:
+        depths: dict[int, int] = {}
+        queue = deque([(node, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for i in range(offsets[current], offsets[current + 1]):
+                target = targets[i]
+                if target not in depths and target != node:
+                    depths[target] = depth + 1
+                    queue.append((target, depth + 1))
+        return depths
@@ -0,0 +1,367 @@
+"""Record linkage of the individuals of a tree.
+
+Comparing every pair of a large tree is out of the question, so individuals
+are first grouped into blocks by a blocking key: a phonetic code of the last
+name (or of the first name if there is none) and the decade of birth.
+Individuals without a birth date are blocked by name code alone and compared
+with the dated individuals of that code too. Only pairs sharing a block are
+scored, on names, dates and places.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from difflib import SequenceMatcher
+import re
+from typing import TYPE_CHECKING
+
+from gtree.domain.entities._value_objects.gender import Gender
+from gtree.domain.entities.trees.duplicate_scan import DuplicateSuggestionEntity
+from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.funcs.dates import date_bounds
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+# Phonetic codes of a name, e.g. its Daitch–Mokotoff codes.
+Phonetic = Callable[[str], set[str]]
+
+# Dates of one person further apart than this are taken to be of different
+# people; birth dates are widened by it when assigning birth decades.
+MAX_DATE_GAP_YEARS = 2
+# Open bounds (BEFORE, AFTER) are taken to reach this far.
+_OPEN_BOUND_YEARS = 10
+# Similarity of names that are spelled differently but sound alike.
+_PHONETIC_MATCH = 0.85
+
+_NAME_WEIGHTS = (("first_name", 0.4), ("last_name", 0.4), ("patronymic", 0.2))
+_NAME_WEIGHT = 0.6
+_DATE_WEIGHT = 0.3
+_PLACE_WEIGHT = 0.1
+
+# Score of the dates or places of a pair when either record has none.
+_UNKNOWN = 0.5
+
+_DAYS_PER_YEAR = 365.25
+_WORD = re.compile(r"\w+")
+_NAME_SEPARATOR = re.compile(r"[\s\-]+")
+
+# Fields counted to pick the better documented record of a pair.
+_DETAIL_FIELDS = (
+    "last_name",
+    "patronymic",
+    "birth_date",
+    "death_date",
+    "birth_place",
+    "death_place",
+    "bio",
+    "avatar_url",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BlockKey:
+    """Phonetic name code and birth decade; None for unknown birth dates."""
+
+    code: str
+    decade: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class Block:
+    """Individuals sharing a blocking key.
+
+    `dated` holds, for an undated block, the dated individuals of the same
+    name code; they are compared with the members but not with each other.
+    """
+
+    key: BlockKey
+    members: tuple[IndividualEntity, ...]
+    dated: tuple[IndividualEntity, ...] = ()
+
+    def pairs(self) -> Iterator[tuple[IndividualEntity, IndividualEntity]]:
+        for i, individual in enumerate(self.members):
+            for other in self.members[i + 1 :]:
+                yield individual, other
+            for other in self.dated:
+                yield individual, other
+
+
+@dataclass(frozen=True, slots=True)
+class PairScore:
+    score: float
+    name: float
+    dates: float | None
+    places: float | None
+
+
+class DuplicateFinder:
+    """Finds likely duplicate individuals block by block.
+
+    Build it, pass each of `blocks` to `scan_block` (so a caller can report
+    progress in between), then read the ranked `suggestions`. Blocks with
+    more than `max_block_size` members, typically a very common surname in
+    one decade or without birth dates, are skipped and counted in
+    `skipped_blocks`. The dated individuals an undated block is compared
+    with do not count towards its size.
+    """
+
+    def __init__(
+        self,
+        individuals: Iterable[IndividualEntity],
+        phonetic: Phonetic,
+        *,
+        min_score: float,
+        max_block_size: int,
+    ):
+        self._phonetic = phonetic
+        self._min_score = min_score
+        self.compared_pairs = 0
+        self.skipped_blocks = 0
+        self._compared: set[tuple[UUID, UUID]] = set()
+        self._matches: dict[tuple[UUID, UUID], DuplicateSuggestionEntity] = {}
+
+        members: dict[BlockKey, list[IndividualEntity]] = {}
+        # Dated individuals by name code, each once whatever their decades.
+        dated: dict[str, dict[UUID, IndividualEntity]] = {}
+        for individual in individuals:
+            for key in blocking_keys(individual, phonetic):
+                members.setdefault(key, []).append(individual)
+                if key.decade is not None:
+                    dated.setdefault(key.code, {})[individual.id] = individual
+        self.blocks: list[Block] = []
+        for key, block_members in members.items():
+            block_dated = (
+                tuple(dated.get(key.code, {}).values()) if key.decade is None else ()
+            )
+            if len(block_members) + len(block_dated) < 2:
+                continue
+            if len(block_members) > max_block_size:
+                self.skipped_blocks += 1
+                continue
+            self.blocks.append(
+                Block(key=key, members=tuple(block_members), dated=block_dated)
+            )
+
+    def scan_block(self, block: Block) -> None:
+        for individual, other in block.pairs():
+            pair = (
+                (individual.id, other.id)
+                if individual.id < other.id
+                else (other.id, individual.id)
+            )
+            # An individual with several codes or decades is in several blocks.
+            if pair in self._compared:
+                continue
+            self._compared.add(pair)
+            self.compared_pairs += 1
+
+            score = score_pair(individual, other, self._phonetic)
+            if score is None or score.score < self._min_score:
+                continue
+            keep, drop = _keep_and_drop(individual, other)
+            self._matches[pair] = DuplicateSuggestionEntity(
+                individual_id=keep.id,
+                duplicate_id=drop.id,
+                score=score.score,
+                name_score=score.name,
+                date_score=score.dates,
+                place_score=score.places,
+            )
+
+    def suggestions(self, limit: int) -> list[DuplicateSuggestionEntity]:
+        """The best `limit` suggestions, best first."""
+        return sorted(
+            self._matches.values(),
+            key=lambda s: (-s.score, s.individual_id, s.duplicate_id),
+        )[:limit]
+
+
+def blocking_keys(individual: IndividualEntity, phonetic: Phonetic) -> set[BlockKey]:
+    """Blocks an individual is compared in.
+
+    One block per name code and decade the birth may fall in, or per name
+    code alone (an undated block) for individuals without a birth date.
+    """
+    name = individual.last_name or individual.first_name
+    codes: set[str] = set()
+    for word in _NAME_SEPARATOR.split(name):
+        if word:
+            codes |= phonetic(word)
+    decades: list[int | None] = list(_birth_decades(individual)) or [None]
+    return {BlockKey(code=code, decade=decade) for code in codes for decade in decades}
+
+
+def score_pair(
+    individual: IndividualEntity, other: IndividualEntity, phonetic: Phonetic
+) -> PairScore | None:
+    """Likelihood from 0 to 1 that two records describe the same person.
+
+    None if they cannot: different genders, or birth or death dates too far
+    apart even allowing for their precision.
+    """
+    if (
+        _known_gender(individual)
+        and _known_gender(other)
+        and individual.gender != other.gender
+    ):
+        return None
+
+    dates = _mean(
+        _date_similarity(
+            individual.birth_date,
+            individual.birth_date_precision,
+            other.birth_date,
+            other.birth_date_precision,
+        ),
+        _date_similarity(
+            individual.death_date,
+            individual.death_date_precision,
+            other.death_date,
+            other.death_date_precision,
+        ),
+        reject_zero=True,
+    )
+    if dates == 0.0:
+        return None
+
+    name = _weighted(
+        (_name_similarity(getattr(individual, f), getattr(other, f), phonetic), w)
+        for f, w in _NAME_WEIGHTS
+    )
+    places = _mean(
+        _place_similarity(individual.birth_place, other.birth_place, phonetic),
+        _place_similarity(individual.death_place, other.death_place, phonetic),
+    )
+    # Missing dates or places neither support nor contradict a match.
+    score = _weighted(
+        (
+            (name, _NAME_WEIGHT),
+            (dates if dates is not None else _UNKNOWN, _DATE_WEIGHT),
+            (places if places is not None else _UNKNOWN, _PLACE_WEIGHT),
+        )
+    )
+    return PairScore(score=score, name=name, dates=dates, places=places)
+
+
+def _birth_decades(individual: IndividualEntity) -> range:
+    if individual.birth_date is None:
+        return range(0)
+    earliest, latest = _year_bounds(
+        individual.birth_date, individual.birth_date_precision
+    )
+    return range(
+        (earliest - MAX_DATE_GAP_YEARS) // 10, (latest + MAX_DATE_GAP_YEARS) // 10 + 1
+    )
+
+
+def _year_bounds(value: date, precision: str | None) -> tuple[int, int]:
+    earliest, latest = date_bounds(value, precision)
+    return (
+        earliest.year if earliest is not None else value.year - _OPEN_BOUND_YEARS,
+        latest.year if latest is not None else value.year + _OPEN_BOUND_YEARS,
+    )
+
+
+def _known_gender(individual: IndividualEntity) -> bool:
+    return individual.gender in (Gender.MALE, Gender.FEMALE)
+
+
+def _name_similarity(
+    name: str | None, other: str | None, phonetic: Phonetic
+) -> float | None:
+    if not name or not other:
+        return None
+    name, other = " ".join(name.lower().split()), " ".join(other.lower().split())
+    if name == other:
+        return 1.0
+    similarity = SequenceMatcher(None, name, other).ratio()
+    if phonetic(name) & phonetic(other):
+        return max(similarity, _PHONETIC_MATCH)
+    return similarity
+
+
+def _date_similarity(
+    value: date | None,
+    precision: str | None,
+    other: date | None,
+    other_precision: str | None,
+) -> float | None:
+    """1 for equal exact dates, less the vaguer the dates, 0 if too far apart."""
+    if value is None or other is None:
+        return None
+    earliest, latest = _day_bounds(value, precision)
+    other_earliest, other_latest = _day_bounds(other, other_precision)
+    gap = max(0, (other_earliest - latest).days, (earliest - other_latest).days)
+    max_gap = MAX_DATE_GAP_YEARS * _DAYS_PER_YEAR
+    if gap > max_gap:
+        return 0.0
+    if gap > 0:
+        return 0.5 * (1 - gap / max_gap)
+    width = max((latest - earliest).days, (other_latest - other_earliest).days)
+    return max(0.6, 1 - 0.1 * width / _DAYS_PER_YEAR)
+
+
+def _day_bounds(value: date, precision: str | None) -> tuple[date, date]:
+    earliest, latest = date_bounds(value, precision)
+    return (
+        earliest
+        if earliest is not None
+        else value.replace(year=max(value.year - _OPEN_BOUND_YEARS, 1), day=1),
+        latest
+        if latest is not None
+        else value.replace(year=min(value.year + _OPEN_BOUND_YEARS, 9999), day=1),
+    )
+
+
+def _place_similarity(
+    place: str | None, other: str | None, phonetic: Phonetic
+) -> float | None:
+    """Share of the words of the shorter place that sound like one of the other."""
+    words = _WORD.findall(place.lower()) if place else []
+    other_words = _WORD.findall(other.lower()) if other else []
+    if not words or not other_words:
+        return None
+    if len(words) > len(other_words):
+        words, other_words = other_words, words
+    other_codes = [phonetic(word) for word in other_words]
+    matched = sum(
+        1
+        for word in words
+        if word in other_words or any(phonetic(word) & codes for codes in other_codes)
+    )
+    return matched / len(words)
+
+
+def _mean(*values: float | None, reject_zero: bool = False) -> float | None:
+    known = [value for value in values if value is not None]
+    if not known:
+        return None
+    if reject_zero and 0.0 in known:
+        return 0.0
+    return sum(known) / len(known)
+
+
+def _weighted(values: Iterable[tuple[float | None, float]]) -> float:
+    """Weighted mean of the known values; first names are always known."""
+    known = [(value, weight) for value, weight in values if value is not None]
+    total = sum(weight for _, weight in known)
+    if not total:
+        return 0.0
+    return sum(value * weight for value, weight in known) / total
+
+
+def _keep_and_drop(
+    individual: IndividualEntity, other: IndividualEntity
+) -> tuple[IndividualEntity, IndividualEntity]:
+    """The better documented record first, the older one on a tie."""
+
+    def rank(candidate: IndividualEntity) -> tuple[int, float]:
+        details = sum(
+            1 for field in _DETAIL_FIELDS if getattr(candidate, field) is not None
+        )
+        return details, -candidate.created_at.timestamp()
+
+    return (
+        (individual, other) if rank(individual) >= rank(other) else (other, individual)
+    )
@@ -0,0 +1,59 @@
+"""Annotate individuals with their inbreeding coefficients.
+
+Usage:
+    python -m gtree.infrastructure.db.commands.annotate_inbreeding [TREE_ID ...]
+
+Recomputes the coefficients of the given trees, or of every tree when none
+are given. Each tree is annotated and committed in its own transaction.
+"""
+
+import asyncio
+import sys
+from uuid import UUID
+
+from sqlalchemy import select
+import structlog
+
+from gtree.application.services.trees.relationship_service import RelationshipService
+from gtree.core.logging import setup_logging
+from gtree.infrastructure.db.models.trees.tree import TreeModel
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.repositories.trees.tree_access import TreeAccessRepository
+from gtree.infrastructure.db.repositories.trees.tree_graph import TreeGraphRepository
+from gtree.infrastructure.db.session import engine, session_factory
+from gtree.infrastructure.db.unit_of_work import UnitOfWork
+
+logger = structlog.get_logger(__name__)
+
+
+async def annotate(tree_ids: list[UUID]) -> None:
+    if not tree_ids:
+        async with session_factory() as session:
+            tree_ids = list(await session.scalars(select(TreeModel.id)))
+
+    for tree_id in tree_ids:
+        async with UnitOfWork(session_factory) as uow:
+            service = RelationshipService(
+                TreeGraphRepository(uow.session),
+                IndividualRepository(uow.session),
+                TreeAccessRepository(uow.session),
+            )
+            result = await service.annotate_tree_inbreeding(tree_id)
+        logger.info(
+            "Inbreeding coefficients annotated",
+            tree_id=str(tree_id),
+            annotated=result.annotated,
+            inbred=result.inbred,
+            max_inbreeding=result.max_inbreeding,
+        )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    setup_logging()
+    asyncio.run(annotate([UUID(arg) for arg in sys.argv[1:]]))
+
+
+if __name__ == "__main__":
+    main()
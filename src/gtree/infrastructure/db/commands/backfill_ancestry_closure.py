@@ -0,0 +1,47 @@
+"""Backfill the `ancestry_closure` table.
+
+Usage:
+    python -m gtree.infrastructure.db.commands.backfill_ancestry_closure [TREE_ID ...]
+
+Rebuilds the closure of the given trees, or of every tree when none are given.
+Each tree is rebuilt and committed in its own transaction.
+"""
+
+import asyncio
+import sys
+from uuid import UUID
+
+from sqlalchemy import select
+import structlog
+
+from gtree.core.logging import setup_logging
+from gtree.infrastructure.db.models.trees.tree import TreeModel
+from gtree.infrastructure.db.repositories.trees.ancestry_closure import (
+    AncestryClosureRepository,
+)
+from gtree.infrastructure.db.session import engine, session_factory
+from gtree.infrastructure.db.unit_of_work import UnitOfWork
+
+logger = structlog.get_logger(__name__)
+
+
+async def backfill(tree_ids: list[UUID]) -> None:
+    if not tree_ids:
+        async with session_factory() as session:
+            tree_ids = list(await session.scalars(select(TreeModel.id)))
+
+    for tree_id in tree_ids:
+        async with UnitOfWork(session_factory) as uow:
+            rows = await AncestryClosureRepository(uow.session).rebuild(tree_id)
+        logger.info("Ancestry closure rebuilt", tree_id=str(tree_id), rows=rows)
+
+    await engine.dispose()
+
+
+def main() -> None:
+    setup_logging()
+    asyncio.run(backfill([UUID(arg) for arg in sys.argv[1:]]))
+
+
+if __name__ == "__main__":
+    main()
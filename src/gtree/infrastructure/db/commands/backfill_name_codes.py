@@ -0,0 +1,45 @@
+"""Backfill the phonetic name codes of individuals.
+
+Usage:
+    python -m gtree.infrastructure.db.commands.backfill_name_codes [TREE_ID ...]
+
+Recomputes the codes of the given trees, or of every tree when none are
+given. Each tree is updated and committed in its own transaction.
+"""
+
+import asyncio
+import sys
+from uuid import UUID
+
+from sqlalchemy import select
+import structlog
+
+from gtree.core.logging import setup_logging
+from gtree.infrastructure.db.models.trees.tree import TreeModel
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.session import engine, session_factory
+from gtree.infrastructure.db.unit_of_work import UnitOfWork
+
+logger = structlog.get_logger(__name__)
+
+
+async def backfill(tree_ids: list[UUID]) -> None:
+    if not tree_ids:
+        async with session_factory() as session:
+            tree_ids = list(await session.scalars(select(TreeModel.id)))
+
+    for tree_id in tree_ids:
+        async with UnitOfWork(session_factory) as uow:
+            rows = await IndividualRepository(uow.session).refresh_name_codes(tree_id)
+        logger.info("Name codes backfilled", tree_id=str(tree_id), rows=rows)
+
+    await engine.dispose()
+
+
+def main() -> None:
+    setup_logging()
+    asyncio.run(backfill([UUID(arg) for arg in sys.argv[1:]]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Background search for duplicate individuals in a tree.
+
+The tree is loaded in one short transaction and compared without holding a
+connection; progress and the final suggestions are written in transactions
+of their own, so clients polling the scan see them as they happen.
+"""
+
+import asyncio
+from contextlib import suppress
+import time
+from uuid import UUID
+
+import structlog
+
+from gtree.core.config.settings import settings
+from gtree.domain.entities.trees.duplicate_scan import DuplicateScanEntity
+from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.linkage.duplicates import DuplicateFinder
+from gtree.infrastructure.db.repositories.trees.duplicate_scan import (
+    DuplicateScanRepository,
+)
+from gtree.infrastructure.db.repositories.trees.individual import IndividualRepository
+from gtree.infrastructure.db.session import session_factory
+from gtree.infrastructure.db.unit_of_work import UnitOfWork
+from gtree.infrastructure.utils.phonetics import soundex_codes
+
+logger = structlog.get_logger(__name__)
+
+# Seconds between progress updates of a running scan.
+_PROGRESS_INTERVAL = 2.0
+
+
+async def run_duplicate_scan(scan_id: UUID) -> None:
+    async with UnitOfWork(session_factory) as uow:
+        scan = await DuplicateScanRepository(uow.session).get_by_id(scan_id)
+        individuals = await IndividualRepository(uow.session).get_by_tree_id(
+            scan.tree_id
+        )
+
+    try:
+        await _scan(scan, [i for i in individuals if i.is_active])
+    except asyncio.CancelledError:
+        scan.fail("Interrupted by a shutdown")
+        with suppress(Exception):
+            await _save_state(scan)
+        raise
+    except Exception as e:
+        logger.exception("Duplicate scan failed", scan_id=str(scan_id))
+        scan.fail(str(e))
+        await _save_state(scan)
+    else:
+        logger.info(
+            "Duplicate scan completed",
+            scan_id=str(scan_id),
+            tree_id=str(scan.tree_id),
+            compared_pairs=scan.compared_pairs,
+            suggestions=len(scan.suggestions),
+        )
+
+
+async def _scan(scan: DuplicateScanEntity, individuals: list[IndividualEntity]) -> None:
+    finder = DuplicateFinder(
+        individuals,
+        soundex_codes,
+        min_score=settings.app.duplicate_scan_min_score,
+        max_block_size=settings.app.duplicate_scan_max_block_size,
+    )
+    if finder.skipped_blocks:
+        logger.warning(
+            "Duplicate scan skipped oversized blocks",
+            scan_id=str(scan.id),
+            skipped_blocks=finder.skipped_blocks,
+        )
+    scan.start(len(finder.blocks))
+    await _save_state(scan)
+
+    reported_at = time.monotonic()
+    for processed, block in enumerate(finder.blocks, 1):
+        # Scoring is CPU-bound; a thread keeps the event loop serving requests.
+        await asyncio.to_thread(finder.scan_block, block)
+        if time.monotonic() - reported_at >= _PROGRESS_INTERVAL:
+            scan.advance(processed, finder.compared_pairs)
+            await _save_state(scan)
+            reported_at = time.monotonic()
+
+    scan.advance(len(finder.blocks), finder.compared_pairs)
+    suggestions = finder.suggestions(settings.app.duplicate_scan_max_suggestions)
+    async with UnitOfWork(session_factory) as uow:
+        # Individuals deleted while the scan ran cannot be suggested.
+        existing = await IndividualRepository(uow.session).get_ids_in_tree(
+            scan.tree_id,
+            {s.individual_id for s in suggestions}
+            | {s.duplicate_id for s in suggestions},
+        )
+        scan.complete(
+            [
+                s
+                for s in suggestions
+                if s.individual_id in existing and s.duplicate_id in existing
+            ]
+        )
+        await DuplicateScanRepository(uow.session).save_state(scan)
+
+
+async def _save_state(scan: DuplicateScanEntity) -> None:
+    async with UnitOfWork(session_factory) as uow:
+        await DuplicateScanRepository(uow.session).save_state(scan)
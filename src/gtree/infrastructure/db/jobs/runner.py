@@ -0,0 +1,40 @@
+"""Background jobs of a worker process.
+
+Jobs run as tasks on the worker's event loop, outside of any request. They
+open their own units of work and record their state in the database, so
+clients poll it from whichever worker they reach. A job interrupted by a
+shutdown is cancelled; it records that if it can.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class BackgroundJobs:
+    def __init__(self):
+        # The event loop only keeps weak references to tasks.
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def spawn(self, job: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(job)
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+
+    async def close(self) -> None:
+        tasks, self._tasks = self._tasks, set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and (error := task.exception()) is not None:
+            logger.error("Background job failed", exc_info=error)
+
+
+background_jobs = BackgroundJobs()
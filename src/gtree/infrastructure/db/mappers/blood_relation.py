@@ -0,0 +1,24 @@
+from gtree.domain.entities.trees.blood_relation import BloodRelationEntity
+from gtree.infrastructure.db.models.trees.blood_relation import BloodRelationModel
+
+
+class BloodRelationMapper:
+    @classmethod
+    def entity_to_model(cls, entity: BloodRelationEntity) -> BloodRelationModel:
+        return BloodRelationModel(
+            parent_id=entity.parent_id,
+            child_id=entity.child_id,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+            is_active=entity.is_active,
+        )
+
+    @classmethod
+    def model_to_entity(cls, model: BloodRelationModel) -> BloodRelationEntity:
+        return BloodRelationEntity(
+            parent_id=model.parent_id,
+            child_id=model.child_id,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            is_active=model.is_active,
+        )
@@ -0,0 +1,74 @@
+from uuid import UUID
+
+from gtree.domain.entities._value_objects.job_status import JobStatus
+from gtree.domain.entities.trees.duplicate_scan import (
+    DuplicateScanEntity,
+    DuplicateSuggestionEntity,
+)
+from gtree.infrastructure.db.models.trees.duplicate_scan import (
+    DuplicateScanModel,
+    DuplicateSuggestionModel,
+)
+
+
+class DuplicateScanMapper:
+    @classmethod
+    def entity_to_model(cls, entity: DuplicateScanEntity) -> DuplicateScanModel:
+        return DuplicateScanModel(
+            id=entity.id,
+            tree_id=entity.tree_id,
+            status=str(entity.status),
+            processed_blocks=entity.processed_blocks,
+            total_blocks=entity.total_blocks,
+            compared_pairs=entity.compared_pairs,
+            error=entity.error,
+            finished_at=entity.finished_at,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+            is_active=entity.is_active,
+        )
+
+    @classmethod
+    def model_to_entity(cls, model: DuplicateScanModel) -> DuplicateScanEntity:
+        return DuplicateScanEntity(
+            id=model.id,
+            tree_id=model.tree_id,
+            status=JobStatus(model.status),
+            processed_blocks=model.processed_blocks,
+            total_blocks=model.total_blocks,
+            compared_pairs=model.compared_pairs,
+            error=model.error,
+            finished_at=model.finished_at,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            is_active=model.is_active,
+        )
+
+
+class DuplicateSuggestionMapper:
+    @classmethod
+    def entity_to_model(
+        cls, scan_id: UUID, entity: DuplicateSuggestionEntity
+    ) -> DuplicateSuggestionModel:
+        return DuplicateSuggestionModel(
+            scan_id=scan_id,
+            individual_id=entity.individual_id,
+            duplicate_id=entity.duplicate_id,
+            score=entity.score,
+            name_score=entity.name_score,
+            date_score=entity.date_score,
+            place_score=entity.place_score,
+        )
+
+    @classmethod
+    def model_to_entity(
+        cls, model: DuplicateSuggestionModel
+    ) -> DuplicateSuggestionEntity:
+        return DuplicateSuggestionEntity(
+            individual_id=model.individual_id,
+            duplicate_id=model.duplicate_id,
+            score=model.score,
+            name_score=model.name_score,
+            date_score=model.date_score,
+            place_score=model.place_score,
+        )
@@ -1,11 +1,23 @@
+from datetime import date
+
+from sqlalchemy.dialects.postgresql import Range
+
 from gtree.domain.entities._value_objects.gender import Gender
 from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.funcs.dates import date_bounds, lifespan_bounds
 from gtree.infrastructure.db.models.trees.individual import IndividualModel
+from gtree.infrastructure.utils.phonetics import name_codes
 
 
 class IndividualMapper:
     @classmethod
     def entity_to_model(cls, entity: IndividualEntity) -> IndividualModel:
+        birth_range, death_range, lifespan = cls.date_ranges(
+            entity.birth_date,
+            entity.birth_date_precision,
+            entity.death_date,
+            entity.death_date_precision,
+        )
         return IndividualModel(
             id=entity.id,
             tree_id=entity.tree_id,
@@ -17,10 +29,17 @@ class IndividualMapper:
             birth_date_precision=entity.birth_date_precision,
             death_date=entity.death_date,
             death_date_precision=entity.death_date_precision,
+            birth_range=birth_range,
+            death_range=death_range,
+            lifespan=lifespan,
             birth_place=entity.birth_place,
             death_place=entity.death_place,
             bio=entity.bio,
             avatar_url=entity.avatar_url,
+            inbreeding_coefficient=entity.inbreeding_coefficient,
+            name_codes=name_codes(
+                entity.first_name, entity.patronymic, entity.last_name
+            ),
             created_at=entity.created_at,
             updated_at=entity.updated_at,
             is_active=entity.is_active,
@@ -43,7 +62,33 @@ class IndividualMapper:
             death_place=model.death_place,
             bio=model.bio,
             avatar_url=model.avatar_url,
+            inbreeding_coefficient=model.inbreeding_coefficient,
             created_at=model.created_at,
             updated_at=model.updated_at,
             is_active=model.is_active,
         )
+
+    @classmethod
+    def date_ranges(
+        cls,
+        birth_date: date | None,
+        birth_date_precision: str | None,
+        death_date: date | None,
+        death_date_precision: str | None,
+    ) -> tuple[Range[date] | None, Range[date] | None, Range[date] | None]:
+        """The birth, death and lifespan ranges stored alongside the dates."""
+        birth = date_bounds(birth_date, birth_date_precision) if birth_date else None
+        death = date_bounds(death_date, death_date_precision) if death_date else None
+        return (
+            _to_range(birth),
+            _to_range(death),
+            _to_range(lifespan_bounds(birth, death)),
+        )
+
+
+def _to_range(bounds: tuple[date | None, date | None] | None) -> Range[date] | None:
+    if bounds is None:
+        return None
+    lower, upper = bounds
+    # The day after date.max cannot be read back; leave such ranges open.
+    return Range(lower, None if upper == date.max else upper, bounds="[]")
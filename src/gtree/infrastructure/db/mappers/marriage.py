@@ -0,0 +1,32 @@
+from gtree.domain.entities.trees.marriage import MarriageEntity
+from gtree.infrastructure.db.models.trees.marriage import MarriageModel
+
+
+class MarriageMapper:
+    @classmethod
+    def entity_to_model(cls, entity: MarriageEntity) -> MarriageModel:
+        return MarriageModel(
+            father_id=entity.father_id,
+            mother_id=entity.mother_id,
+            start_date=entity.start_date,
+            end_date=entity.end_date,
+            marriage_place=entity.marriage_place,
+            notes=entity.notes,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+            is_active=entity.is_active,
+        )
+
+    @classmethod
+    def model_to_entity(cls, model: MarriageModel) -> MarriageEntity:
+        return MarriageEntity(
+            father_id=model.father_id,
+            mother_id=model.mother_id,
+            start_date=model.start_date,
+            end_date=model.end_date,
+            marriage_place=model.marriage_place,
+            notes=model.notes,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            is_active=model.is_active,
+        )
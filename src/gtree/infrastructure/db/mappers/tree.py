@@ -9,6 +9,7 @@ class TreeMapper:
             id=entity.id,
             name=entity.name,
             description=entity.description,
+            version=entity.version,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
             is_active=entity.is_active,
@@ -20,6 +21,7 @@ class TreeMapper:
             id=model.id,
             name=model.name,
             description=model.description,
+            version=model.version,
             created_at=model.created_at,
             updated_at=model.updated_at,
             is_active=model.is_active,
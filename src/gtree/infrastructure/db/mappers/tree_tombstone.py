@@ -0,0 +1,15 @@
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities.trees.tree_changes import TombstoneEntity
+from gtree.infrastructure.db.models.trees.tree_tombstone import TreeTombstoneModel
+
+
+class TreeTombstoneMapper:
+    """Tombstones are written by database triggers, so they are only read."""
+
+    @classmethod
+    def model_to_entity(cls, model: TreeTombstoneModel) -> TombstoneEntity:
+        return TombstoneEntity(
+            kind=RecordKind(model.kind),
+            key=tuple(model.key),
+            deleted_at=model.deleted_at,
+        )
@@ -0,0 +1,104 @@
+"""add tree delta sync
+
+Revision ID: a4d7e2b95c18
+Revises: f2b61a8e93c0
+Create Date: 2026-10-18 17:32:08.913504
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d7e2b95c18"
+down_revision: str | None = "f2b61a8e93c0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Individuals deleted together with their tree leave no tombstone. Relations
+# deleted by the cascade of an individual delete leave none either: their
+# child or father is already gone, and the individual's tombstone covers them.
+CREATE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION tree_tombstones_record() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'individuals' THEN
+        INSERT INTO tree_tombstones (tree_id, kind, key)
+        SELECT d.tree_id, 'individual', ARRAY[d.id]
+        FROM deleted d JOIN trees t ON t.id = d.tree_id;
+    ELSIF TG_TABLE_NAME = 'blood_relations' THEN
+        INSERT INTO tree_tombstones (tree_id, kind, key)
+        SELECT i.tree_id, 'blood_relation', ARRAY[d.parent_id, d.child_id]
+        FROM deleted d JOIN individuals i ON i.id = d.child_id;
+    ELSIF TG_TABLE_NAME = 'marriages' THEN
+        INSERT INTO tree_tombstones (tree_id, kind, key)
+        SELECT i.tree_id, 'marriage', ARRAY[d.father_id, d.mother_id]
+        FROM deleted d JOIN individuals i ON i.id = d.father_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+_TABLES = ("individuals", "blood_relations", "marriages")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tree_tombstones",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("tree_id", sa.UUID(), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("key", postgresql.ARRAY(sa.UUID()), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(),
+            server_default=sa.text("TIMEZONE('utc', now())"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["tree_id"], ["trees.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tree_tombstones_tree_deleted_at",
+        "tree_tombstones",
+        ["tree_id", "deleted_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_individuals_tree_updated_at",
+        "individuals",
+        ["tree_id", "updated_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_blood_relations_updated_at",
+        "blood_relations",
+        ["updated_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_marriages_updated_at", "marriages", ["updated_at"], unique=False
+    )
+
+    op.execute(CREATE_TRIGGER_FUNCTION)
+    for table in _TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_tombstones AFTER DELETE ON {table} "
+            "REFERENCING OLD TABLE AS deleted "
+            "FOR EACH STATEMENT EXECUTE FUNCTION tree_tombstones_record()"
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_tombstones ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS tree_tombstones_record()")
+    op.drop_index("ix_marriages_updated_at", table_name="marriages")
+    op.drop_index("ix_blood_relations_updated_at", table_name="blood_relations")
+    op.drop_index("ix_individuals_tree_updated_at", table_name="individuals")
+    op.drop_index("ix_tree_tombstones_tree_deleted_at", table_name="tree_tombstones")
+    op.drop_table("tree_tombstones")
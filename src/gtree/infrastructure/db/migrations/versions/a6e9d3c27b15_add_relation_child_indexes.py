@@ -0,0 +1,37 @@
+"""add relation child indexes
+
+Revision ID: a6e9d3c27b15
+Revises: d84a2c6f1b37
+Create Date: 2026-10-18 22:41:07.318254
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6e9d3c27b15"
+down_revision: str | None = "d84a2c6f1b37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_blood_relations_child_id",
+        "blood_relations",
+        ["child_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_marriages_mother_id",
+        "marriages",
+        ["mother_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_marriages_mother_id", table_name="marriages")
+    op.drop_index("ix_blood_relations_child_id", table_name="blood_relations")
@@ -0,0 +1,57 @@
+"""add individual search document
+
+Revision ID: b7f2e5d19c83
+Revises: a6e9d3c27b15
+Create Date: 2026-10-18 23:26:40.592817
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b7f2e5d19c83"
+down_revision: str | None = "a6e9d3c27b15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Places (weight A) and the biography (weight B), under the Russian and the
+# English configuration.
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('russian', coalesce(birth_place, '') || ' ' "
+    "|| coalesce(death_place, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(birth_place, '') || ' ' "
+    "|| coalesce(death_place, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(bio, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(bio, '')), 'B')"
+)
+
+# Adding a stored generated column rewrites the individuals table under an
+# exclusive lock; run it in a maintenance window on large databases.
+
+
+def upgrade() -> None:
+    op.add_column(
+        "individuals",
+        sa.Column(
+            "search_document",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_DOCUMENT, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_individuals_tree_search_document",
+        "individuals",
+        ["tree_id", "search_document"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_individuals_tree_search_document", table_name="individuals")
+    op.drop_column("individuals", "search_document")
@@ -0,0 +1,65 @@
+"""add individual name search
+
+Revision ID: b93e1c0d7a46
+Revises: a4d7e2b95c18
+Create Date: 2026-10-18 18:52:37.204611
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b93e1c0d7a46"
+down_revision: str | None = "a4d7e2b95c18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Lets tree_id share the trigram GIN index.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    op.add_column(
+        "individuals",
+        sa.Column(
+            "search_name",
+            sa.Text(),
+            sa.Computed(
+                "lower(first_name || ' ' || coalesce(patronymic, '') || ' ' "
+                "|| coalesce(last_name, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_individuals_tree_search_name_trgm",
+        "individuals",
+        ["tree_id", "search_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_individuals_tree_last_name_prefix",
+        "individuals",
+        ["tree_id", sa.literal_column("lower(last_name) text_pattern_ops")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_individuals_tree_first_name_prefix",
+        "individuals",
+        ["tree_id", sa.literal_column("lower(first_name) text_pattern_ops")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_individuals_tree_first_name_prefix", table_name="individuals")
+    op.drop_index("ix_individuals_tree_last_name_prefix", table_name="individuals")
+    op.drop_index("ix_individuals_tree_search_name_trgm", table_name="individuals")
+    op.drop_column("individuals", "search_name")
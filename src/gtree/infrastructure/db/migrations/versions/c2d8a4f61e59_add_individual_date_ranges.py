@@ -0,0 +1,46 @@
+"""add individual date ranges
+
+Revision ID: c2d8a4f61e59
+Revises: b7f2e5d19c83
+Create Date: 2026-10-18 23:58:12.904316
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c2d8a4f61e59"
+down_revision: str | None = "b7f2e5d19c83"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The ranges are computed by the application; fill in existing rows with
+# `make backfill-date-ranges` after upgrading.
+
+_RANGES = ("birth_range", "death_range", "lifespan")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    for name in _RANGES:
+        op.add_column(
+            "individuals",
+            sa.Column(name, postgresql.DATERANGE(), nullable=True),
+        )
+        op.create_index(
+            f"ix_individuals_tree_{name}",
+            "individuals",
+            ["tree_id", name],
+            unique=False,
+            postgresql_using="gist",
+        )
+
+
+def downgrade() -> None:
+    for name in reversed(_RANGES):
+        op.drop_index(f"ix_individuals_tree_{name}", table_name="individuals")
+        op.drop_column("individuals", name)
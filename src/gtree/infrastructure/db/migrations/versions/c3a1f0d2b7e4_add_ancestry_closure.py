@@ -0,0 +1,128 @@
+"""add ancestry closure
+
+Revision ID: c3a1f0d2b7e4
+Revises: a664ed9969df
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a1f0d2b7e4"
+down_revision: str | None = "a664ed9969df"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Paths gained (or lost) by adding (or removing) the edge parent -> child:
+# every ancestor of the parent (and the parent itself) times every descendant
+# of the child (and the child itself). Path counts are multiplied so that
+# pedigree collapse keeps exact counts.
+CREATE_DELTA_FUNCTION = """
+CREATE OR REPLACE FUNCTION ancestry_closure_delta(p_parent uuid, p_child uuid)
+RETURNS TABLE (ancestor_id uuid, descendant_id uuid, depth integer, paths bigint)
+LANGUAGE sql STABLE AS $$
+    SELECT up.ancestor_id,
+           down.descendant_id,
+           up.depth + down.depth + 1,
+           sum(up.paths * down.paths)::bigint
+    FROM (
+        SELECT p_parent AS ancestor_id, 0 AS depth, 1::bigint AS paths
+        UNION ALL
+        SELECT c.ancestor_id, c.depth, c.paths
+        FROM ancestry_closure c
+        WHERE c.descendant_id = p_parent
+    ) AS up
+    CROSS JOIN (
+        SELECT p_child AS descendant_id, 0 AS depth, 1::bigint AS paths
+        UNION ALL
+        SELECT c.descendant_id, c.depth, c.paths
+        FROM ancestry_closure c
+        WHERE c.ancestor_id = p_child
+    ) AS down
+    GROUP BY 1, 2, 3
+$$;
+"""
+
+CREATE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION ancestry_closure_maintain() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE ancestry_closure c
+        SET paths = c.paths - d.paths
+        FROM ancestry_closure_delta(OLD.parent_id, OLD.child_id) d
+        WHERE c.ancestor_id = d.ancestor_id
+          AND c.descendant_id = d.descendant_id
+          AND c.depth = d.depth;
+
+        DELETE FROM ancestry_closure c
+        USING ancestry_closure_delta(OLD.parent_id, OLD.child_id) d
+        WHERE c.ancestor_id = d.ancestor_id
+          AND c.descendant_id = d.descendant_id
+          AND c.depth = d.depth
+          AND c.paths <= 0;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO ancestry_closure (tree_id, ancestor_id, descendant_id, depth, paths)
+        SELECT i.tree_id, d.ancestor_id, d.descendant_id, d.depth, d.paths
+        FROM ancestry_closure_delta(NEW.parent_id, NEW.child_id) d
+        JOIN individuals i ON i.id = NEW.parent_id
+        ON CONFLICT (ancestor_id, descendant_id, depth)
+        DO UPDATE SET paths = ancestry_closure.paths + EXCLUDED.paths;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+"""
+
+CREATE_TRIGGER = """
+CREATE TRIGGER trg_blood_relations_ancestry_closure
+AFTER INSERT OR DELETE OR UPDATE OF parent_id, child_id ON blood_relations
+FOR EACH ROW EXECUTE FUNCTION ancestry_closure_maintain();
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ancestry_closure",
+        sa.Column("tree_id", sa.UUID(), nullable=False),
+        sa.Column("ancestor_id", sa.UUID(), nullable=False),
+        sa.Column("descendant_id", sa.UUID(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.Column("paths", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["tree_id"], ["trees.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "ancestor_id", "descendant_id", "depth", name="pk_ancestry_closure"
+        ),
+    )
+    op.create_index(
+        "ix_ancestry_closure_descendant",
+        "ancestry_closure",
+        ["descendant_id", "depth"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_ancestry_closure_tree", "ancestry_closure", ["tree_id"], unique=False
+    )
+
+    op.execute(CREATE_DELTA_FUNCTION)
+    op.execute(CREATE_TRIGGER_FUNCTION)
+    op.execute(CREATE_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_blood_relations_ancestry_closure ON blood_relations"
+    )
+    op.execute("DROP FUNCTION IF EXISTS ancestry_closure_maintain()")
+    op.execute("DROP FUNCTION IF EXISTS ancestry_closure_delta(uuid, uuid)")
+    op.drop_index("ix_ancestry_closure_tree", table_name="ancestry_closure")
+    op.drop_index("ix_ancestry_closure_descendant", table_name="ancestry_closure")
+    op.drop_table("ancestry_closure")
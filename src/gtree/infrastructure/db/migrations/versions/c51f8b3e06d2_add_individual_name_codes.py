@@ -0,0 +1,46 @@
+"""add individual name codes
+
+Revision ID: c51f8b3e06d2
+Revises: b93e1c0d7a46
+Create Date: 2026-10-18 20:14:51.637920
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c51f8b3e06d2"
+down_revision: str | None = "b93e1c0d7a46"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The codes are computed by the application; fill in existing rows with
+# `make backfill-name-codes` after upgrading.
+
+
+def upgrade() -> None:
+    op.add_column(
+        "individuals",
+        sa.Column(
+            "name_codes",
+            postgresql.ARRAY(sa.String(length=6)),
+            server_default="{}",
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_individuals_tree_name_codes",
+        "individuals",
+        ["tree_id", "name_codes"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_individuals_tree_name_codes", table_name="individuals")
+    op.drop_column("individuals", "name_codes")
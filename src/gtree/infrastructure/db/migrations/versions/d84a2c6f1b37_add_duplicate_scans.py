@@ -0,0 +1,110 @@
+"""add duplicate scans
+
+Revision ID: d84a2c6f1b37
+Revises: c51f8b3e06d2
+Create Date: 2026-10-18 21:40:26.118452
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d84a2c6f1b37"
+down_revision: str | None = "c51f8b3e06d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "duplicate_scans",
+        sa.Column("tree_id", sa.UUID(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("processed_blocks", sa.Integer(), nullable=False),
+        sa.Column("total_blocks", sa.Integer(), nullable=False),
+        sa.Column("compared_pairs", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("TIMEZONE('utc', now())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("TIMEZONE('utc', now())"),
+            nullable=False,
+        ),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["tree_id"], ["trees.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_duplicate_scans_id"), "duplicate_scans", ["id"], unique=False
+    )
+    op.create_index(
+        "ix_duplicate_scans_tree_created_at",
+        "duplicate_scans",
+        ["tree_id", "created_at"],
+        unique=False,
+    )
+    op.create_table(
+        "duplicate_suggestions",
+        sa.Column("scan_id", sa.UUID(), nullable=False),
+        sa.Column("individual_id", sa.UUID(), nullable=False),
+        sa.Column("duplicate_id", sa.UUID(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("name_score", sa.Float(), nullable=False),
+        sa.Column("date_score", sa.Float(), nullable=True),
+        sa.Column("place_score", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["scan_id"], ["duplicate_scans.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["individual_id"], ["individuals.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["duplicate_id"], ["individuals.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("scan_id", "individual_id", "duplicate_id"),
+    )
+    op.create_index(
+        "ix_duplicate_suggestions_scan_score",
+        "duplicate_suggestions",
+        ["scan_id", "score"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_duplicate_suggestions_individual_id",
+        "duplicate_suggestions",
+        ["individual_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_duplicate_suggestions_duplicate_id",
+        "duplicate_suggestions",
+        ["duplicate_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_duplicate_suggestions_duplicate_id", table_name="duplicate_suggestions"
+    )
+    op.drop_index(
+        "ix_duplicate_suggestions_individual_id", table_name="duplicate_suggestions"
+    )
+    op.drop_index(
+        "ix_duplicate_suggestions_scan_score", table_name="duplicate_suggestions"
+    )
+    op.drop_table("duplicate_suggestions")
+    op.drop_index("ix_duplicate_scans_tree_created_at", table_name="duplicate_scans")
+    op.drop_index(op.f("ix_duplicate_scans_id"), table_name="duplicate_scans")
+    op.drop_table("duplicate_scans")
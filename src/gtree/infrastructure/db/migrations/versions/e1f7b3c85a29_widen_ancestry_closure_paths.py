@@ -0,0 +1,114 @@
+"""widen ancestry closure paths
+
+Revision ID: e1f7b3c85a29
+Revises: c2d8a4f61e59
+Create Date: 2026-10-19 09:41:27.518306
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f7b3c85a29"
+down_revision: str | None = "c2d8a4f61e59"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Path counts double with every generation of pedigree collapse, so they
+# outgrow bigint after ~63 generations. Counts are kept as exact numerics:
+# the triggers subtract them on edge deletion, so a saturated value would
+# leave stale rows behind.
+CREATE_DELTA_FUNCTION = """
+CREATE FUNCTION ancestry_closure_delta(p_parent uuid, p_child uuid)
+RETURNS TABLE (ancestor_id uuid, descendant_id uuid, depth integer, paths numeric)
+LANGUAGE sql STABLE AS $$
+    SELECT up.ancestor_id,
+           down.descendant_id,
+           up.depth + down.depth + 1,
+           sum(up.paths * down.paths)
+    FROM (
+        SELECT p_parent AS ancestor_id, 0 AS depth, 1::numeric AS paths
+        UNION ALL
+        SELECT c.ancestor_id, c.depth, c.paths
+        FROM ancestry_closure c
+        WHERE c.descendant_id = p_parent
+    ) AS up
+    CROSS JOIN (
+        SELECT p_child AS descendant_id, 0 AS depth, 1::numeric AS paths
+        UNION ALL
+        SELECT c.descendant_id, c.depth, c.paths
+        FROM ancestry_closure c
+        WHERE c.ancestor_id = p_child
+    ) AS down
+    GROUP BY 1, 2, 3
+$$;
+"""
+
+CREATE_BIGINT_DELTA_FUNCTION = """
+CREATE FUNCTION ancestry_closure_delta(p_parent uuid, p_child uuid)
+RETURNS TABLE (ancestor_id uuid, descendant_id uuid, depth integer, paths bigint)
+LANGUAGE sql STABLE AS $$
+    SELECT up.ancestor_id,
+           down.descendant_id,
+           up.depth + down.depth + 1,
+           sum(up.paths * down.paths)::bigint
+    FROM (
+        SELECT p_parent AS ancestor_id, 0 AS depth, 1::bigint AS paths
+        UNION ALL
+        SELECT c.ancestor_id, c.depth, c.paths
+        FROM ancestry_closure c
+        WHERE c.descendant_id = p_parent
+    ) AS up
+    CROSS JOIN (
+        SELECT p_child AS descendant_id, 0 AS depth, 1::bigint AS paths
+        UNION ALL
+        SELECT c.descendant_id, c.depth, c.paths
+        FROM ancestry_closure c
+        WHERE c.ancestor_id = p_child
+    ) AS down
+    GROUP BY 1, 2, 3
+$$;
+"""
+
+
+def upgrade() -> None:
+    # The return type changes, so the function cannot be replaced in place.
+    op.execute("DROP FUNCTION ancestry_closure_delta(uuid, uuid)")
+    op.alter_column(
+        "ancestry_closure",
+        "paths",
+        existing_type=sa.BigInteger(),
+        type_=sa.Numeric(),
+        existing_nullable=False,
+    )
+    op.execute(CREATE_DELTA_FUNCTION)
+
+    # `rebuild` walks the closure one depth at a time within a tree.
+    op.drop_index("ix_ancestry_closure_tree", table_name="ancestry_closure")
+    op.create_index(
+        "ix_ancestry_closure_tree",
+        "ancestry_closure",
+        ["tree_id", "depth"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ancestry_closure_tree", table_name="ancestry_closure")
+    op.create_index(
+        "ix_ancestry_closure_tree", "ancestry_closure", ["tree_id"], unique=False
+    )
+
+    op.execute("DROP FUNCTION ancestry_closure_delta(uuid, uuid)")
+    op.alter_column(
+        "ancestry_closure",
+        "paths",
+        existing_type=sa.Numeric(),
+        type_=sa.BigInteger(),
+        existing_nullable=False,
+    )
+    op.execute(CREATE_BIGINT_DELTA_FUNCTION)
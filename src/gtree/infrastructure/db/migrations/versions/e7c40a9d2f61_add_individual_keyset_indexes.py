@@ -0,0 +1,38 @@
+"""add individual keyset indexes
+
+Revision ID: e7c40a9d2f61
+Revises: d5b82e9c4a17
+Create Date: 2026-10-18 14:21:40.118302
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e7c40a9d2f61"
+down_revision: str | None = "d5b82e9c4a17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_individuals_tree_name_keyset",
+        "individuals",
+        ["tree_id", sa.literal_column("coalesce(last_name, '')"), "first_name", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_individuals_tree_created_keyset",
+        "individuals",
+        ["tree_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_individuals_tree_created_keyset", table_name="individuals")
+    op.drop_index("ix_individuals_tree_name_keyset", table_name="individuals")
@@ -0,0 +1,97 @@
+"""add tree version
+
+Revision ID: f2b61a8e93c0
+Revises: e7c40a9d2f61
+Create Date: 2026-10-18 16:05:12.480137
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b61a8e93c0"
+down_revision: str | None = "e7c40a9d2f61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# A direct update of a tree bumps its version unless the update sets the
+# version itself, which is what the statement triggers below do.
+CREATE_TREE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION trees_bump_own_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF NEW.version = OLD.version THEN
+        NEW.version := OLD.version + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$;
+"""
+
+# Statement-level, so a batch insert bumps each affected tree once. Blood
+# relations and marriages belong to the tree of their child and father.
+CREATE_CONTENT_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION trees_bump_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'individuals' THEN
+        UPDATE trees SET version = version + 1
+        WHERE id IN (SELECT tree_id FROM changed);
+    ELSIF TG_TABLE_NAME = 'blood_relations' THEN
+        UPDATE trees SET version = version + 1
+        WHERE id IN (
+            SELECT i.tree_id FROM changed c JOIN individuals i ON i.id = c.child_id
+        );
+    ELSIF TG_TABLE_NAME = 'marriages' THEN
+        UPDATE trees SET version = version + 1
+        WHERE id IN (
+            SELECT i.tree_id FROM changed c JOIN individuals i ON i.id = c.father_id
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+_CONTENT_TABLES = ("individuals", "blood_relations", "marriages")
+# Transition tables are only allowed on single-event triggers.
+_EVENTS = (("insert", "NEW"), ("update", "NEW"), ("delete", "OLD"))
+
+
+def upgrade() -> None:
+    op.add_column(
+        "trees",
+        sa.Column(
+            "version", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+
+    op.execute(CREATE_TREE_TRIGGER_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER trg_trees_version BEFORE UPDATE ON trees "
+        "FOR EACH ROW EXECUTE FUNCTION trees_bump_own_version()"
+    )
+    op.execute(CREATE_CONTENT_TRIGGER_FUNCTION)
+    for table in _CONTENT_TABLES:
+        for event, transition in _EVENTS:
+            op.execute(
+                f"CREATE TRIGGER trg_{table}_tree_version_{event} "
+                f"AFTER {event.upper()} ON {table} "
+                f"REFERENCING {transition} TABLE AS changed "
+                "FOR EACH STATEMENT EXECUTE FUNCTION trees_bump_version()"
+            )
+
+
+def downgrade() -> None:
+    for table in _CONTENT_TABLES:
+        for event, _ in _EVENTS:
+            op.execute(
+                f"DROP TRIGGER IF EXISTS trg_{table}_tree_version_{event} ON {table}"
+            )
+    op.execute("DROP FUNCTION IF EXISTS trees_bump_version()")
+    op.execute("DROP TRIGGER IF EXISTS trg_trees_version ON trees")
+    op.execute("DROP FUNCTION IF EXISTS trees_bump_own_version()")
+    op.drop_column("trees", "version")
@@ -1,14 +1,21 @@
 # For alembic
+from .ancestry_closure import AncestryClosureModel
 from .blood_relation import BloodRelationModel
+from .duplicate_scan import DuplicateScanModel, DuplicateSuggestionModel
 from .individual import IndividualModel
 from .marriage import MarriageModel
 from .tree import TreeModel
 from .tree_access import TreeAccessModel
+from .tree_tombstone import TreeTombstoneModel
 
 __all__ = [
+    "AncestryClosureModel",
     "BloodRelationModel",
+    "DuplicateScanModel",
+    "DuplicateSuggestionModel",
     "IndividualModel",
     "MarriageModel",
     "TreeModel",
     "TreeAccessModel",
+    "TreeTombstoneModel",
 ]
@@ -0,0 +1,45 @@
+from decimal import Decimal
+from typing import override
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, Numeric, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from gtree.infrastructure.db.models.base import BaseModel
+
+
+class AncestryClosureModel(BaseModel):
+    """Transitive closure of `blood_relations`.
+
+    One row per (ancestor, descendant, depth) with the number of distinct
+    paths of that length, so pedigree collapse survives edge deletions.
+    Counts are unbounded numerics: they double with every collapsed generation.
+    Rows are maintained by database triggers on `blood_relations`
+    (see migration `c3a1f0d2b7e4`), including cascaded deletes.
+    """
+
+    __tablename__ = "ancestry_closure"
+
+    tree_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("trees.id", ondelete="CASCADE"), nullable=False
+    )
+    ancestor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    descendant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+    paths: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=1)
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "ancestor_id", "descendant_id", "depth", name="pk_ancestry_closure"
+        ),
+        Index("ix_ancestry_closure_descendant", "descendant_id", "depth"),
+        Index("ix_ancestry_closure_tree", "tree_id", "depth"),
+    )
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"<AncestryClosureModel({self.ancestor_id} -> {self.descendant_id}, "
+            f"depth={self.depth})>"
+        )
@@ -5,6 +5,7 @@ from typing import override
 from sqlalchemy import (
     CheckConstraint,
     ForeignKey,
+    Index,
     PrimaryKeyConstraint,
     UniqueConstraint,
 )
@@ -35,6 +36,10 @@ class BloodRelationModel(AssociationBaseModel):
         PrimaryKeyConstraint("parent_id", "child_id", name="pk_blood_relation"),
         CheckConstraint("parent_id != child_id", name="no_self_parent"),
         UniqueConstraint("parent_id", "child_id", name="unique_parent_child"),
+        # Delta sync; blood relations have no tree_id of their own.
+        Index("ix_blood_relations_updated_at", "updated_at"),
+        # The primary key covers lookups by parent only.
+        Index("ix_blood_relations_child_id", "child_id"),
     )
 
     @override
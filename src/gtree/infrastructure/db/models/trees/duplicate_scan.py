@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import override
+import uuid
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from gtree.infrastructure.db.models.base import BaseModel, ObjectBaseModel
+
+
+class DuplicateScanModel(ObjectBaseModel):
+    """A background search for duplicate individuals and its progress."""
+
+    __tablename__ = "duplicate_scans"
+
+    tree_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("trees.id", ondelete="CASCADE"), nullable=False
+    )
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    processed_blocks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_blocks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    compared_pairs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_duplicate_scans_tree_created_at", "tree_id", "created_at"),
+    )
+
+    @override
+    def __repr__(self) -> str:
+        return f"<DuplicateScanModel(id={self.id}, tree={self.tree_id}, status={self.status})>"
+
+
+class DuplicateSuggestionModel(BaseModel):
+    """A pair of likely duplicate individuals found by a scan."""
+
+    __tablename__ = "duplicate_suggestions"
+
+    scan_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("duplicate_scans.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    individual_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("individuals.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    duplicate_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("individuals.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    name_score: Mapped[float] = mapped_column(Float, nullable=False)
+    date_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    place_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_duplicate_suggestions_scan_score", "scan_id", "score"),
+        # Cascading deletes of individuals.
+        Index("ix_duplicate_suggestions_individual_id", "individual_id"),
+        Index("ix_duplicate_suggestions_duplicate_id", "duplicate_id"),
+    )
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"<DuplicateSuggestionModel({self.individual_id} <- {self.duplicate_id}, "
+            f"score={self.score})>"
+        )
@@ -2,13 +2,34 @@ from datetime import date
 from typing import override
 import uuid
 
-from sqlalchemy import Date, Enum, ForeignKey, Index, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Computed,
+    Date,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, DATERANGE, TSVECTOR, UUID, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from gtree.infrastructure.db.models.base import ObjectBaseModel
 from gtree.infrastructure.db.models.trees.tree import TreeModel
 
+# Text search configurations the search document is built with; queries are
+# parsed with each of them.
+TEXT_SEARCH_CONFIGS = ("russian", "english")
+
+_PLACES = "coalesce(birth_place, '') || ' ' || coalesce(death_place, '')"
+TEXT_SEARCH_DOCUMENT = " || ".join(
+    f"setweight(to_tsvector('{config}', {text}), '{weight}')"
+    for text, weight in ((_PLACES, "A"), ("coalesce(bio, '')", "B"))
+    for config in TEXT_SEARCH_CONFIGS
+)
+
 
 class IndividualModel(ObjectBaseModel):
     __tablename__ = "individuals"
@@ -29,12 +50,47 @@ class IndividualModel(ObjectBaseModel):
     death_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     death_date_precision: Mapped[str | None] = mapped_column(String(10), nullable=True)
 
+    # The days the dates may stand for given their precision, and the days
+    # the individual may have been alive; written by the application (see
+    # domain/funcs/dates.py).
+    birth_range: Mapped[Range[date] | None] = mapped_column(DATERANGE, nullable=True)
+    death_range: Mapped[Range[date] | None] = mapped_column(DATERANGE, nullable=True)
+    lifespan: Mapped[Range[date] | None] = mapped_column(DATERANGE, nullable=True)
+
     birth_place: Mapped[str | None] = mapped_column(Text, nullable=True)
     death_place: Mapped[str | None] = mapped_column(Text, nullable=True)
     bio: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     avatar_url: Mapped[str | None] = mapped_column(String, nullable=True)
 
+    inbreeding_coefficient: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    # Lower-cased full name for fuzzy search; maintained by PostgreSQL.
+    search_name: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(
+            "lower(first_name || ' ' || coalesce(patronymic, '') || ' ' "
+            "|| coalesce(last_name, ''))",
+            persisted=True,
+        ),
+    )
+
+    # Daitch–Mokotoff codes of every name word for phonetic search; written
+    # by the application (see infrastructure/utils/phonetics.py).
+    name_codes: Mapped[list[str]] = mapped_column(
+        ARRAY(String(6)), nullable=False, server_default="{}"
+    )
+
+    # Full-text search document: places (weight A) and the biography
+    # (weight B) under both the Russian and the English configuration, so
+    # either stemming matches; maintained by PostgreSQL. Deferred, as only
+    # search queries need it.
+    search_document: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(TEXT_SEARCH_DOCUMENT, persisted=True),
+        deferred=True,
+    )
+
     tree: Mapped[TreeModel] = relationship(TreeModel, back_populates="individuals")
 
     @override
@@ -49,6 +105,71 @@ class IndividualModel(ObjectBaseModel):
             func.lower(last_name),
             unique=False,
         ),
+        # Keyset pagination: one index per IndividualOrder sort key.
+        Index(
+            "ix_individuals_tree_name_keyset",
+            "tree_id",
+            func.coalesce(last_name, ""),
+            first_name,
+            "id",
+        ),
+        Index("ix_individuals_tree_created_keyset", "tree_id", "created_at", "id"),
+        # Delta sync.
+        Index("ix_individuals_tree_updated_at", "tree_id", "updated_at"),
+        # Name search: trigrams for fuzzy matches (tree_id via btree_gin),
+        # and prefix indexes for queries too short to have trigrams.
+        Index(
+            "ix_individuals_tree_search_name_trgm",
+            "tree_id",
+            "search_name",
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_individuals_tree_last_name_prefix",
+            "tree_id",
+            func.lower(last_name).label("last_name_lower"),
+            postgresql_ops={"last_name_lower": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_individuals_tree_first_name_prefix",
+            "tree_id",
+            func.lower(first_name).label("first_name_lower"),
+            postgresql_ops={"first_name_lower": "text_pattern_ops"},
+        ),
+        # Phonetic search: array overlap on name codes.
+        Index(
+            "ix_individuals_tree_name_codes",
+            "tree_id",
+            "name_codes",
+            postgresql_using="gin",
+        ),
+        # Date queries: range overlap (tree_id via btree_gist).
+        Index(
+            "ix_individuals_tree_birth_range",
+            "tree_id",
+            "birth_range",
+            postgresql_using="gist",
+        ),
+        Index(
+            "ix_individuals_tree_death_range",
+            "tree_id",
+            "death_range",
+            postgresql_using="gist",
+        ),
+        Index(
+            "ix_individuals_tree_lifespan",
+            "tree_id",
+            "lifespan",
+            postgresql_using="gist",
+        ),
+        # Full-text search over places and biographies.
+        Index(
+            "ix_individuals_tree_search_document",
+            "tree_id",
+            "search_document",
+            postgresql_using="gin",
+        ),
     )
 
 
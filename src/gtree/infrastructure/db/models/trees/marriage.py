@@ -4,6 +4,7 @@ from typing import override
 from sqlalchemy import (
     Date,
     ForeignKey,
+    Index,
     Text,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -38,6 +39,13 @@ class MarriageModel(AssociationBaseModel):
         IndividualModel, foreign_keys=[mother_id], back_populates="marriages_as_mother"
     )
 
+    __table_args__ = (
+        # Delta sync; marriages have no tree_id of their own.
+        Index("ix_marriages_updated_at", "updated_at"),
+        # The primary key covers lookups by father only.
+        Index("ix_marriages_mother_id", "mother_id"),
+    )
+
     @override
     def __repr__(self) -> str:
         return f"<MarriageModel({self.father_id} — {self.mother_id})>"
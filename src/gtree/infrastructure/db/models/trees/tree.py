@@ -1,6 +1,6 @@
 from typing import override
 
-from sqlalchemy import String, Text
+from sqlalchemy import BigInteger, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from gtree.infrastructure.db.models.base import ObjectBaseModel
@@ -11,6 +11,10 @@ class TreeModel(ObjectBaseModel):
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Bumped by database triggers on every write to the tree or its contents.
+    version: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default=text("0")
+    )
 
     @override
     def __repr__(self) -> str:
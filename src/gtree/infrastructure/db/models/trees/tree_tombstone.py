@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import override
+import uuid
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from gtree.infrastructure.db.models.base import BaseModel
+
+
+class TreeTombstoneModel(BaseModel):
+    """Primary keys of deleted individuals, blood relations and marriages.
+
+    Rows are written by database triggers on the deleted tables (see
+    migration `a4d7e2b95c18`) so that delta sync can report deletes.
+    """
+
+    __tablename__ = "tree_tombstones"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    tree_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("trees.id", ondelete="CASCADE"), nullable=False
+    )
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    key: Mapped[list[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)), nullable=False
+    )
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=text("TIMEZONE('utc', now())"), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_tree_tombstones_tree_deleted_at", "tree_id", "deleted_at"),
+    )
+
+    @override
+    def __repr__(self) -> str:
+        return f"<TreeTombstoneModel({self.kind} {self.key}, tree={self.tree_id})>"
@@ -0,0 +1,197 @@
+"""Tree change events over PostgreSQL LISTEN/NOTIFY.
+
+Writers publish events with `pg_notify` inside their transaction, so an event
+is delivered only if the write commits. Each worker process holds a single
+listening connection and fans events out to the feeds of its subscribers.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+import json
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+import structlog
+
+from gtree.core.config.settings import settings
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities.trees.tree_event import TreeEventEntity
+
+logger = structlog.get_logger(__name__)
+
+TREE_EVENTS_CHANNEL = "tree_events"
+# The listener checks its connection this often and waits this long before
+# reconnecting after a failure.
+_PING_INTERVAL = 30.0
+_RECONNECT_DELAY = 2.0
+
+
+def encode_event(event: TreeEventEntity) -> str:
+    """Serialise an event as a NOTIFY payload (well below the 8000 byte limit)."""
+    payload: dict[str, Any] = {
+        "tree_id": str(event.tree_id),
+        "kind": event.kind,
+        "action": event.action,
+    }
+    if event.key is not None:
+        payload["key"] = [str(part) for part in event.key]
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def decode_event(payload: str) -> TreeEventEntity:
+    data = json.loads(payload)
+    key = data.get("key")
+    return TreeEventEntity(
+        tree_id=UUID(data["tree_id"]),
+        kind=RecordKind(data["kind"]),
+        action=ChangeAction(data["action"]),
+        key=tuple(UUID(part) for part in key) if key is not None else None,
+    )
+
+
+class TreeEventFeed:
+    """Events of one tree for one subscriber, coalesced into batches.
+
+    Events for the same record are merged, so a burst of updates to it is
+    delivered once. A subscriber that falls more than `max_pending` distinct
+    events behind, or that may have missed events while the listener was
+    reconnecting, is told to resync instead.
+    """
+
+    def __init__(self, tree_id: UUID, coalesce_window: float, max_pending: int):
+        self.tree_id = tree_id
+        self._coalesce_window = coalesce_window
+        self._max_pending = max_pending
+        self._pending: dict[
+            tuple[RecordKind, tuple[UUID, ...] | None], TreeEventEntity
+        ] = {}
+        self._resync = False
+        self._ready = asyncio.Event()
+
+    def push(self, event: TreeEventEntity) -> None:
+        if self._resync:
+            return
+        slot = (event.kind, event.key)
+        previous = self._pending.get(slot)
+        # A record created and then updated within a batch is still new.
+        if not (
+            previous is not None
+            and previous.action == ChangeAction.CREATED
+            and event.action == ChangeAction.UPDATED
+        ):
+            self._pending[slot] = event
+        if len(self._pending) > self._max_pending:
+            self.request_resync()
+        self._ready.set()
+
+    def request_resync(self) -> None:
+        self._resync = True
+        self._pending.clear()
+        self._ready.set()
+
+    async def get(self, timeout: float) -> list[TreeEventEntity] | None:
+        """Wait up to `timeout` seconds for the next batch of events.
+
+        Returns an empty list on timeout and None if the subscriber has to
+        resync, e.g. from the delta sync endpoint.
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except TimeoutError:
+            return []
+        await asyncio.sleep(self._coalesce_window)
+        self._ready.clear()
+        if self._resync:
+            self._resync = False
+            return None
+        events, self._pending = list(self._pending.values()), {}
+        return events
+
+
+class TreeEventHub:
+    """The listening connection of a worker and the feeds it serves.
+
+    The connection is opened with the first subscription and reopened after
+    failures; feeds are told to resync after a reconnect.
+    """
+
+    def __init__(self, dsn: str, coalesce_window: float, max_pending: int):
+        self._dsn = dsn
+        self._coalesce_window = coalesce_window
+        self._max_pending = max_pending
+        self._feeds: dict[UUID, set[TreeEventFeed]] = {}
+        self._listener: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def subscribe(self, tree_id: UUID) -> AsyncIterator[TreeEventFeed]:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        feed = TreeEventFeed(tree_id, self._coalesce_window, self._max_pending)
+        self._feeds.setdefault(tree_id, set()).add(feed)
+        try:
+            yield feed
+        finally:
+            feeds = self._feeds.get(tree_id, set())
+            feeds.discard(feed)
+            if not feeds:
+                self._feeds.pop(tree_id, None)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    async def _listen(self) -> None:
+        connected_before = False
+        while True:
+            try:
+                connection = await asyncpg.connect(self._dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Tree event listener cannot connect", error=str(e))
+                await asyncio.sleep(_RECONNECT_DELAY)
+                continue
+            try:
+                await connection.add_listener(
+                    TREE_EVENTS_CHANNEL, self._on_notification
+                )
+                if connected_before:
+                    for feeds in self._feeds.values():
+                        for feed in feeds:
+                            feed.request_resync()
+                connected_before = True
+                while True:
+                    await asyncio.sleep(_PING_INTERVAL)
+                    await connection.execute("SELECT 1")
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                logger.warning("Tree event listener disconnected", error=str(e))
+            finally:
+                with suppress(Exception):
+                    await connection.close(timeout=_RECONNECT_DELAY)
+            await asyncio.sleep(_RECONNECT_DELAY)
+
+    def _on_notification(
+        self,
+        _connection: asyncpg.Connection,
+        _pid: int,
+        _channel: str,
+        payload: str,
+    ) -> None:
+        try:
+            event = decode_event(payload)
+        except (ValueError, KeyError) as e:
+            logger.warning("Malformed tree event", payload=payload, error=str(e))
+            return
+        for feed in self._feeds.get(event.tree_id, ()):
+            feed.push(event)
+
+
+tree_event_hub = TreeEventHub(
+    settings.database.asyncpg_dsn,
+    settings.app.tree_events_coalesce_window,
+    settings.app.tree_events_max_pending,
+)
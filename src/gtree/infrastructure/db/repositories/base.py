@@ -1,5 +1,16 @@
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from gtree.infrastructure.db.models.base import BaseModel
+from gtree.infrastructure.db.unit_of_work import UnitOfWork
+
+# Rows fetched per round trip by server-side cursors (`stream_*` methods).
+STREAM_BATCH_SIZE = 1000
+
 
 class RepositoryObjectBase:
     def __init__(
@@ -7,3 +18,73 @@ class RepositoryObjectBase:
         db: AsyncSession,
     ):
         self.db = db
+
+    def _after_commit(self, callback: Callable[[], None]) -> None:
+        """Run `callback` once the session's unit of work commits.
+
+        Sessions outside a unit of work run it at once.
+        """
+        uow = UnitOfWork.of(self.db)
+        if uow is None:
+            callback()
+        else:
+            uow.after_commit(callback)
+
+    async def _insert_many(
+        self, models: Sequence[BaseModel], *, skip_conflicts: bool = True
+    ) -> int:
+        """Insert detached models with multi-row INSERTs.
+
+        Unlike `add` + `flush` + `refresh` per object this needs one round trip
+        per few hundred rows. Rows conflicting with existing ones are skipped,
+        or raise IntegrityError if `skip_conflicts` is False. Returns the number
+        of rows actually inserted.
+        """
+        if not models:
+            return 0
+        table = type(models[0]).__table__
+        stmt = insert(table)
+        if skip_conflicts:
+            stmt = stmt.on_conflict_do_nothing()
+        stmt = stmt.returning(*table.primary_key.columns)
+        # Generated columns are computed by the database and cannot be written.
+        columns = [column for column in table.columns if column.computed is None]
+        rows = [
+            {column.key: getattr(model, column.key) for column in columns}
+            for model in models
+        ]
+        result = await self.db.execute(stmt, rows)
+        return len(result.all())
+
+    async def _insert_returning(self, model: BaseModel) -> Any:
+        """INSERT one detached model and return the stored row as a model.
+
+        One `INSERT ... RETURNING` replaces `add` + `flush` + `refresh`. Columns
+        left as None are omitted, so their defaults apply.
+        """
+        model_type = type(model)
+        values = {
+            column.key: value
+            for column in model_type.__table__.columns
+            if (value := getattr(model, column.key)) is not None
+        }
+        return await self.db.scalar(
+            insert(model_type).values(values).returning(model_type)
+        )
+
+    async def _update_returning(self, model: BaseModel, fields: Iterable[str]) -> Any:
+        """UPDATE `fields` of the row `model` points to and return it as a model.
+
+        The row is matched by the model's primary key; None if there is no such
+        row. `updated_at` is set by the column's `onupdate`.
+        """
+        model_type = type(model)
+        primary_key = model_type.__table__.primary_key.columns
+        stmt = (
+            update(model_type)
+            .where(*(column == getattr(model, column.key) for column in primary_key))
+            .values({name: getattr(model, name) for name in fields})
+            .returning(model_type)
+            .execution_options(populate_existing=True)
+        )
+        return await self.db.scalar(stmt)
@@ -0,0 +1,172 @@
+from uuid import UUID
+
+from sqlalchemy import delete, exc, exists, func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from gtree.domain.entities.trees.blood_relation import BloodRelationEntity
+from gtree.domain.entities.trees.lineage import LineageEntity
+from gtree.infrastructure.db.exceptions import ConflictException, RepositoryException
+from gtree.infrastructure.db.mappers.individual import IndividualMapper
+from gtree.infrastructure.db.models.trees.ancestry_closure import AncestryClosureModel
+from gtree.infrastructure.db.models.trees.blood_relation import BloodRelationModel
+from gtree.infrastructure.db.models.trees.individual import IndividualModel
+from gtree.infrastructure.db.repositories.base import RepositoryObjectBase
+
+
+class AncestryClosureRepository(RepositoryObjectBase):
+    """Indexed ancestry lookups over the `ancestry_closure` table.
+
+    The table itself is kept up to date by triggers on `blood_relations`;
+    `rebuild` is only needed to backfill trees created before the migration.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def get_ancestors(self, individual_id: UUID, max_depth: int) -> LineageEntity:
+        return await self._get_lineage(individual_id, max_depth, upwards=True)
+
+    async def get_descendants(
+        self, individual_id: UUID, max_depth: int
+    ) -> LineageEntity:
+        return await self._get_lineage(individual_id, max_depth, upwards=False)
+
+    async def is_related(self, individual_id: UUID, other_id: UUID) -> bool:
+        """Check whether one is an ancestor of the other or both share an ancestor."""
+        closure = AncestryClosureModel
+        other = aliased(AncestryClosureModel)
+        stmt = select(
+            or_(
+                exists().where(
+                    closure.ancestor_id == individual_id,
+                    closure.descendant_id == other_id,
+                ),
+                exists().where(
+                    closure.ancestor_id == other_id,
+                    closure.descendant_id == individual_id,
+                ),
+                select(closure.ancestor_id)
+                .join(other, other.ancestor_id == closure.ancestor_id)
+                .where(
+                    closure.descendant_id == individual_id,
+                    other.descendant_id == other_id,
+                )
+                .exists(),
+            )
+        )
+        try:
+            return bool(await self.db.scalar(stmt))
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error checking relation of {individual_id} and {other_id}: {e!s}"
+            ) from e
+
+    async def rebuild(self, tree_id: UUID) -> int:
+        """Recompute the closure of a tree from scratch. Returns the row count.
+
+        Built one depth at a time: the rows at depth `d + 1` are the rows at
+        depth `d` extended by one `blood_relations` edge, with their path
+        counts summed per (ancestor, descendant). Each step touches only the
+        previous depth's rows, so collapsed pedigrees never enumerate paths.
+        """
+        closure = AncestryClosureModel
+        relation = BloodRelationModel
+        columns = ["tree_id", "ancestor_id", "descendant_id", "depth", "paths"]
+        edges = (
+            select(
+                literal(tree_id),
+                relation.parent_id,
+                relation.child_id,
+                literal(1),
+                literal(1),
+            )
+            .join(IndividualModel, IndividualModel.id == relation.parent_id)
+            .where(IndividualModel.tree_id == tree_id)
+        )
+
+        try:
+            await self.db.execute(delete(closure).where(closure.tree_id == tree_id))
+            result = await self.db.execute(
+                closure.__table__.insert().from_select(columns, edges)
+            )
+            total = inserted = result.rowcount
+            # A simple path visits each individual once; deeper rows mean a cycle.
+            max_depth = await self.db.scalar(
+                select(func.count()).where(IndividualModel.tree_id == tree_id)
+            )
+            depth = 1
+            while inserted and depth < max_depth:
+                extended = (
+                    select(
+                        closure.tree_id,
+                        closure.ancestor_id,
+                        relation.child_id,
+                        literal(depth + 1),
+                        func.sum(closure.paths),
+                    )
+                    .join(relation, relation.parent_id == closure.descendant_id)
+                    .where(closure.tree_id == tree_id, closure.depth == depth)
+                    .group_by(closure.tree_id, closure.ancestor_id, relation.child_id)
+                )
+                result = await self.db.execute(
+                    closure.__table__.insert().from_select(columns, extended)
+                )
+                inserted = result.rowcount
+                total += inserted
+                depth += 1
+            await self.db.flush()
+            return total
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error rebuilding ancestry closure for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def _get_lineage(
+        self, individual_id: UUID, max_depth: int, *, upwards: bool
+    ) -> LineageEntity:
+        closure = AncestryClosureModel
+        root, reached = (
+            (closure.descendant_id, closure.ancestor_id)
+            if upwards
+            else (closure.ancestor_id, closure.descendant_id)
+        )
+        members = (
+            select(
+                reached.label("individual_id"), func.min(closure.depth).label("depth")
+            )
+            .where(root == individual_id, closure.depth <= max_depth)
+            .group_by(reached)
+            .subquery()
+        )
+        individuals_stmt = select(IndividualModel, members.c.depth).join(
+            members, IndividualModel.id == members.c.individual_id
+        )
+
+        try:
+            rows = (await self.db.execute(individuals_stmt)).all()
+            member_ids = [individual.id for individual, _ in rows]
+            lineage_ids = [individual_id, *member_ids]
+            edges_stmt = select(
+                BloodRelationModel.parent_id, BloodRelationModel.child_id
+            ).where(
+                BloodRelationModel.parent_id.in_(
+                    member_ids if upwards else lineage_ids
+                ),
+                BloodRelationModel.child_id.in_(lineage_ids if upwards else member_ids),
+            )
+            edges = (await self.db.execute(edges_stmt)).tuples().all()
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving lineage of individual {individual_id}: {e!s}"
+            ) from e
+
+        return LineageEntity(
+            root_id=individual_id,
+            individuals=[IndividualMapper.model_to_entity(i) for i, _ in rows],
+            depths={individual.id: depth for individual, depth in rows},
+            blood_relations=[
+                BloodRelationEntity(parent_id=parent_id, child_id=child_id)
+                for parent_id, child_id in edges
+            ],
+        )
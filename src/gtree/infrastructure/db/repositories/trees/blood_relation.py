@@ -0,0 +1,195 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, exc, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from gtree.domain.entities.trees.blood_relation import BloodRelationEntity
+from gtree.infrastructure.db.exceptions import (
+    ConflictException,
+    NotFoundException,
+    RepositoryException,
+)
+from gtree.infrastructure.db.mappers.blood_relation import BloodRelationMapper
+from gtree.infrastructure.db.models.trees.blood_relation import BloodRelationModel
+from gtree.infrastructure.db.models.trees.individual import IndividualModel
+from gtree.infrastructure.db.repositories.base import (
+    STREAM_BATCH_SIZE,
+    RepositoryObjectBase,
+)
+
+
+class BloodRelationRepository(RepositoryObjectBase):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def create(self, blood_relation: BloodRelationEntity) -> BloodRelationEntity:
+        try:
+            db_obj = await self._insert_returning(
+                BloodRelationMapper.entity_to_model(blood_relation)
+            )
+            return BloodRelationMapper.model_to_entity(db_obj)
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(f"Error creating blood relation: {str(e)}") from e
+
+    async def create_many(
+        self, blood_relations: list[BloodRelationEntity], *, skip_existing: bool = True
+    ) -> int:
+        """Insert blood relations in bulk, skipping existing ones unless told otherwise.
+
+        Returns the number of inserted rows.
+        """
+        try:
+            return await self._insert_many(
+                [BloodRelationMapper.entity_to_model(r) for r in blood_relations],
+                skip_conflicts=skip_existing,
+            )
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(f"Error creating blood relations: {e!s}") from e
+
+    async def get_by_tree_id(self, tree_id: UUID) -> list[BloodRelationEntity]:
+        try:
+            stmt = (
+                select(BloodRelationModel)
+                .join(
+                    IndividualModel, IndividualModel.id == BloodRelationModel.child_id
+                )
+                .where(IndividualModel.tree_id == tree_id)
+            )
+            blood_relations = await self.db.scalars(stmt)
+            return [
+                BloodRelationMapper.model_to_entity(blood_relation)
+                for blood_relation in blood_relations
+            ]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving blood relations for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def get_changed_since(
+        self, tree_id: UUID, since: datetime
+    ) -> list[BloodRelationEntity]:
+        """Blood relations of a tree created or updated after `since`."""
+        try:
+            stmt = (
+                select(BloodRelationModel)
+                .join(
+                    IndividualModel, IndividualModel.id == BloodRelationModel.child_id
+                )
+                .where(
+                    IndividualModel.tree_id == tree_id,
+                    BloodRelationModel.updated_at > since,
+                )
+                .order_by(BloodRelationModel.updated_at)
+            )
+            blood_relations = await self.db.scalars(stmt)
+            return [
+                BloodRelationMapper.model_to_entity(blood_relation)
+                for blood_relation in blood_relations
+            ]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving changed blood relations for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def stream_by_tree_id(
+        self, tree_id: UUID
+    ) -> AsyncIterator[BloodRelationEntity]:
+        """Yield the blood relations of a tree ordered by child.
+
+        Rows come from a server-side cursor; all parents of a child are
+        yielded consecutively.
+        """
+        try:
+            stmt = (
+                select(BloodRelationModel)
+                .join(
+                    IndividualModel, IndividualModel.id == BloodRelationModel.child_id
+                )
+                .where(IndividualModel.tree_id == tree_id)
+                .order_by(BloodRelationModel.child_id)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            async for blood_relation in await self.db.stream_scalars(stmt):
+                yield BloodRelationMapper.model_to_entity(blood_relation)
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error streaming blood relations for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def get_by_id(self, parent_id: UUID, child_id: UUID) -> BloodRelationEntity:
+        try:
+            stmt = select(BloodRelationModel).where(
+                BloodRelationModel.parent_id == parent_id,
+                BloodRelationModel.child_id == child_id,
+            )
+            blood_relation = await self.db.scalar(stmt)
+            if blood_relation is None:
+                raise NotFoundException(
+                    f"Blood relation {parent_id} -> {child_id} not found"
+                )
+            return BloodRelationMapper.model_to_entity(blood_relation)
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving blood relation {parent_id} -> {child_id}: {e!s}"
+            ) from e
+
+    async def delete(self, parent_id: UUID, child_id: UUID) -> None:
+        try:
+            stmt = delete(BloodRelationModel).where(
+                BloodRelationModel.parent_id == parent_id,
+                BloodRelationModel.child_id == child_id,
+            )
+            await self.db.execute(stmt)
+            await self.db.flush()
+
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error deleting blood relation {parent_id} -> {child_id}: {str(e)}"
+            ) from e
+
+    async def move_individual(self, from_id: UUID, to_id: UUID) -> tuple[int, int]:
+        """Re-point every blood relation of `from_id` to `to_id`, set-based.
+
+        Relations `to_id` already has are deleted rather than moved, so the
+        updates never violate `unique_parent_child`. The caller must make sure
+        the two are not ancestor and descendant (`no_self_parent`, cycles).
+        Returns the numbers of moved and of deleted duplicate relations.
+        """
+        relation = BloodRelationModel
+        existing = aliased(BloodRelationModel)
+        moved = duplicates = 0
+        try:
+            for own, other in (
+                (relation.parent_id, relation.child_id),
+                (relation.child_id, relation.parent_id),
+            ):
+                duplicates += (
+                    await self.db.execute(
+                        delete(relation)
+                        .where(
+                            own == from_id,
+                            exists().where(
+                                getattr(existing, own.key) == to_id,
+                                getattr(existing, other.key) == other,
+                            ),
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+                ).rowcount
+                moved += (
+                    await self.db.execute(
+                        update(relation)
+                        .where(own == from_id)
+                        .values({own.key: to_id})
+                        .execution_options(synchronize_session=False)
+                    )
+                ).rowcount
+            await self.db.flush()
+            return moved, duplicates
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error moving blood relations of individual {from_id}: {e!s}"
+            ) from e
@@ -0,0 +1,138 @@
+from collections.abc import Callable, Coroutine
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import exc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gtree.domain.entities._value_objects.job_status import JobStatus
+from gtree.domain.entities.trees.duplicate_scan import (
+    DuplicateScanEntity,
+    DuplicateSuggestionEntity,
+)
+from gtree.infrastructure.db.exceptions import (
+    ConflictException,
+    NotFoundException,
+    RepositoryException,
+)
+from gtree.infrastructure.db.jobs.runner import background_jobs
+from gtree.infrastructure.db.mappers.duplicate_scan import (
+    DuplicateScanMapper,
+    DuplicateSuggestionMapper,
+)
+from gtree.infrastructure.db.models.trees.duplicate_scan import (
+    DuplicateScanModel,
+    DuplicateSuggestionModel,
+)
+from gtree.infrastructure.db.repositories.base import RepositoryObjectBase
+
+# Fields of a scan that change while it runs.
+_STATE_FIELDS = (
+    "status",
+    "processed_blocks",
+    "total_blocks",
+    "compared_pairs",
+    "error",
+    "finished_at",
+)
+
+
+class DuplicateScanRepository(RepositoryObjectBase):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def create(self, scan: DuplicateScanEntity) -> DuplicateScanEntity:
+        try:
+            db_obj = await self._insert_returning(
+                DuplicateScanMapper.entity_to_model(scan)
+            )
+            return DuplicateScanMapper.model_to_entity(db_obj)
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(f"Error creating duplicate scan: {e!s}") from e
+
+    def run_after_commit(self, job: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        """Start `job` in the background once the current transaction commits.
+
+        The job then sees the scans created in that transaction.
+        """
+        self._after_commit(lambda: background_jobs.spawn(job()))
+
+    async def get_by_id(self, scan_id: UUID) -> DuplicateScanEntity:
+        try:
+            scan = await self.db.get(DuplicateScanModel, scan_id)
+            if scan is None:
+                raise NotFoundException(f"Duplicate scan with id {scan_id} not found")
+            return DuplicateScanMapper.model_to_entity(scan)
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving duplicate scan {scan_id}: {e!s}"
+            ) from e
+
+    async def get_active(
+        self, tree_id: UUID, alive_since: datetime
+    ) -> DuplicateScanEntity | None:
+        """The unfinished scan of a tree updated after `alive_since`, if any.
+
+        Older unfinished scans were interrupted, e.g. by a worker restart.
+        """
+        try:
+            stmt = (
+                select(DuplicateScanModel)
+                .where(
+                    DuplicateScanModel.tree_id == tree_id,
+                    DuplicateScanModel.status.in_(
+                        (JobStatus.PENDING, JobStatus.RUNNING)
+                    ),
+                    DuplicateScanModel.updated_at > alive_since,
+                )
+                .order_by(DuplicateScanModel.created_at.desc())
+                .limit(1)
+            )
+            scan = await self.db.scalar(stmt)
+            return DuplicateScanMapper.model_to_entity(scan) if scan else None
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving duplicate scans of tree {tree_id}: {e!s}"
+            ) from e
+
+    async def get_suggestions(
+        self, scan_id: UUID, limit: int
+    ) -> list[DuplicateSuggestionEntity]:
+        """The best `limit` suggestions of a scan, best first."""
+        try:
+            stmt = (
+                select(DuplicateSuggestionModel)
+                .where(DuplicateSuggestionModel.scan_id == scan_id)
+                .order_by(
+                    DuplicateSuggestionModel.score.desc(),
+                    DuplicateSuggestionModel.individual_id,
+                    DuplicateSuggestionModel.duplicate_id,
+                )
+                .limit(limit)
+            )
+            suggestions = await self.db.scalars(stmt)
+            return [DuplicateSuggestionMapper.model_to_entity(s) for s in suggestions]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving suggestions of duplicate scan {scan_id}: {e!s}"
+            ) from e
+
+    async def save_state(self, scan: DuplicateScanEntity) -> None:
+        """Write the status and progress of a scan, and its new suggestions."""
+        try:
+            db_obj = await self._update_returning(
+                DuplicateScanMapper.entity_to_model(scan), _STATE_FIELDS
+            )
+            if db_obj is None:
+                raise NotFoundException(f"Duplicate scan with id {scan.id} not found")
+            await self._insert_many(
+                [
+                    DuplicateSuggestionMapper.entity_to_model(scan.id, suggestion)
+                    for suggestion in scan.suggestions
+                ]
+            )
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error saving duplicate scan {scan.id}: {e!s}"
+            ) from e
@@ -1,17 +1,82 @@
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import date, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, exc, select
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    String,
+    any_,
+    bindparam,
+    case,
+    delete,
+    exc,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, Range
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from gtree.domain.entities._value_objects.individual_order import IndividualOrder
+from gtree.domain.entities.trees.blood_relation import BloodRelationEntity
 from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.entities.trees.lineage import LineageEntity
 from gtree.infrastructure.db.exceptions import (
     ConflictException,
     NotFoundException,
     RepositoryException,
 )
 from gtree.infrastructure.db.mappers.individual import IndividualMapper
-from gtree.infrastructure.db.models.trees.individual import IndividualModel
-from gtree.infrastructure.db.repositories.base import RepositoryObjectBase
+from gtree.infrastructure.db.models.trees.blood_relation import BloodRelationModel
+from gtree.infrastructure.db.models.trees.individual import (
+    TEXT_SEARCH_CONFIGS,
+    IndividualModel,
+)
+from gtree.infrastructure.db.repositories.base import (
+    STREAM_BATCH_SIZE,
+    RepositoryObjectBase,
+)
+from gtree.infrastructure.utils.exceptions import InvalidCursorError
+from gtree.infrastructure.utils.phonetics import name_codes
+
+# Sort keys of paginated listings. Each ends with the primary key so it is
+# unique, and each is covered by an index led by tree_id (see the model).
+_ORDER_KEYS: dict[IndividualOrder, tuple[ColumnElement[Any], ...]] = {
+    IndividualOrder.NAME: (
+        func.coalesce(IndividualModel.last_name, ""),
+        IndividualModel.first_name,
+        IndividualModel.id,
+    ),
+    IndividualOrder.CREATED: (IndividualModel.created_at, IndividualModel.id),
+}
+
+# Queries shorter than this have no complete trigram; they are matched as
+# prefixes of first or last names instead.
+_MIN_TRIGRAM_QUERY = 3
+
+# Full-text search: fields that get highlighted fragments, and the options
+# of `ts_headline` (the text is not HTML-escaped).
+_TEXT_SEARCH_FIELDS = ("birth_place", "death_place", "bio")
+_HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, "
+    "MaxFragments=2, FragmentDelimiter= … "
+)
+
+# Fields the phonetic `name_codes` column is derived from.
+_NAME_FIELDS = frozenset({"first_name", "patronymic", "last_name"})
+
+# Fields the date range columns are derived from.
+_DATE_FIELDS = frozenset(
+    {"birth_date", "birth_date_precision", "death_date", "death_date_precision"}
+)
+_DATE_RANGE_FIELDS = frozenset({"birth_range", "death_range", "lifespan"})
 
 
 class IndividualRepository(RepositoryObjectBase):
@@ -20,14 +85,22 @@ class IndividualRepository(RepositoryObjectBase):
 
     async def create(self, individual: IndividualEntity) -> IndividualEntity:
         try:
-            db_obj = IndividualMapper.entity_to_model(individual)
-            self.db.add(db_obj)
-            await self.db.flush()
-            await self.db.refresh(db_obj)
+            db_obj = await self._insert_returning(
+                IndividualMapper.entity_to_model(individual)
+            )
             return IndividualMapper.model_to_entity(db_obj)
         except exc.SQLAlchemyError as e:
             raise ConflictException(f"Error creating individual: {str(e)}") from e
 
+    async def create_many(self, individuals: list[IndividualEntity]) -> int:
+        """Insert individuals in bulk. Returns the number of inserted rows."""
+        try:
+            return await self._insert_many(
+                [IndividualMapper.entity_to_model(i) for i in individuals]
+            )
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(f"Error creating individuals: {e!s}") from e
+
     async def get_by_tree_id(self, tree_id: UUID) -> list[IndividualEntity]:
         try:
             stmt = select(IndividualModel).where(
@@ -43,6 +116,108 @@ class IndividualRepository(RepositoryObjectBase):
                 f"Error retrieving individuals for tree {tree_id}: {e!s}"
             ) from e
 
+    async def get_changed_since(
+        self, tree_id: UUID, since: datetime
+    ) -> list[IndividualEntity]:
+        """Individuals of a tree created or updated after `since`."""
+        try:
+            stmt = (
+                select(IndividualModel)
+                .where(
+                    IndividualModel.tree_id == tree_id,
+                    IndividualModel.updated_at > since,
+                )
+                .order_by(IndividualModel.updated_at)
+            )
+            individuals = await self.db.scalars(stmt)
+            return [
+                IndividualMapper.model_to_entity(individual)
+                for individual in individuals
+            ]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving changed individuals for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def get_page(
+        self,
+        tree_id: UUID,
+        *,
+        fields: Sequence[str],
+        order: IndividualOrder,
+        after: Sequence[object] | None,
+        limit: int,
+        born_between: tuple[date | None, date | None] | None = None,
+        alive_in: int | None = None,
+        died_before: date | None = None,
+    ) -> tuple[list[dict[str, Any]], list[object] | None]:
+        """Return up to `limit` individuals sorted by `order`, after key `after`.
+
+        Only the columns named in `fields` are selected. The second element is
+        the sort key of the last row, or None if no rows follow it.
+
+        The date filters keep individuals who may have been born between the
+        given days (both inclusive, None for open), alive in the given year or
+        died before the given day, given the precision of their dates. They
+        test the range columns, so they are answered by the GiST indexes.
+        """
+        keys = _ORDER_KEYS[order]
+        stmt = (
+            select(
+                *(IndividualModel.__table__.columns[name] for name in fields),
+                *(key.label(f"_key{i}") for i, key in enumerate(keys)),
+            )
+            .where(IndividualModel.tree_id == tree_id)
+            .order_by(*keys)
+            .limit(limit + 1)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(*keys) > tuple(_parse_key(keys, after)))
+        if born_between is not None:
+            stmt = stmt.where(
+                IndividualModel.birth_range.overlaps(Range(*born_between, bounds="[]"))
+            )
+        if alive_in is not None:
+            stmt = stmt.where(
+                IndividualModel.lifespan.overlaps(
+                    Range(date(alive_in, 1, 1), date(alive_in, 12, 31), bounds="[]")
+                )
+            )
+        if died_before is not None:
+            stmt = stmt.where(
+                IndividualModel.death_range.overlaps(
+                    Range(None, died_before, bounds="()")
+                )
+            )
+
+        try:
+            rows = (await self.db.execute(stmt)).mappings().all()
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving individuals for tree {tree_id}: {e!s}"
+            ) from e
+
+        items = [{name: row[name] for name in fields} for row in rows[:limit]]
+        if len(rows) <= limit:
+            return items, None
+        last = rows[limit - 1]
+        return items, [last[f"_key{i}"] for i in range(len(keys))]
+
+    async def stream_by_tree_id(self, tree_id: UUID) -> AsyncIterator[IndividualEntity]:
+        """Yield the individuals of a tree from a server-side cursor."""
+        try:
+            stmt = (
+                select(IndividualModel)
+                .where(IndividualModel.tree_id == tree_id)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            async for individual in await self.db.stream_scalars(stmt):
+                yield IndividualMapper.model_to_entity(individual)
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error streaming individuals for tree {tree_id}: {e!s}"
+            ) from e
+
     async def get_by_id(self, individual_id: UUID) -> IndividualEntity:
         try:
             stmt = select(IndividualModel).where(
@@ -58,36 +233,224 @@ class IndividualRepository(RepositoryObjectBase):
                 f"Error retrieving accessible individuals with id {individual_id}: {e!s}"
             ) from e
 
+    async def get_by_ids(
+        self, tree_id: UUID, individual_ids: list[UUID]
+    ) -> list[IndividualEntity]:
+        """Return the given individuals of a tree, in no particular order."""
+        if not individual_ids:
+            return []
+        try:
+            stmt = select(IndividualModel).where(
+                IndividualModel.tree_id == tree_id,
+                IndividualModel.id.in_(individual_ids),
+            )
+            individuals = await self.db.scalars(stmt)
+            return [
+                IndividualMapper.model_to_entity(individual)
+                for individual in individuals
+            ]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving individuals for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def search_by_name(
+        self, tree_id: UUID, query: str, limit: int
+    ) -> list[tuple[IndividualEntity, float]]:
+        """Individuals of a tree whose name matches a lower-case `query`.
+
+        Returns (individual, score) pairs, best first; the score is the
+        trigram word similarity of the query and the full name.
+        """
+        score = func.word_similarity(query, IndividualModel.search_name)
+        if len(query) < _MIN_TRIGRAM_QUERY:
+            pattern = (
+                query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                + "%"
+            )
+            match = or_(
+                func.lower(IndividualModel.last_name).like(pattern, escape="\\"),
+                func.lower(IndividualModel.first_name).like(pattern, escape="\\"),
+            )
+        else:
+            match = IndividualModel.search_name.op("%>")(query)
+        try:
+            stmt = (
+                select(IndividualModel, score)
+                .where(IndividualModel.tree_id == tree_id, match)
+                .order_by(score.desc(), *_ORDER_KEYS[IndividualOrder.NAME])
+                .limit(limit)
+            )
+            rows = await self.db.execute(stmt)
+            return [
+                (IndividualMapper.model_to_entity(model), float(similarity))
+                for model, similarity in rows
+            ]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error searching individuals of tree {tree_id}: {e!s}"
+            ) from e
+
+    async def search_by_name_codes(
+        self, tree_id: UUID, query: str, codes: list[list[str]], limit: int
+    ) -> list[tuple[IndividualEntity, float]]:
+        """Individuals of a tree that sound like every word of a query.
+
+        `codes` holds the phonetic codes of each query word; an individual
+        matches if its name codes overlap those of every word, which the GIN
+        index on (tree_id, name_codes) answers. Matches are ranked by the
+        trigram word similarity of the lower-case `query` and the full name.
+        """
+        score = func.word_similarity(query, IndividualModel.search_name)
+        try:
+            stmt = (
+                select(IndividualModel, score)
+                .where(
+                    IndividualModel.tree_id == tree_id,
+                    *(
+                        IndividualModel.name_codes.overlap(
+                            bindparam(
+                                f"word_codes_{i}", word_codes, type_=ARRAY(String)
+                            )
+                        )
+                        for i, word_codes in enumerate(codes)
+                    ),
+                )
+                .order_by(score.desc(), *_ORDER_KEYS[IndividualOrder.NAME])
+                .limit(limit)
+            )
+            rows = await self.db.execute(stmt)
+            return [
+                (IndividualMapper.model_to_entity(model), float(similarity))
+                for model, similarity in rows
+            ]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error searching individuals of tree {tree_id}: {e!s}"
+            ) from e
+
+    async def search_by_text(
+        self,
+        tree_id: UUID,
+        query: str,
+        *,
+        after: Sequence[object] | None,
+        limit: int,
+    ) -> tuple[
+        list[tuple[IndividualEntity, float, dict[str, str]]], list[object] | None
+    ]:
+        """Individuals of a tree whose places or biography match a web-style query.
+
+        The query is parsed with `websearch_to_tsquery` ("quoted phrases", or,
+        -excluded words) under every configuration of the search document, and
+        matched through its GIN index. Returns (individual, score, highlights)
+        triples ranked by `ts_rank` scaled to 0..1, and the key of the last one
+        if more follow, to pass as `after`. Highlights hold marked-up fragments
+        of the matching fields; they are made for the returned page only.
+        """
+        tsquery = _text_query(query)
+        score = func.ts_rank(IndividualModel.search_document, tsquery, 32, type_=Float)
+        keys = (score, IndividualModel.id)
+        page = (
+            select(IndividualModel.id, score.label("score"))
+            .where(
+                IndividualModel.tree_id == tree_id,
+                IndividualModel.search_document.op("@@")(tsquery),
+            )
+            .order_by(score.desc(), IndividualModel.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            page = page.where(tuple_(*keys) < tuple(_parse_key(keys, after)))
+        page = page.cte("page")
+
+        # Headlines are costly, so they are made after the page is cut.
+        headlines = [
+            _headline(IndividualModel.__table__.columns[name], tsquery).label(
+                f"{name}_headline"
+            )
+            for name in _TEXT_SEARCH_FIELDS
+        ]
+        stmt = (
+            select(IndividualModel, page.c.score, *headlines)
+            .join(page, page.c.id == IndividualModel.id)
+            .order_by(page.c.score.desc(), IndividualModel.id.desc())
+        )
+        try:
+            rows = (await self.db.execute(stmt)).all()
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error searching individuals of tree {tree_id}: {e!s}"
+            ) from e
+
+        matches = [
+            (
+                IndividualMapper.model_to_entity(row[0]),
+                float(row[1]),
+                {
+                    name: headline
+                    for name, headline in zip(_TEXT_SEARCH_FIELDS, row[2:], strict=True)
+                    if headline is not None
+                },
+            )
+            for row in rows[:limit]
+        ]
+        if len(rows) <= limit:
+            return matches, None
+        last = rows[limit - 1]
+        return matches, [last[1], last[0].id]
+
+    async def get_ids_in_tree(
+        self, tree_id: UUID, individual_ids: Collection[UUID]
+    ) -> set[UUID]:
+        """Return those of the given ids that are individuals of the tree.
+
+        The ids are sent as one array parameter (`id = ANY(:ids)`), so the
+        statement stays the same whatever their number.
+        """
+        if not individual_ids:
+            return set()
+        try:
+            stmt = select(IndividualModel.id).where(
+                IndividualModel.tree_id == tree_id,
+                IndividualModel.id
+                == any_(
+                    bindparam(
+                        "individual_ids",
+                        list(individual_ids),
+                        type_=ARRAY(PG_UUID(as_uuid=True)),
+                    )
+                ),
+            )
+            return set(await self.db.scalars(stmt))
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error checking individuals of tree {tree_id}: {e!s}"
+            ) from e
+
     async def update(self, individual_entity: IndividualEntity) -> IndividualEntity:
-        """Update an existing individual with data from IndividualEntity.
+        """Write the changed fields of IndividualEntity with one UPDATE ... RETURNING.
 
         Raises:
             NotFoundException: If individual with the given ID doesn't exist
             ConflictException: If there's a database error during update
         """
+        if not individual_entity.dirty_fields:
+            return individual_entity
+        fields = individual_entity.dirty_fields
+        if fields & _NAME_FIELDS:
+            fields |= {"name_codes"}
+        if fields & _DATE_FIELDS:
+            fields |= _DATE_RANGE_FIELDS
         try:
-            stmt = select(IndividualModel).where(
-                IndividualModel.id == individual_entity.id
+            db_obj = await self._update_returning(
+                IndividualMapper.entity_to_model(individual_entity), fields
             )
-            db_obj = await self.db.scalar(stmt)
-
             if db_obj is None:
                 raise NotFoundException(
                     f"Individual with id {individual_entity.id} not found"
                 )
 
-            updated_model = IndividualMapper.entity_to_model(individual_entity)
-
-            for field in IndividualModel.__table__.columns:
-                field_name = field.name
-                if field_name != "id" and hasattr(updated_model, field_name):
-                    new_value = getattr(updated_model, field_name)
-                    if new_value is not None:
-                        setattr(db_obj, field_name, new_value)
-
-            await self.db.flush()
-            await self.db.refresh(db_obj)
-
             return IndividualMapper.model_to_entity(db_obj)
 
         except exc.SQLAlchemyError as e:
@@ -105,3 +468,250 @@ class IndividualRepository(RepositoryObjectBase):
             raise ConflictException(
                 f"Error deleting individual with id {individual_id}: {str(e)}"
             ) from e
+
+    async def set_inbreeding_coefficients(self, coefficients: dict[UUID, float]) -> int:
+        """Store inbreeding coefficients with one bulk UPDATE by primary key."""
+        if not coefficients:
+            return 0
+        try:
+            await self.db.execute(
+                update(IndividualModel),
+                [
+                    {"id": individual_id, "inbreeding_coefficient": coefficient}
+                    for individual_id, coefficient in coefficients.items()
+                ],
+            )
+            await self.db.flush()
+            return len(coefficients)
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error storing inbreeding coefficients: {e!s}"
+            ) from e
+
+    async def refresh_name_codes(self, tree_id: UUID) -> int:
+        """Recompute the phonetic name codes of a tree's individuals.
+
+        Returns the number of rows whose codes changed.
+        """
+        try:
+            rows = await self.db.execute(
+                select(
+                    IndividualModel.id,
+                    IndividualModel.first_name,
+                    IndividualModel.patronymic,
+                    IndividualModel.last_name,
+                    IndividualModel.name_codes,
+                ).where(IndividualModel.tree_id == tree_id)
+            )
+            changed = [
+                {"id": individual_id, "name_codes": codes}
+                for individual_id, first_name, patronymic, last_name, stored in rows
+                if (codes := name_codes(first_name, patronymic, last_name)) != stored
+            ]
+            if changed:
+                await self.db.execute(update(IndividualModel), changed)
+                await self.db.flush()
+            return len(changed)
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error refreshing name codes of tree {tree_id}: {e!s}"
+            ) from e
+
+    async def refresh_date_ranges(self, tree_id: UUID) -> int:
+        """Recompute the date range columns of a tree's individuals.
+
+        Returns the number of rows whose ranges changed.
+        """
+        try:
+            rows = await self.db.execute(
+                select(
+                    IndividualModel.id,
+                    IndividualModel.birth_date,
+                    IndividualModel.birth_date_precision,
+                    IndividualModel.death_date,
+                    IndividualModel.death_date_precision,
+                    IndividualModel.birth_range,
+                    IndividualModel.death_range,
+                    IndividualModel.lifespan,
+                ).where(IndividualModel.tree_id == tree_id)
+            )
+            changed = [
+                {
+                    "id": row.id,
+                    "birth_range": ranges[0],
+                    "death_range": ranges[1],
+                    "lifespan": ranges[2],
+                }
+                for row in rows
+                if (
+                    ranges := IndividualMapper.date_ranges(
+                        row.birth_date,
+                        row.birth_date_precision,
+                        row.death_date,
+                        row.death_date_precision,
+                    )
+                )
+                != (row.birth_range, row.death_range, row.lifespan)
+            ]
+            if changed:
+                await self.db.execute(update(IndividualModel), changed)
+                await self.db.flush()
+            return len(changed)
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error refreshing date ranges of tree {tree_id}: {e!s}"
+            ) from e
+
+    async def lock_in_tree(
+        self, tree_id: UUID, individual_ids: Collection[UUID]
+    ) -> dict[UUID, IndividualEntity]:
+        """Those of the given individuals that belong to the tree, locked.
+
+        Rows are locked `FOR UPDATE` in id order, so concurrent callers locking
+        overlapping sets wait for each other instead of deadlocking.
+        """
+        try:
+            stmt = (
+                select(IndividualModel)
+                .where(
+                    IndividualModel.tree_id == tree_id,
+                    IndividualModel.id.in_(individual_ids),
+                )
+                .order_by(IndividualModel.id)
+                .with_for_update()
+            )
+            individuals = await self.db.scalars(stmt)
+            return {
+                individual.id: IndividualMapper.model_to_entity(individual)
+                for individual in individuals
+            }
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error locking individuals of tree {tree_id}: {e!s}"
+            ) from e
+
+    async def is_ancestor(self, ancestor_id: UUID, descendant_id: UUID) -> bool:
+        """Check whether one individual is an ancestor of another.
+
+        Walks up from the descendant with a recursive CTE over ids only; the
+        EXISTS stops the walk at the first match.
+        """
+        relation = BloodRelationModel
+        ancestors = (
+            select(relation.parent_id.label("id"))
+            .where(relation.child_id == descendant_id)
+            .cte("ancestors", recursive=True)
+        )
+        ancestors = ancestors.union(
+            select(relation.parent_id).join(
+                ancestors, relation.child_id == ancestors.c.id
+            )
+        )
+        stmt = select(exists().where(ancestors.c.id == ancestor_id))
+        try:
+            return bool(await self.db.scalar(stmt))
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error checking ancestors of individual {descendant_id}: {e!s}"
+            ) from e
+
+    async def get_ancestors(self, individual_id: UUID, max_depth: int) -> LineageEntity:
+        return await self._get_lineage(individual_id, max_depth, upwards=True)
+
+    async def get_descendants(
+        self, individual_id: UUID, max_depth: int
+    ) -> LineageEntity:
+        return await self._get_lineage(individual_id, max_depth, upwards=False)
+
+    async def _get_lineage(
+        self, individual_id: UUID, max_depth: int, *, upwards: bool
+    ) -> LineageEntity:
+        """Walk blood relations from an individual with a single recursive CTE.
+
+        `UNION` (not `UNION ALL`) drops duplicate (edge, depth) rows, which keeps
+        pedigree collapse from multiplying the working set.
+        """
+        relation = BloodRelationModel
+        near, far = (
+            (relation.child_id, relation.parent_id)
+            if upwards
+            else (relation.parent_id, relation.child_id)
+        )
+
+        lineage = (
+            select(relation.parent_id, relation.child_id, literal(1).label("depth"))
+            .where(near == individual_id)
+            .cte("lineage", recursive=True)
+        )
+        lineage = lineage.union(
+            select(relation.parent_id, relation.child_id, lineage.c.depth + 1)
+            .join(lineage, near == lineage.c[far.key])
+            .where(lineage.c.depth < max_depth)
+        )
+
+        stmt = select(
+            IndividualModel, lineage.c.parent_id, lineage.c.child_id, lineage.c.depth
+        ).join(lineage, IndividualModel.id == lineage.c[far.key])
+
+        try:
+            rows = (await self.db.execute(stmt)).all()
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving lineage of individual {individual_id}: {e!s}"
+            ) from e
+
+        result = LineageEntity(root_id=individual_id)
+        edges: set[tuple[UUID, UUID]] = set()
+        for individual, parent_id, child_id, depth in rows:
+            if individual.id not in result.depths:
+                result.individuals.append(IndividualMapper.model_to_entity(individual))
+                result.depths[individual.id] = depth
+            else:
+                result.depths[individual.id] = min(result.depths[individual.id], depth)
+            edges.add((parent_id, child_id))
+        result.blood_relations = [
+            BloodRelationEntity(parent_id=parent_id, child_id=child_id)
+            for parent_id, child_id in edges
+        ]
+        return result
+
+
+def _text_query(query: str) -> ColumnElement[Any]:
+    """A web-style query parsed under every text search configuration, OR-ed."""
+    parsed = [
+        func.websearch_to_tsquery(literal(config, REGCONFIG), query)
+        for config in TEXT_SEARCH_CONFIGS
+    ]
+    tsquery = parsed[0]
+    for other in parsed[1:]:
+        tsquery = tsquery.op("||")(other)
+    return tsquery
+
+
+def _headline(column: ColumnElement[Any], tsquery: ColumnElement[Any]) -> Any:
+    """Highlighted fragments of `column`, or NULL if it does not match."""
+    config = literal(TEXT_SEARCH_CONFIGS[0], REGCONFIG)
+    return case(
+        (
+            func.to_tsvector(config, column).op("@@")(tsquery),
+            func.ts_headline(config, column, tsquery, _HEADLINE_OPTIONS),
+        ),
+    )
+
+
+def _parse_key(
+    keys: tuple[ColumnElement[Any], ...], values: Sequence[object]
+) -> list[object]:
+    """Convert the JSON values of a cursor back to the types of the sort key."""
+    if len(values) != len(keys):
+        raise InvalidCursorError("Cursor does not match the listing order")
+    try:
+        return [
+            datetime.fromisoformat(value)
+            if key.type.python_type is datetime
+            else key.type.python_type(value)
+            for key, value in zip(keys, values, strict=True)
+        ]
+    # UUID() of a non-string raises AttributeError.
+    except (AttributeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
@@ -0,0 +1,242 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import and_, delete, exc, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from gtree.domain.entities.trees.marriage import MarriageEntity
+from gtree.infrastructure.db.exceptions import (
+    ConflictException,
+    NotFoundException,
+    RepositoryException,
+)
+from gtree.infrastructure.db.mappers.marriage import MarriageMapper
+from gtree.infrastructure.db.models.trees.individual import IndividualModel
+from gtree.infrastructure.db.models.trees.marriage import MarriageModel
+from gtree.infrastructure.db.repositories.base import (
+    STREAM_BATCH_SIZE,
+    RepositoryObjectBase,
+)
+
+
+class MarriageRepository(RepositoryObjectBase):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def create(self, marriage: MarriageEntity) -> MarriageEntity:
+        try:
+            db_obj = await self._insert_returning(
+                MarriageMapper.entity_to_model(marriage)
+            )
+            return MarriageMapper.model_to_entity(db_obj)
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(f"Error creating marriage: {str(e)}") from e
+
+    async def create_many(
+        self, marriages: list[MarriageEntity], *, skip_existing: bool = True
+    ) -> int:
+        """Insert marriages in bulk, skipping existing ones unless told otherwise.
+
+        Returns the number of inserted rows.
+        """
+        try:
+            return await self._insert_many(
+                [MarriageMapper.entity_to_model(m) for m in marriages],
+                skip_conflicts=skip_existing,
+            )
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(f"Error creating marriages: {e!s}") from e
+
+    async def get_by_tree_id(self, tree_id: UUID) -> list[MarriageEntity]:
+        try:
+            stmt = (
+                select(MarriageModel)
+                .join(IndividualModel, IndividualModel.id == MarriageModel.father_id)
+                .where(IndividualModel.tree_id == tree_id)
+            )
+            marriages = await self.db.scalars(stmt)
+            return [MarriageMapper.model_to_entity(marriage) for marriage in marriages]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving marriages for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def get_changed_since(
+        self, tree_id: UUID, since: datetime
+    ) -> list[MarriageEntity]:
+        """Marriages of a tree created or updated after `since`."""
+        try:
+            stmt = (
+                select(MarriageModel)
+                .join(IndividualModel, IndividualModel.id == MarriageModel.father_id)
+                .where(
+                    IndividualModel.tree_id == tree_id,
+                    MarriageModel.updated_at > since,
+                )
+                .order_by(MarriageModel.updated_at)
+            )
+            marriages = await self.db.scalars(stmt)
+            return [MarriageMapper.model_to_entity(marriage) for marriage in marriages]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving changed marriages for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def stream_by_tree_id(self, tree_id: UUID) -> AsyncIterator[MarriageEntity]:
+        """Yield the marriages of a tree from a server-side cursor."""
+        try:
+            stmt = (
+                select(MarriageModel)
+                .join(IndividualModel, IndividualModel.id == MarriageModel.father_id)
+                .where(IndividualModel.tree_id == tree_id)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            async for marriage in await self.db.stream_scalars(stmt):
+                yield MarriageMapper.model_to_entity(marriage)
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error streaming marriages for tree {tree_id}: {e!s}"
+            ) from e
+
+    async def get_by_id(self, father_id: UUID, mother_id: UUID) -> MarriageEntity:
+        try:
+            stmt = select(MarriageModel).where(
+                MarriageModel.father_id == father_id,
+                MarriageModel.mother_id == mother_id,
+            )
+            marriage = await self.db.scalar(stmt)
+            if marriage is None:
+                raise NotFoundException(f"Marriage {father_id} — {mother_id} not found")
+            return MarriageMapper.model_to_entity(marriage)
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving marriage {father_id} — {mother_id}: {e!s}"
+            ) from e
+
+    async def update(self, marriage_entity: MarriageEntity) -> MarriageEntity:
+        """Write the changed fields of MarriageEntity with one UPDATE ... RETURNING.
+
+        Raises:
+            NotFoundException: If marriage with the given IDs doesn't exist
+            ConflictException: If there's a database error during update
+        """
+        if not marriage_entity.dirty_fields:
+            return marriage_entity
+        try:
+            db_obj = await self._update_returning(
+                MarriageMapper.entity_to_model(marriage_entity),
+                marriage_entity.dirty_fields,
+            )
+            if db_obj is None:
+                raise NotFoundException(
+                    f"Marriage {marriage_entity.father_id} — "
+                    f"{marriage_entity.mother_id} not found"
+                )
+
+            return MarriageMapper.model_to_entity(db_obj)
+
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error updating marriage {marriage_entity.father_id} — "
+                f"{marriage_entity.mother_id}: {str(e)}"
+            ) from e
+
+    async def delete(self, father_id: UUID, mother_id: UUID) -> None:
+        try:
+            stmt = delete(MarriageModel).where(
+                MarriageModel.father_id == father_id,
+                MarriageModel.mother_id == mother_id,
+            )
+            await self.db.execute(stmt)
+            await self.db.flush()
+
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error deleting marriage {father_id} — {mother_id}: {str(e)}"
+            ) from e
+
+    async def move_individual(self, from_id: UUID, to_id: UUID) -> tuple[int, int]:
+        """Re-point every marriage of `from_id` to `to_id`, set-based.
+
+        A marriage of the two with each other is deleted. Where `to_id` is
+        already married to the same spouse, that marriage takes the details it
+        lacks from the duplicate, which is then deleted rather than moved.
+        Returns the numbers of moved and of deleted marriages.
+        """
+        marriage = MarriageModel
+        duplicate = aliased(MarriageModel)
+        try:
+            deleted = (
+                await self.db.execute(
+                    delete(marriage)
+                    .where(
+                        or_(
+                            and_(
+                                marriage.father_id == from_id,
+                                marriage.mother_id == to_id,
+                            ),
+                            and_(
+                                marriage.father_id == to_id,
+                                marriage.mother_id == from_id,
+                            ),
+                        )
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            ).rowcount
+            moved = 0
+            for own, spouse in (
+                (marriage.father_id, marriage.mother_id),
+                (marriage.mother_id, marriage.father_id),
+            ):
+                await self.db.execute(
+                    update(marriage)
+                    .where(
+                        own == to_id,
+                        getattr(duplicate, own.key) == from_id,
+                        getattr(duplicate, spouse.key) == spouse,
+                    )
+                    .values(
+                        {
+                            name: func.coalesce(
+                                getattr(marriage, name), getattr(duplicate, name)
+                            )
+                            for name in (
+                                "start_date",
+                                "end_date",
+                                "marriage_place",
+                                "notes",
+                            )
+                        }
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                deleted += (
+                    await self.db.execute(
+                        delete(marriage)
+                        .where(
+                            own == from_id,
+                            exists().where(
+                                getattr(duplicate, own.key) == to_id,
+                                getattr(duplicate, spouse.key) == spouse,
+                            ),
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+                ).rowcount
+                moved += (
+                    await self.db.execute(
+                        update(marriage)
+                        .where(own == from_id)
+                        .values({own.key: to_id})
+                        .execution_options(synchronize_session=False)
+                    )
+                ).rowcount
+            await self.db.flush()
+            return moved, deleted
+        except exc.SQLAlchemyError as e:
+            raise ConflictException(
+                f"Error moving marriages of individual {from_id}: {e!s}"
+            ) from e
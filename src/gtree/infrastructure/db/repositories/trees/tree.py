@@ -1,6 +1,7 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, exc, select
+from sqlalchemy import delete, exc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
@@ -22,10 +23,7 @@ class TreeRepository(RepositoryObjectBase):
 
     async def create(self, tree: TreeEntity) -> TreeEntity:
         try:
-            db_obj = TreeMapper.entity_to_model(tree)
-            self.db.add(db_obj)
-            await self.db.flush()
-            await self.db.refresh(db_obj)
+            db_obj = await self._insert_returning(TreeMapper.entity_to_model(tree))
             return TreeMapper.model_to_entity(db_obj)
         except exc.SQLAlchemyError as e:
             raise ConflictException(f"Error creating tree: {str(e)}") from e
@@ -64,32 +62,54 @@ class TreeRepository(RepositoryObjectBase):
                 f"Error retrieving accessible trees with id {tree_id}: {e!s}"
             ) from e
 
+    async def get_version(self, tree_id: UUID) -> int:
+        """Return the current version of a tree without loading the row."""
+        try:
+            version = await self.db.scalar(
+                select(TreeModel.version).where(TreeModel.id == tree_id)
+            )
+            if version is None:
+                raise NotFoundException(f"Tree with id {tree_id} not found")
+            return version
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving version of tree {tree_id}: {e!s}"
+            ) from e
+
+    async def get_sync_point(self, tree_id: UUID) -> tuple[int, datetime]:
+        """Return the version of a tree and the current database time (UTC)."""
+        try:
+            row = (
+                await self.db.execute(
+                    select(TreeModel.version, func.timezone("utc", func.now())).where(
+                        TreeModel.id == tree_id
+                    )
+                )
+            ).first()
+            if row is None:
+                raise NotFoundException(f"Tree with id {tree_id} not found")
+            return row[0], row[1]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving version of tree {tree_id}: {e!s}"
+            ) from e
+
     async def update(self, tree_entity: TreeEntity) -> TreeEntity:
-        """Update an existing tree with data from TreeEntity.
+        """Write the changed fields of TreeEntity with one UPDATE ... RETURNING.
 
         Raises:
             NotFoundException: If tree with the given ID doesn't exist
             ConflictException: If there's a database error during update
         """
+        if not tree_entity.dirty_fields:
+            return tree_entity
         try:
-            stmt = select(TreeModel).where(TreeModel.id == tree_entity.id)
-            db_obj = await self.db.scalar(stmt)
-
+            db_obj = await self._update_returning(
+                TreeMapper.entity_to_model(tree_entity), tree_entity.dirty_fields
+            )
             if db_obj is None:
                 raise NotFoundException(f"Tree with id {tree_entity.id} not found")
 
-            updated_model = TreeMapper.entity_to_model(tree_entity)
-
-            for field in TreeModel.__table__.columns:
-                field_name = field.name
-                if field_name != "id" and hasattr(updated_model, field_name):
-                    new_value = getattr(updated_model, field_name)
-                    if new_value is not None:
-                        setattr(db_obj, field_name, new_value)
-
-            await self.db.flush()
-            await self.db.refresh(db_obj)
-
             return TreeMapper.model_to_entity(db_obj)
 
         except exc.SQLAlchemyError as e:
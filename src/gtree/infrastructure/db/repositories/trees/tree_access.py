@@ -4,18 +4,43 @@ from sqlalchemy import exc, exists, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
+from gtree.core.config.settings import settings
 from gtree.domain.entities._value_objects.tree_access_level import TreeAccessLevel
 from gtree.domain.entities.trees.tree_access import TreeAccessEntity
 from gtree.infrastructure.db.exceptions import ConflictException, RepositoryException
 from gtree.infrastructure.db.mappers.tree_access import TreeAccessMapper
 from gtree.infrastructure.db.models.trees.tree_access import TreeAccessModel
 from gtree.infrastructure.db.repositories.base import RepositoryObjectBase
+from gtree.infrastructure.utils.cache import TTLCache
+
+_SESSION_CACHE_KEY = "tree_access_levels"
+
+_AccessKey = tuple[UUID, UUID]
+
+# Access levels reused across requests of this worker, if enabled. A change of
+# access made by another worker is seen after at most `access_cache_ttl`.
+_shared_levels: TTLCache[_AccessKey, TreeAccessLevel] | None = (
+    TTLCache(maxsize=settings.app.access_cache_size, ttl=settings.app.access_cache_ttl)
+    if settings.app.access_cache_ttl > 0
+    else None
+)
 
 
 class TreeAccessRepository(RepositoryObjectBase):
+    """Tree access levels of users.
+
+    Levels read by `get_access_level` are cached in the session's `info` for
+    the rest of the request, and optionally across requests of the worker.
+    `upsert` invalidates both.
+    """
+
     def __init__(self, db: AsyncSession):
         super().__init__(db)
 
+    @property
+    def _cache(self) -> dict[_AccessKey, TreeAccessLevel]:
+        return self.db.info.setdefault(_SESSION_CACHE_KEY, {})
+
     async def upsert(self, user: TreeAccessEntity) -> TreeAccessEntity:
         try:
             db_obj = TreeAccessMapper.entity_to_model(user)
@@ -36,11 +61,10 @@ class TreeAccessRepository(RepositoryObjectBase):
 
             result = await self.db.execute(stmt)
             updated_obj = result.scalar_one()
-            await self.db.commit()
+            self.invalidate(db_obj.user_id, db_obj.tree_id)
 
             return TreeAccessMapper.model_to_entity(updated_obj)
         except exc.SQLAlchemyError as e:
-            await self.db.rollback()
             raise ConflictException(f"Error creating tree access: {str(e)}") from e
 
     async def has_exact_access_level(
@@ -66,16 +90,37 @@ class TreeAccessRepository(RepositoryObjectBase):
         self, user_id: UUID, tree_id: UUID, min_access_level: TreeAccessLevel
     ) -> bool:
         """Checks if the user has at least the specified minimum access level."""
+        user_level = await self.get_access_level(user_id, tree_id)
+        return user_level.rank >= min_access_level.rank
+
+    async def get_access_level(self, user_id: UUID, tree_id: UUID) -> TreeAccessLevel:
+        """Return the user's access level to the tree, NOTHING if none."""
+        key = (user_id, tree_id)
+        if (level := self._cache.get(key)) is not None:
+            return level
+        shared = _shared_levels.get(key) if _shared_levels is not None else None
+        if (level := shared) is not None:
+            self._cache[key] = level
+            return level
         try:
             stmt = select(TreeAccessModel.access_level).where(
                 TreeAccessModel.tree_id == tree_id, TreeAccessModel.user_id == user_id
             )
-            user_access_level = await self.db.scalar(stmt)
-
-            user_level = TreeAccessLevel.from_string(user_access_level)
-            return user_level.rank >= min_access_level.rank
-
+            level = TreeAccessLevel.from_string(await self.db.scalar(stmt))
         except exc.SQLAlchemyError as e:
             raise RepositoryException(
                 f"Error checking minimum tree access: {str(e)}"
             ) from e
+
+        self._cache[key] = level
+        if _shared_levels is not None:
+            _shared_levels.set(key, level)
+        return level
+
+    def invalidate(self, user_id: UUID, tree_id: UUID) -> None:
+        key = (user_id, tree_id)
+        self._cache.pop(key, None)
+        if (shared := _shared_levels) is not None:
+            # Again after commit, in case a concurrent request cached the old level.
+            shared.pop(key)
+            self._after_commit(lambda: shared.pop(key))
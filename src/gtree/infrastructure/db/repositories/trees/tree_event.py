@@ -0,0 +1,34 @@
+from uuid import UUID
+
+from sqlalchemy import exc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gtree.domain.entities._value_objects.change_action import ChangeAction
+from gtree.domain.entities._value_objects.record_kind import RecordKind
+from gtree.domain.entities.trees.tree_event import TreeEventEntity
+from gtree.infrastructure.db.exceptions import RepositoryException
+from gtree.infrastructure.db.notifications import TREE_EVENTS_CHANNEL, encode_event
+from gtree.infrastructure.db.repositories.base import RepositoryObjectBase
+
+
+class TreeEventRepository(RepositoryObjectBase):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def publish(
+        self,
+        tree_id: UUID,
+        kind: RecordKind,
+        action: ChangeAction,
+        key: tuple[UUID, ...] | None = None,
+    ) -> None:
+        """Queue a NOTIFY in the current transaction; it is sent on commit."""
+        event = TreeEventEntity(tree_id=tree_id, kind=kind, action=action, key=key)
+        try:
+            await self.db.execute(
+                select(func.pg_notify(TREE_EVENTS_CHANNEL, encode_event(event)))
+            )
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error publishing event for tree {event.tree_id}: {e!s}"
+            ) from e
@@ -0,0 +1,93 @@
+from uuid import UUID
+
+from sqlalchemy import exc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gtree.domain.graph.tree_graph import TreeGraph
+from gtree.infrastructure.db.exceptions import NotFoundException, RepositoryException
+from gtree.infrastructure.db.models.trees.blood_relation import BloodRelationModel
+from gtree.infrastructure.db.models.trees.individual import IndividualModel
+from gtree.infrastructure.db.models.trees.marriage import MarriageModel
+from gtree.infrastructure.db.models.trees.tree import TreeModel
+from gtree.infrastructure.db.repositories.base import RepositoryObjectBase
+from gtree.infrastructure.utils.cache import TTLCache
+
+_SESSION_CACHE_KEY = "tree_graphs"
+
+# Process-wide graphs for read paths, keyed by tree and version. Every write
+# to a tree bumps its version, so writes in any worker make them unreachable.
+_shared_graphs: TTLCache[tuple[UUID, int], TreeGraph] = TTLCache(maxsize=32, ttl=30)
+
+
+class TreeGraphRepository(RepositoryObjectBase):
+    """Loads a whole tree as a `TreeGraph` with one query per table.
+
+    Graphs are cached in the session's `info`, so every service sharing the
+    request session reuses the same graph. Writers must call `invalidate`.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    @property
+    def _cache(self) -> dict[UUID, TreeGraph]:
+        return self.db.info.setdefault(_SESSION_CACHE_KEY, {})
+
+    async def load(self, tree_id: UUID) -> TreeGraph:
+        if (graph := self._cache.get(tree_id)) is not None:
+            return graph
+        try:
+            individuals = await self.db.execute(
+                select(IndividualModel.id, IndividualModel.gender).where(
+                    IndividualModel.tree_id == tree_id
+                )
+            )
+            blood_relations = await self.db.execute(
+                select(BloodRelationModel.parent_id, BloodRelationModel.child_id)
+                .join(
+                    IndividualModel, IndividualModel.id == BloodRelationModel.child_id
+                )
+                .where(IndividualModel.tree_id == tree_id)
+            )
+            marriages = await self.db.execute(
+                select(MarriageModel.father_id, MarriageModel.mother_id)
+                .join(IndividualModel, IndividualModel.id == MarriageModel.father_id)
+                .where(IndividualModel.tree_id == tree_id)
+            )
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error loading graph for tree {tree_id}: {e!s}"
+            ) from e
+
+        graph = TreeGraph.build(
+            individuals.tuples(), blood_relations.tuples(), marriages.tuples()
+        )
+        self._cache[tree_id] = graph
+        return graph
+
+    async def load_shared(self, tree_id: UUID) -> tuple[int, TreeGraph]:
+        """Like `load`, but reuses a graph cached across requests of this worker.
+
+        Returns the graph with the tree version it was cached under. The
+        version is read first, so the graph is never older than it. Only for
+        read-only transactions: a version written here may yet roll back.
+        """
+        try:
+            version = await self.db.scalar(
+                select(TreeModel.version).where(TreeModel.id == tree_id)
+            )
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving version of tree {tree_id}: {e!s}"
+            ) from e
+        if version is None:
+            raise NotFoundException(f"Tree with id {tree_id} not found")
+
+        if (graph := _shared_graphs.get((tree_id, version))) is not None:
+            return version, graph
+        graph = await self.load(tree_id)
+        _shared_graphs.set((tree_id, version), graph)
+        return version, graph
+
+    def invalidate(self, tree_id: UUID) -> None:
+        self._cache.pop(tree_id, None)
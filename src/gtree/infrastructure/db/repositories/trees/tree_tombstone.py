@@ -0,0 +1,34 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import exc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gtree.domain.entities.trees.tree_changes import TombstoneEntity
+from gtree.infrastructure.db.exceptions import RepositoryException
+from gtree.infrastructure.db.mappers.tree_tombstone import TreeTombstoneMapper
+from gtree.infrastructure.db.models.trees.tree_tombstone import TreeTombstoneModel
+from gtree.infrastructure.db.repositories.base import RepositoryObjectBase
+
+
+class TreeTombstoneRepository(RepositoryObjectBase):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def get_since(self, tree_id: UUID, since: datetime) -> list[TombstoneEntity]:
+        """Records of a tree deleted after `since`, oldest first."""
+        try:
+            stmt = (
+                select(TreeTombstoneModel)
+                .where(
+                    TreeTombstoneModel.tree_id == tree_id,
+                    TreeTombstoneModel.deleted_at > since,
+                )
+                .order_by(TreeTombstoneModel.deleted_at, TreeTombstoneModel.id)
+            )
+            tombstones = await self.db.scalars(stmt)
+            return [TreeTombstoneMapper.model_to_entity(t) for t in tombstones]
+        except exc.SQLAlchemyError as e:
+            raise RepositoryException(
+                f"Error retrieving tombstones for tree {tree_id}: {e!s}"
+            ) from e
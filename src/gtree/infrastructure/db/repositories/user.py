@@ -1,6 +1,10 @@
+import dataclasses
+from uuid import UUID
+
 from sqlalchemy import exc, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from gtree.core.config.settings import settings
 from gtree.domain.entities.user import UserEntity
 from gtree.infrastructure.db.exceptions import (
     ConflictException,
@@ -10,6 +14,22 @@ from gtree.infrastructure.db.exceptions import (
 from gtree.infrastructure.db.mappers.user import UserMapper
 from gtree.infrastructure.db.models.user import UserModel
 from gtree.infrastructure.db.repositories.base import RepositoryObjectBase
+from gtree.infrastructure.utils.cache import TTLCache
+
+# Users looked up on every authenticated request. A change made by another
+# worker is seen after at most `user_cache_ttl`; `update` in this worker drops
+# the entry at once.
+_shared_users: TTLCache[UUID, UserEntity] | None = (
+    TTLCache(maxsize=settings.app.user_cache_size, ttl=settings.app.user_cache_ttl)
+    if settings.app.user_cache_ttl > 0
+    else None
+)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Forget a cached user, e.g. after it was changed outside `update`."""
+    if _shared_users is not None:
+        _shared_users.pop(user_id)
 
 
 class UserRepository(RepositoryObjectBase):
@@ -18,10 +38,7 @@ class UserRepository(RepositoryObjectBase):
 
     async def create(self, user: UserEntity) -> UserEntity:
         try:
-            db_obj = UserMapper.entity_to_model(user)
-            self.db.add(db_obj)
-            await self.db.flush()
-            await self.db.refresh(db_obj)
+            db_obj = await self._insert_returning(UserMapper.entity_to_model(user))
             return UserMapper.model_to_entity(db_obj)
         except exc.SQLAlchemyError as e:
             raise ConflictException(f"Error creating user: {str(e)}") from e
@@ -38,6 +55,19 @@ class UserRepository(RepositoryObjectBase):
                 f"Error retrieving user by id {id}: {str(e)}"
             ) from e
 
+    async def get_by_id_cached(self, user_id: UUID) -> UserEntity:
+        """Like `get_by_id`, but reuses users cached across requests.
+
+        Returns a copy, so callers may modify it without touching the cache.
+        """
+        if _shared_users is None:
+            return await self.get_by_id(user_id)
+        user = _shared_users.get(user_id)
+        if user is None:
+            user = await self.get_by_id(user_id)
+            _shared_users.set(user_id, user)
+        return dataclasses.replace(user)
+
     async def get_by_email(self, email: str) -> UserEntity:
         """Get user by email address."""
         try:
@@ -76,30 +106,22 @@ class UserRepository(RepositoryObjectBase):
             ) from e
 
     async def update(self, user_entity: UserEntity) -> UserEntity:
-        """Update an existing user with data from UserEntity.
+        """Write the changed fields of UserEntity with one UPDATE ... RETURNING.
 
         Raises:
             NotFoundException: If user with the given ID doesn't exist
             ConflictException: If there's a database error during update
         """
+        if not user_entity.dirty_fields:
+            return user_entity
         try:
-            stmt = select(UserModel).where(UserModel.id == user_entity.id)
-            db_obj = await self.db.scalar(stmt)
-
+            db_obj = await self._update_returning(
+                UserMapper.entity_to_model(user_entity), user_entity.dirty_fields
+            )
             if db_obj is None:
                 raise NotFoundException(f"User with id {user_entity.id} not found")
-
-            updated_model = UserMapper.entity_to_model(user_entity)
-
-            for field in UserModel.__table__.columns:
-                field_name = field.name
-                if field_name != "id" and hasattr(updated_model, field_name):
-                    new_value = getattr(updated_model, field_name)
-                    if new_value is not None:
-                        setattr(db_obj, field_name, new_value)
-
-            await self.db.flush()
-            await self.db.refresh(db_obj)
+            invalidate_cached_user(user_entity.id)
+            self._after_commit(lambda: invalidate_cached_user(user_entity.id))
 
             return UserMapper.model_to_entity(db_obj)
 
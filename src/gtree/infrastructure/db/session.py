@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from gtree.core.config.settings import settings
+from gtree.infrastructure.db.unit_of_work import UnitOfWork
 
 
 def create_engine(url: str, is_echo: bool = False) -> AsyncEngine:
@@ -53,12 +54,6 @@ session_factory = get_session_factory(engine)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession]:
-    async with session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    """Session of the request's unit of work, committed once after the endpoint."""
+    async with UnitOfWork(session_factory) as uow:
+        yield uow.session
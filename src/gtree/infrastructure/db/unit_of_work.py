@@ -0,0 +1,58 @@
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_SESSION_INFO_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    """Transaction boundary of a request or command.
+
+    Repositories only execute and flush statements on the shared session. The
+    unit of work commits all of them at once when its block exits normally and
+    rolls them back on an exception. Callbacks registered with `after_commit`
+    (e.g. invalidation of process-wide caches) run once the data is durable.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+        self._after_commit: list[Callable[[], None]] = []
+
+    async def __aenter__(self) -> Self:
+        self.session = self._session_factory()
+        self.session.info[_SESSION_INFO_KEY] = self
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        self._after_commit.clear()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._after_commit.append(callback)
+
+    @staticmethod
+    def of(session: AsyncSession) -> "UnitOfWork | None":
+        """The unit of work owning `session`, if any."""
+        return session.info.get(_SESSION_INFO_KEY)
@@ -1,22 +1,79 @@
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
+import hashlib
+import time
 from typing import Any
 
 import bcrypt
 import jwt
 
 from gtree.core.config.settings import settings
-from gtree.infrastructure.utils.exceptions import InvalidTokenError
+from gtree.infrastructure.utils.cache import TTLCache
+from gtree.infrastructure.utils.exceptions import (
+    InvalidTokenError,
+    PasswordHashingBusyError,
+)
 
+# bcrypt releases the GIL, so a few threads hash in parallel while the event
+# loop keeps serving other requests. Operations beyond the threads plus the
+# queue are rejected instead of piling up behind a login storm.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
+_max_pending_hashes = (
+    settings.password.password_hash_workers + settings.password.password_hash_queue_size
+)
+_pending_hashes = 0
 
-def hash_password(password: str) -> bytes:
+# Payloads of verified tokens by SHA-256 of the token, so the signature of a
+# token is checked once per worker and cache period rather than per request.
+_decoded_tokens: TTLCache[bytes, dict[str, Any]] | None = (
+    TTLCache(
+        maxsize=settings.jwt.decoded_token_cache_size,
+        ttl=settings.jwt.decoded_token_cache_ttl,
+    )
+    if settings.jwt.decoded_token_cache_ttl > 0
+    else None
+)
+
+
+@asynccontextmanager
+async def _hash_slot() -> AsyncIterator[None]:
+    """Reserve a place among the running and queued hash operations."""
+    global _pending_hashes
+    if _pending_hashes >= _max_pending_hashes:
+        raise PasswordHashingBusyError("Too many authentication requests, retry later")
+    _pending_hashes += 1
+    try:
+        yield
+    finally:
+        _pending_hashes -= 1
+
+
+async def hash_password(password: str) -> bytes:
     """Hash password using bcrypt and return bytes for storage."""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode(), salt)
+    salt = bcrypt.gensalt(rounds=settings.password.bcrypt_rounds)
+    async with _hash_slot():
+        return await asyncio.get_running_loop().run_in_executor(
+            _hash_executor, bcrypt.hashpw, password.encode(), salt
+        )
 
 
-def verify_password(password: str, hashed_password: bytes) -> bool:
+async def verify_password(password: str, hashed_password: bytes) -> bool:
     """Verify password against stored hash (bytes)."""
-    return bcrypt.checkpw(password.encode(), hashed_password)
+    async with _hash_slot():
+        return await asyncio.get_running_loop().run_in_executor(
+            _hash_executor, bcrypt.checkpw, password.encode(), hashed_password
+        )
+
+
+def shutdown_password_hashing() -> None:
+    """Stop the hashing threads; called on application shutdown."""
+    _hash_executor.shutdown(wait=True, cancel_futures=True)
 
 
 def encode_jwt(
@@ -53,3 +110,19 @@ def decode_jwt(
         return decoded
     except jwt.InvalidTokenError as e:
         raise InvalidTokenError(str(e)) from e
+
+
+def decode_jwt_cached(token: str) -> dict[str, Any]:
+    """Like `decode_jwt` with the default key, reusing earlier verifications.
+
+    Cached payloads are dropped once the token expires.
+    """
+    if _decoded_tokens is None:
+        return decode_jwt(token)
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _decoded_tokens.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+    payload = decode_jwt(token)
+    _decoded_tokens.set(key, payload)
+    return payload
@@ -0,0 +1,29 @@
+"""Opaque cursors for keyset pagination.
+
+A cursor is the URL-safe base64 of a JSON array: the sort order it belongs
+to followed by the sort key of the last row of the previous page.
+"""
+
+import base64
+import binascii
+from collections.abc import Sequence
+import json
+
+from gtree.infrastructure.utils.exceptions import InvalidCursorError
+
+
+def encode_cursor(order: str, key: Sequence[object]) -> str:
+    data = json.dumps([order, *key], default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(order: str, cursor: str) -> list[object]:
+    """Return the sort key stored in `cursor`, checking it matches `order`."""
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+    if not isinstance(values, list) or not values or values[0] != order:
+        raise InvalidCursorError("Cursor does not belong to this listing order")
+    return values[1:]
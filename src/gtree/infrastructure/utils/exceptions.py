@@ -17,3 +17,24 @@ class InvalidTokenError(UtilsException, jwt.InvalidTokenError):
         self.message = message
         self.status_code = status_code
         super().__init__(self.message)
+
+
+class GedcomParseError(UtilsException):
+    """Raised when a GEDCOM file cannot be parsed."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message, status_code)
+
+
+class InvalidCursorError(UtilsException):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message, status_code)
+
+
+class PasswordHashingBusyError(UtilsException):
+    """Raised when too many password hash operations are already queued."""
+
+    def __init__(self, message: str, status_code: int = 503):
+        super().__init__(message, status_code)
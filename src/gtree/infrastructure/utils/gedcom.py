@@ -0,0 +1,232 @@
+"""Streaming GEDCOM 5.5 reader and writer helpers.
+
+Records are parsed one level-0 record at a time, so memory use does not
+depend on the size of the file.
+"""
+
+import codecs
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date
+import re
+
+from gtree.domain.entities._value_objects.date_precision import DatePrecision
+from gtree.domain.exceptions import DomainValidationException
+from gtree.infrastructure.utils.exceptions import GedcomParseError
+
+_NEWLINE = re.compile(r"\r\n|\r|\n")
+_MONTHS = {
+    "JAN": 1,
+    "FEB": 2,
+    "MAR": 3,
+    "APR": 4,
+    "MAY": 5,
+    "JUN": 6,
+    "JUL": 7,
+    "AUG": 8,
+    "SEP": 9,
+    "OCT": 10,
+    "NOV": 11,
+    "DEC": 12,
+}
+_QUALIFIERS = {
+    "ABT": DatePrecision.ABOUT,
+    "CAL": DatePrecision.ABOUT,
+    "EST": DatePrecision.ABOUT,
+    "INT": DatePrecision.ABOUT,
+    "BEF": DatePrecision.BEFORE,
+    "TO": DatePrecision.BEFORE,
+    "AFT": DatePrecision.AFTER,
+    "FROM": DatePrecision.AFTER,
+    "BET": DatePrecision.AFTER,
+}
+_MONTH_NAMES = {number: name for name, number in _MONTHS.items()}
+_PREFIXES = {
+    DatePrecision.ABOUT: "ABT",
+    DatePrecision.BEFORE: "BEF",
+    DatePrecision.AFTER: "AFT",
+}
+# GEDCOM lines are limited to 255 characters; longer values continue in CONC.
+_MAX_VALUE_LENGTH = 240
+
+
+@dataclass(slots=True)
+class GedcomNode:
+    """A GEDCOM line with its subordinate lines."""
+
+    tag: str
+    value: str = ""
+    xref: str | None = None
+    children: list["GedcomNode"] = field(default_factory=list)
+
+    def first(self, tag: str) -> "GedcomNode | None":
+        return next((child for child in self.children if child.tag == tag), None)
+
+    def all(self, tag: str) -> list["GedcomNode"]:
+        return [child for child in self.children if child.tag == tag]
+
+    def value_of(self, *path: str) -> str | None:
+        """Value of the first node at `path` below this one, None if absent or empty."""
+        node: GedcomNode | None = self
+        for tag in path:
+            node = node.first(tag) if node is not None else None
+        return (node.value or None) if node is not None else None
+
+
+class GedcomParser:
+    """Incremental parser: feed lines, get complete level-0 records back."""
+
+    def __init__(self) -> None:
+        self._stack: list[GedcomNode] = []
+        self._line_number = 0
+
+    def feed(self, line: str) -> GedcomNode | None:
+        """Consume one line; return the previous record once a new one starts."""
+        self._line_number += 1
+        line = line.rstrip("\r\n").lstrip("\ufeff \t")
+        if not line:
+            return None
+
+        level_text, _, rest = line.partition(" ")
+        if not level_text.isdigit():
+            raise GedcomParseError(f"Line {self._line_number}: invalid level")
+        level = int(level_text)
+        xref = None
+        if rest.startswith("@"):
+            xref, _, rest = rest.partition(" ")
+        tag, _, value = rest.partition(" ")
+        if not tag:
+            raise GedcomParseError(f"Line {self._line_number}: missing tag")
+
+        if level == 0:
+            record, self._stack = self.close(), [GedcomNode(tag, value, xref)]
+            return record
+        if not self._stack or level > len(self._stack):
+            raise GedcomParseError(f"Line {self._line_number}: unexpected level")
+
+        del self._stack[level:]
+        parent = self._stack[-1]
+        if tag == "CONC":
+            parent.value += value
+        elif tag == "CONT":
+            parent.value += "\n" + value
+        else:
+            node = GedcomNode(tag, value, xref)
+            parent.children.append(node)
+            self._stack.append(node)
+        return None
+
+    def close(self) -> GedcomNode | None:
+        """Return the last pending record, if any."""
+        record = self._stack[0] if self._stack else None
+        self._stack = []
+        return record
+
+
+def parse_records(lines: Iterable[str]) -> Iterator[GedcomNode]:
+    parser = GedcomParser()
+    for line in lines:
+        if (record := parser.feed(line)) is not None:
+            yield record
+    if (record := parser.close()) is not None:
+        yield record
+
+
+async def parse_records_async(lines: AsyncIterable[str]) -> AsyncIterator[GedcomNode]:
+    parser = GedcomParser()
+    async for line in lines:
+        if (record := parser.feed(line)) is not None:
+            yield record
+    if (record := parser.close()) is not None:
+        yield record
+
+
+async def decode_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 bytes into lines (CR, LF or CRLF terminated).
+
+    A CRLF split across chunks yields an extra empty line, which the parser
+    ignores.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        *lines, pending = _NEWLINE.split(pending + decoder.decode(chunk))
+        for line in lines:
+            yield line
+    for line in _NEWLINE.split(pending + decoder.decode(b"", final=True)):
+        yield line
+
+
+def parse_date(value: str | None) -> tuple[date | None, DatePrecision | None]:
+    """Parse a GEDCOM date into the first day it may denote and its precision.
+
+    Ranges (`BET x AND y`, `FROM x TO y`) keep their lower bound; dates that
+    cannot be represented (phrases, other calendars, BC) yield (None, None).
+    """
+    if not value:
+        return None, None
+    tokens = value.upper().replace("@#DGREGORIAN@", "").split()
+    qualifier = None
+    if tokens and tokens[0] in _QUALIFIERS:
+        qualifier = _QUALIFIERS[tokens[0]]
+        tokens = tokens[1:]
+    # INT dates are followed by the phrase they were interpreted from.
+    phrase = next(
+        (i for i, token in enumerate(tokens) if token.startswith("(")), len(tokens)
+    )
+    tokens = tokens[:phrase]
+    for separator in ("AND", "TO"):
+        if separator in tokens:
+            tokens = tokens[: tokens.index(separator)]
+    if not tokens or tokens[0].startswith("@") or len(tokens) > 3:
+        return None, None
+
+    try:
+        year = int(tokens[-1].split("/")[0])
+        month = _MONTHS[tokens[-2]] if len(tokens) >= 2 else 1
+        day = int(tokens[-3]) if len(tokens) == 3 else 1
+        parsed = date(year, month, day)
+    except (KeyError, ValueError):
+        return None, None
+
+    precision = (DatePrecision.YEAR, DatePrecision.MONTH, DatePrecision.DAY)[
+        len(tokens) - 1
+    ]
+    return parsed, qualifier or precision
+
+
+def format_date(value: date, precision: str | None) -> str:
+    """Format a stored date and its precision as a GEDCOM date value."""
+    try:
+        parsed = DatePrecision.from_string(precision) or DatePrecision.DAY
+    except DomainValidationException:
+        parsed = DatePrecision.DAY
+    month = _MONTH_NAMES[value.month]
+    if parsed == DatePrecision.DAY:
+        return f"{value.day} {month} {value.year}"
+    if parsed == DatePrecision.MONTH:
+        return f"{month} {value.year}"
+    if parsed in _PREFIXES:
+        return f"{_PREFIXES[parsed]} {value.year}"
+    return str(value.year)
+
+
+def format_line(
+    level: int, tag: str, value: str | None = None, xref: str | None = None
+) -> Iterator[str]:
+    """Yield a GEDCOM line, continuing multi-line and long values in CONT/CONC."""
+    head = f"{level} {xref} {tag}" if xref else f"{level} {tag}"
+    if not value:
+        yield head + "\n"
+        return
+    for number, text in enumerate(value.splitlines()):
+        pieces = [
+            text[i : i + _MAX_VALUE_LENGTH]
+            for i in range(0, len(text), _MAX_VALUE_LENGTH)
+        ] or [""]
+        for index, piece in enumerate(pieces):
+            if number == 0 and index == 0:
+                prefix = head
+            else:
+                prefix = f"{level + 1} {'CONC' if index else 'CONT'}"
+            yield f"{prefix} {piece}\n" if piece else f"{prefix}\n"
@@ -0,0 +1,199 @@
+"""Daitch–Mokotoff Soundex for Slavic, Germanic and transliterated names.
+
+Cyrillic names are transliterated before coding, so "Иванов", "Ivanov" and
+"Iwanow" all get the code 076700. Some letters sound differently depending
+on the language ("ch" is a German "kh" or a Polish "tsh"), so a word may have
+several codes; two spellings match if their code sets intersect.
+"""
+
+from collections.abc import Iterable
+import re
+import unicodedata
+
+CODE_LENGTH = 6
+
+_TRANSLITERATION = str.maketrans(
+    {
+        "а": "a",
+        "б": "b",
+        "в": "v",
+        "г": "g",
+        "ґ": "g",
+        "д": "d",
+        "е": "e",
+        "ё": "e",
+        "є": "ye",
+        "ж": "zh",
+        "з": "z",
+        "и": "i",
+        "і": "i",
+        "ї": "yi",
+        "й": "y",
+        "к": "k",
+        "л": "l",
+        "м": "m",
+        "н": "n",
+        "о": "o",
+        "п": "p",
+        "р": "r",
+        "с": "s",
+        "т": "t",
+        "у": "u",
+        "ў": "u",
+        "ф": "f",
+        "х": "kh",
+        "ц": "ts",
+        "ч": "ch",
+        "ш": "sh",
+        "щ": "shch",
+        "ъ": "",
+        "ы": "y",
+        "ь": "",
+        "э": "e",
+        "ю": "yu",
+        "я": "ya",
+        # Latin letters that do not decompose into a base letter and a mark.
+        "ł": "l",
+        "ø": "o",
+        "đ": "d",
+        "ß": "ss",
+        "æ": "ae",
+        "œ": "oe",
+    }
+)
+
+_VOWELS = frozenset("AEIOU")
+
+# Sound groups and their codes at the start of a word, before a vowel and
+# elsewhere ("" when not coded). Groups with two codings branch the result.
+_RULES: tuple[tuple[tuple[str, ...], tuple[tuple[str, str, str], ...]], ...] = (
+    (("AI", "AJ", "AY"), (("0", "1", ""),)),
+    (("AU",), (("0", "7", ""),)),
+    (("A",), (("0", "", ""),)),
+    (("B",), (("7", "7", "7"),)),
+    (("CHS",), (("5", "54", "54"),)),
+    (("CH",), (("5", "5", "5"), ("4", "4", "4"))),
+    (("CK",), (("5", "5", "5"), ("45", "45", "45"))),
+    (("CZ", "CS", "CSZ", "CZS"), (("4", "4", "4"),)),
+    (("C",), (("5", "5", "5"), ("4", "4", "4"))),
+    (("DRZ", "DRS", "DS", "DSH", "DSZ", "DZ", "DZH", "DZS"), (("4", "4", "4"),)),
+    (("D", "DT"), (("3", "3", "3"),)),
+    (("EI", "EJ", "EY"), (("0", "1", ""),)),
+    (("EU",), (("1", "1", ""),)),
+    (("E",), (("0", "", ""),)),
+    (("FB", "F"), (("7", "7", "7"),)),
+    (("G",), (("5", "5", "5"),)),
+    (("H",), (("5", "5", ""),)),
+    (("IA", "IE", "IO", "IU"), (("1", "", ""),)),
+    (("I",), (("0", "", ""),)),
+    (("J",), (("1", "1", "1"), ("4", "4", "4"))),
+    (("KS",), (("5", "54", "54"),)),
+    (("KH", "K"), (("5", "5", "5"),)),
+    (("L",), (("8", "8", "8"),)),
+    (("MN", "NM"), (("66", "66", "66"),)),
+    (("M", "N"), (("6", "6", "6"),)),
+    (("OI", "OJ", "OY"), (("0", "1", ""),)),
+    (("O",), (("0", "", ""),)),
+    (("P", "PF", "PH"), (("7", "7", "7"),)),
+    (("Q",), (("5", "5", "5"),)),
+    (("RZ", "RS"), (("94", "94", "94"), ("4", "4", "4"))),
+    (("R",), (("9", "9", "9"),)),
+    (
+        ("SCHTSCH", "SCHTSH", "SCHTCH", "SHTCH", "SHCH", "SHTSH"),
+        (("2", "4", "4"),),
+    ),
+    (("SCH", "SH"), (("4", "4", "4"),)),
+    (("SHT", "SCHT", "SCHD", "ST", "SZT", "SHD", "SZD", "SD"), (("2", "43", "43"),)),
+    (
+        ("STCH", "STSCH", "SC", "STRZ", "STRS", "STSH", "SZCZ", "SZCS"),
+        (("2", "4", "4"),),
+    ),
+    (("SZ", "S"), (("4", "4", "4"),)),
+    (("TCH", "TTCH", "TTSCH", "TRZ", "TRS", "TSCH", "TSH"), (("4", "4", "4"),)),
+    (("TS", "TTS", "TTSZ", "TC", "TZ", "TTZ", "TZS", "TSZ"), (("4", "4", "4"),)),
+    (("TH", "T"), (("3", "3", "3"),)),
+    (("UI", "UJ", "UY"), (("0", "1", ""),)),
+    (("UE", "U"), (("0", "", ""),)),
+    (("V", "W"), (("7", "7", "7"),)),
+    (("X",), (("5", "54", "54"),)),
+    (("Y",), (("1", "", ""),)),
+    (("ZDZ", "ZDZH", "ZHDZH"), (("2", "4", "4"),)),
+    (("ZD", "ZHD"), (("2", "43", "43"),)),
+    (("ZH", "ZS", "ZSCH", "ZSH", "Z"), (("4", "4", "4"),)),
+)
+
+# Patterns by first letter, longest first, so the longest match wins.
+_PATTERNS: dict[str, list[tuple[str, tuple[tuple[str, str, str], ...]]]] = {}
+for _patterns, _codings in _RULES:
+    for _pattern in _patterns:
+        _PATTERNS.setdefault(_pattern[0], []).append((_pattern, _codings))
+for _candidates in _PATTERNS.values():
+    _candidates.sort(key=lambda candidate: -len(candidate[0]))
+
+_WORD_SEPARATOR = re.compile(r"[\s\-]+")
+
+
+def _normalize(word: str) -> str:
+    """Upper-case ASCII letters of a word, transliterated from Cyrillic."""
+    word = word.lower().translate(_TRANSLITERATION)
+    word = unicodedata.normalize("NFKD", word)
+    return "".join(ch for ch in word.upper() if "A" <= ch <= "Z")
+
+
+def soundex_codes(word: str) -> set[str]:
+    """Daitch–Mokotoff codes of a single word; empty if it has no letters."""
+    letters = _normalize(word)
+    if not letters:
+        return set()
+
+    # Each branch is (code so far, last coded sound); the last sound is reset
+    # by uncoded letters, so only adjacent repeats are coded once.
+    branches: set[tuple[str, str]] = {("", "")}
+    position = 0
+    while position < len(letters):
+        pattern, codings = next(
+            (
+                (pattern, codings)
+                for pattern, codings in _PATTERNS.get(letters[position], ())
+                if letters.startswith(pattern, position)
+            ),
+            ("", ()),
+        )
+        if not pattern:
+            position += 1
+            continue
+        following = letters[position + len(pattern) : position + len(pattern) + 1]
+        slot = 0 if position == 0 else 1 if following in _VOWELS else 2
+        # "MN" and "NM" across a pattern boundary are both coded.
+        force = position > 0 and letters[position - 1 : position + 1] in ("MN", "NM")
+        next_branches: set[tuple[str, str]] = set()
+        for code, last in branches:
+            for coding in codings:
+                sound = coding[slot]
+                if sound and (force or not last.endswith(sound)):
+                    next_branches.add((code + sound, sound))
+                else:
+                    next_branches.add((code, sound))
+        branches = next_branches
+        position += len(pattern)
+
+    return {code[:CODE_LENGTH].ljust(CODE_LENGTH, "0") for code, _ in branches}
+
+
+def name_codes(*names: str | None) -> list[str]:
+    """Codes of every word of the given names, sorted and without duplicates."""
+    codes: set[str] = set()
+    for word in _words(names):
+        codes |= soundex_codes(word)
+    return sorted(codes)
+
+
+def query_codes(query: str) -> list[list[str]]:
+    """Codes of each word of a search query that has any."""
+    return [sorted(codes) for codes in map(soundex_codes, _words((query,))) if codes]
+
+
+def _words(names: Iterable[str | None]) -> list[str]:
+    return [
+        word for name in names if name for word in _WORD_SEPARATOR.split(name) if word
+    ]
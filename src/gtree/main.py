@@ -8,6 +8,9 @@ import structlog
 from gtree.api.v1.error_handling import setup_exception_handlers
 from gtree.api.v1.routers import api_v1_router
 from gtree.core.logging import setup_logging
+from gtree.infrastructure.db.jobs.runner import background_jobs
+from gtree.infrastructure.db.notifications import tree_event_hub
+from gtree.infrastructure.utils.auth import shutdown_password_hashing
 
 setup_logging()
 logger = structlog.get_logger(__name__)
@@ -26,6 +29,9 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     logger.info("Starting application...")
     yield
     logger.info("Shutting down application...")
+    shutdown_password_hashing()
+    await tree_event_hub.close()
+    await background_jobs.close()
 
 
 def create_app() -> FastAPI:
@@ -0,0 +1,95 @@
+from datetime import date
+
+import pytest
+
+from gtree.domain.funcs.dates import (
+    ABOUT_YEARS,
+    MAX_LIFESPAN_YEARS,
+    date_bounds,
+    lifespan_bounds,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    ("value", "precision", "bounds"),
+    [
+        (date(1850, 3, 12), "day", (date(1850, 3, 12), date(1850, 3, 12))),
+        (date(1850, 3, 12), None, (date(1850, 3, 12), date(1850, 3, 12))),
+        (date(1850, 3, 12), "fortnight", (date(1850, 3, 12), date(1850, 3, 12))),
+        (date(1850, 2, 1), "month", (date(1850, 2, 1), date(1850, 2, 28))),
+        (date(1852, 2, 1), "MONTH", (date(1852, 2, 1), date(1852, 2, 29))),
+        (date(1850, 1, 1), "year", (date(1850, 1, 1), date(1850, 12, 31))),
+        (
+            date(1850, 1, 1),
+            "about",
+            (date(1850 - ABOUT_YEARS, 1, 1), date(1850 + ABOUT_YEARS, 12, 31)),
+        ),
+        (date(1850, 1, 1), "before", (None, date(1850, 1, 1))),
+        (date(1850, 1, 1), "after", (date(1850, 1, 1), None)),
+        (date(3, 1, 1), "about", (date(1, 1, 1), date(3 + ABOUT_YEARS, 12, 31))),
+        (date(9998, 1, 1), "about", (date(9998 - ABOUT_YEARS, 1, 1), date.max)),
+    ],
+)
+def test_date_bounds(
+    value: date, precision: str | None, bounds: tuple[date | None, date | None]
+) -> None:
+    assert date_bounds(value, precision) == bounds
+
+
+def test_lifespan_without_dates_is_unknown() -> None:
+    assert lifespan_bounds(None, None) is None
+
+
+def test_lifespan_runs_from_birth_to_death() -> None:
+    birth = date_bounds(date(1850, 1, 1), "year")
+    death = date_bounds(date(1900, 5, 1), "month")
+
+    assert lifespan_bounds(birth, death) == (date(1850, 1, 1), date(1900, 5, 31))
+
+
+def test_lifespan_without_death_lasts_at_most_max_lifespan() -> None:
+    birth = date_bounds(date(1850, 3, 12), "day")
+
+    assert lifespan_bounds(birth, None) == (
+        date(1850, 3, 12),
+        date(1850 + MAX_LIFESPAN_YEARS, 12, 31),
+    )
+
+
+def test_lifespan_without_birth_starts_max_lifespan_before_death() -> None:
+    death = date_bounds(date(1900, 1, 1), "year")
+
+    assert lifespan_bounds(None, death) == (
+        date(1900 - MAX_LIFESPAN_YEARS, 1, 1),
+        date(1900, 12, 31),
+    )
+
+
+def test_lifespan_open_ends_are_bounded_by_the_nearest_known_day() -> None:
+    born_before = date_bounds(date(1850, 1, 1), "before")
+    died_after = date_bounds(date(1900, 1, 1), "after")
+
+    assert lifespan_bounds(born_before, died_after) == (
+        date(1900 - MAX_LIFESPAN_YEARS, 1, 1),
+        date(1850 + MAX_LIFESPAN_YEARS, 12, 31),
+    )
+
+
+def test_lifespan_covers_contradictory_dates() -> None:
+    birth = date_bounds(date(1900, 1, 1), "year")
+    death = date_bounds(date(1850, 1, 1), "year")
+
+    assert lifespan_bounds(birth, death) == (date(1850, 1, 1), date(1900, 12, 31))
+
+
+def test_lifespan_is_clamped_to_representable_dates() -> None:
+    assert lifespan_bounds(None, (date(50, 1, 1), date(50, 12, 31))) == (
+        date(1, 1, 1),
+        date(50, 12, 31),
+    )
+    assert lifespan_bounds((date(9950, 1, 1), None), None) == (
+        date(9950, 1, 1),
+        date(9999, 12, 31),
+    )
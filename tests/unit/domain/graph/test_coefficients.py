@@ -0,0 +1,124 @@
+from uuid import uuid4
+
+import pytest
+
+from gtree.domain.graph.coefficients import RelationshipCoefficients, topological_order
+from gtree.domain.graph.tree_graph import TreeGraph
+
+pytestmark = pytest.mark.unit
+
+
+def _graph(size: int, blood_relations: list[tuple[int, int]]) -> TreeGraph:
+    return TreeGraph([uuid4() for _ in range(size)], blood_relations, [])
+
+
+def _family(*children: tuple[int, int, int]) -> list[tuple[int, int]]:
+    """(parent, child) edges from (father, mother, child) triples."""
+    return [
+        edge
+        for father, mother, child in children
+        for edge in ((father, child), (mother, child))
+    ]
+
+
+# 0 + 1 -> 2, 3 (siblings); 2 + 4 -> 5; 3 + 6 -> 7 (5 and 7 are first
+# cousins); 5 + 7 -> 8 (child of first cousins).
+COUSINS = _graph(9, _family((0, 1, 2), (0, 1, 3), (2, 4, 5), (3, 6, 7), (5, 7, 8)))
+
+
+@pytest.mark.parametrize(
+    ("node", "other", "kinship"),
+    [
+        (0, 0, 1 / 2),
+        (0, 1, 0),
+        (0, 2, 1 / 4),
+        (2, 3, 1 / 4),
+        (0, 5, 1 / 8),
+        (5, 7, 1 / 16),
+        (4, 7, 0),
+    ],
+)
+def test_kinship(node: int, other: int, kinship: float) -> None:
+    coefficients = RelationshipCoefficients(COUSINS)
+
+    assert coefficients.kinship(node, other) == pytest.approx(kinship)
+    assert coefficients.kinship(other, node) == pytest.approx(kinship)
+
+
+def test_inbreeding_of_child_of_first_cousins() -> None:
+    coefficients = RelationshipCoefficients(COUSINS)
+
+    assert coefficients.inbreeding(8) == pytest.approx(1 / 16)
+    assert coefficients.kinship(8, 8) == pytest.approx((1 + 1 / 16) / 2)
+    assert list(coefficients.inbreeding_all()) == pytest.approx(
+        [0, 0, 0, 0, 0, 0, 0, 0, 1 / 16]
+    )
+
+
+def test_relationship_of_relatives() -> None:
+    coefficients = RelationshipCoefficients(COUSINS)
+
+    assert coefficients.relationship(2, 2) == 1.0
+    assert coefficients.relationship(0, 2) == pytest.approx(1 / 2)
+    assert coefficients.relationship(2, 3) == pytest.approx(1 / 2)
+    assert coefficients.relationship(5, 7) == pytest.approx(1 / 8)
+
+
+def test_half_siblings() -> None:
+    # 0 + 1 -> 3; 0 + 2 -> 4.
+    coefficients = RelationshipCoefficients(_graph(5, _family((0, 1, 3), (0, 2, 4))))
+
+    assert coefficients.kinship(3, 4) == pytest.approx(1 / 8)
+
+
+def test_double_first_cousins() -> None:
+    # Two brothers (2, 3) marry two sisters (4, 5).
+    graph = _graph(
+        10,
+        _family((0, 1, 2), (0, 1, 3), (8, 9, 4), (8, 9, 5), (2, 4, 6), (3, 5, 7)),
+    )
+
+    assert RelationshipCoefficients(graph).kinship(6, 7) == pytest.approx(1 / 8)
+
+
+def test_inbred_parent_raises_kinship_with_child() -> None:
+    # 0 + 1 -> 2, 3; siblings 2 + 3 -> 4; 4 + 5 -> 6.
+    coefficients = RelationshipCoefficients(
+        _graph(7, _family((0, 1, 2), (0, 1, 3), (2, 3, 4), (4, 5, 6)))
+    )
+
+    assert coefficients.inbreeding(4) == pytest.approx(1 / 4)
+    assert coefficients.kinship(4, 6) == pytest.approx((1 + 1 / 4) / 4)
+
+
+def test_pedigree_collapse_is_not_exponential() -> None:
+    # Every generation is a brother and sister, children of the previous pair.
+    generations = 200
+    edges = _family(
+        *(
+            (2 * g, 2 * g + 1, 2 * (g + 1) + child)
+            for g in range(generations)
+            for child in (0, 1)
+        )
+    )
+    coefficients = RelationshipCoefficients(_graph(2 * (generations + 1), edges))
+
+    inbreeding = coefficients.inbreeding(2 * generations)
+
+    assert 0.99 < inbreeding < 1
+
+
+def test_topological_order_puts_parents_first() -> None:
+    order = topological_order(COUSINS)
+    position = {node: index for index, node in enumerate(order)}
+
+    assert sorted(order) == list(range(len(COUSINS)))
+    for parent, child in COUSINS.blood_relations():
+        assert position[parent] < position[child]
+
+
+def test_topological_order_keeps_individuals_of_a_cycle() -> None:
+    order = topological_order(_graph(3, [(0, 1), (1, 2), (2, 1)]))
+
+    assert sorted(order) == [0, 1, 2]
+    assert order[0] == 0
@@ -0,0 +1,217 @@
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+
+from gtree.domain.entities._value_objects.gender import Gender
+from gtree.domain.entities.trees.individual import IndividualEntity
+from gtree.domain.linkage.duplicates import (
+    BlockKey,
+    DuplicateFinder,
+    blocking_keys,
+    score_pair,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _phonetic(word: str) -> set[str]:
+    """Stand-in for a phonetic code: the first three letters."""
+    return {word.lower()[:3]}
+
+
+def _individual(
+    first_name: str = "Ivan",
+    last_name: str | None = "Petrov",
+    *,
+    gender: Gender | None = Gender.MALE,
+    birth_date: date | None = None,
+    birth_date_precision: str | None = None,
+    death_date: date | None = None,
+    birth_place: str | None = None,
+) -> IndividualEntity:
+    return IndividualEntity(
+        tree_id=uuid4(),
+        first_name=first_name,
+        last_name=last_name,
+        patronymic=None,
+        gender=gender,
+        birth_date=birth_date,
+        birth_date_precision=birth_date_precision,
+        death_date=death_date,
+        death_date_precision=None,
+        birth_place=birth_place,
+        death_place=None,
+        bio=None,
+        avatar_url="",
+    )
+
+
+@pytest.mark.parametrize(
+    ("birth_date", "precision", "decades"),
+    [
+        (date(1905, 6, 1), None, {190}),
+        (date(1909, 6, 1), None, {190, 191}),
+        (date(1901, 6, 1), None, {189, 190}),
+        (date(1905, 1, 1), "about", {189, 190, 191}),
+    ],
+)
+def test_blocking_keys_of_dated_individual(
+    birth_date: date, precision: str | None, decades: set[int]
+) -> None:
+    individual = _individual(birth_date=birth_date, birth_date_precision=precision)
+
+    assert blocking_keys(individual, _phonetic) == {
+        BlockKey(code="pet", decade=decade) for decade in decades
+    }
+
+
+def test_blocking_keys_of_undated_individual() -> None:
+    assert blocking_keys(_individual(), _phonetic) == {
+        BlockKey(code="pet", decade=None)
+    }
+
+
+def test_blocking_keys_split_compound_last_names() -> None:
+    individual = _individual(last_name="Petrov-Vodkin", birth_date=date(1905, 6, 1))
+
+    assert blocking_keys(individual, _phonetic) == {
+        BlockKey(code="pet", decade=190),
+        BlockKey(code="vod", decade=190),
+    }
+
+
+def test_blocking_keys_fall_back_to_first_name() -> None:
+    assert blocking_keys(_individual(last_name=None), _phonetic) == {
+        BlockKey(code="iva", decade=None)
+    }
+
+
+def test_score_pair_of_identical_records() -> None:
+    individual = _individual(birth_date=date(1905, 6, 1), birth_place="Moscow")
+    other = _individual(birth_date=date(1905, 6, 1), birth_place="Moscow")
+
+    score = score_pair(individual, other, _phonetic)
+
+    assert score is not None
+    assert score.score == pytest.approx(1.0)
+    assert score.name == pytest.approx(1.0)
+    assert score.dates == pytest.approx(1.0)
+    assert score.places == pytest.approx(1.0)
+
+
+def test_score_pair_rejects_different_genders() -> None:
+    individual = _individual()
+    other = _individual(gender=Gender.FEMALE)
+
+    assert score_pair(individual, other, _phonetic) is None
+
+
+def test_score_pair_ignores_unknown_gender() -> None:
+    individual = _individual()
+    other = _individual(gender=Gender.OTHER)
+
+    assert score_pair(individual, other, _phonetic) is not None
+
+
+def test_score_pair_rejects_distant_birth_dates() -> None:
+    individual = _individual(birth_date=date(1905, 6, 1))
+    other = _individual(birth_date=date(1910, 6, 1))
+
+    assert score_pair(individual, other, _phonetic) is None
+
+
+def test_score_pair_rejects_one_distant_date_of_two() -> None:
+    individual = _individual(birth_date=date(1905, 6, 1), death_date=date(1970, 1, 1))
+    other = _individual(birth_date=date(1905, 6, 1), death_date=date(1980, 1, 1))
+
+    assert score_pair(individual, other, _phonetic) is None
+
+
+def test_score_pair_accepts_vague_dates_that_overlap() -> None:
+    individual = _individual(birth_date=date(1905, 6, 1))
+    other = _individual(birth_date=date(1905, 1, 1), birth_date_precision="year")
+
+    score = score_pair(individual, other, _phonetic)
+
+    assert score is not None
+    assert score.dates is not None
+    assert 0.6 <= score.dates < 1.0
+
+
+def test_score_pair_without_dates_or_places() -> None:
+    score = score_pair(_individual(), _individual(), _phonetic)
+
+    assert score is not None
+    assert score.dates is None
+    assert score.places is None
+    # Unknown dates and places count as half a match.
+    assert score.score == pytest.approx(0.6 + 0.5 * 0.3 + 0.5 * 0.1)
+
+
+def test_score_pair_of_names_that_sound_alike() -> None:
+    individual = _individual(last_name="Petrov")
+    other = _individual(last_name="Petroff")
+
+    score = score_pair(individual, other, _phonetic)
+
+    assert score is not None
+    assert 0.85 <= score.name < 1.0
+
+
+def _suggested(finder: DuplicateFinder) -> set[frozenset[UUID]]:
+    for block in finder.blocks:
+        finder.scan_block(block)
+    return {
+        frozenset((s.individual_id, s.duplicate_id)) for s in finder.suggestions(100)
+    }
+
+
+def test_finder_compares_undated_with_dated_of_same_code() -> None:
+    dated = _individual(birth_date=date(1905, 6, 1))
+    undated = _individual()
+    other_code = _individual(last_name="Sidorov")
+
+    finder = DuplicateFinder(
+        [dated, undated, other_code], _phonetic, min_score=0, max_block_size=10
+    )
+
+    assert _suggested(finder) == {frozenset((dated.id, undated.id))}
+    assert finder.compared_pairs == 1
+
+
+def test_finder_does_not_compare_dated_across_decades() -> None:
+    individuals = [
+        _individual(birth_date=date(1905, 6, 1)),
+        _individual(birth_date=date(1935, 6, 1)),
+    ]
+
+    finder = DuplicateFinder(individuals, _phonetic, min_score=0, max_block_size=10)
+
+    assert finder.blocks == []
+    assert finder.compared_pairs == 0
+
+
+def test_finder_limits_undated_blocks_by_undated_members() -> None:
+    # Many dated namesakes do not push the undated block over the limit.
+    dated = [_individual(birth_date=date(1805 + 10 * i, 6, 1)) for i in range(5)]
+    undated = _individual()
+
+    finder = DuplicateFinder(
+        [*dated, undated], _phonetic, min_score=0, max_block_size=2
+    )
+    (block,) = finder.blocks
+
+    assert block.key == BlockKey(code="pet", decade=None)
+    assert block.members == (undated,)
+    assert {i.id for i in block.dated} == {i.id for i in dated}
+    assert finder.skipped_blocks == 0
+
+
+def test_finder_skips_oversized_blocks() -> None:
+    individuals = [_individual() for _ in range(3)]
+
+    finder = DuplicateFinder(individuals, _phonetic, min_score=0, max_block_size=2)
+
+    assert finder.blocks == []
+    assert finder.skipped_blocks == 1
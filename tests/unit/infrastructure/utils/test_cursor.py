@@ -0,0 +1,78 @@
+import base64
+import json
+from uuid import uuid4
+
+import pytest
+
+from gtree.domain.entities._value_objects.individual_order import IndividualOrder
+from gtree.infrastructure.db.repositories.trees.individual import (
+    _ORDER_KEYS,
+    _parse_key,
+)
+from gtree.infrastructure.utils.cursor import decode_cursor, encode_cursor
+from gtree.infrastructure.utils.exceptions import InvalidCursorError
+
+pytestmark = pytest.mark.unit
+
+
+def _raw_cursor(values: object) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def test_round_trips_sort_key() -> None:
+    key = ["Иванов", "Иван", str(uuid4())]
+
+    cursor = encode_cursor(IndividualOrder.NAME, key)
+
+    assert "=" not in cursor
+    assert decode_cursor(IndividualOrder.NAME, cursor) == key
+
+
+def test_rejects_cursor_of_another_order() -> None:
+    cursor = encode_cursor(IndividualOrder.NAME, ["a", "b", str(uuid4())])
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(IndividualOrder.CREATED, cursor)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["", "not base64!", _raw_cursor({"name": 1}), _raw_cursor([]), "e30"],
+)
+def test_rejects_malformed_cursor(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(IndividualOrder.NAME, cursor)
+
+
+def test_parses_key_back_to_column_types() -> None:
+    individual_id = uuid4()
+    cursor = encode_cursor(
+        IndividualOrder.CREATED, ["2026-10-18T12:00:00+00:00", individual_id]
+    )
+
+    created_at, parsed_id = _parse_key(
+        _ORDER_KEYS[IndividualOrder.CREATED],
+        decode_cursor(IndividualOrder.CREATED, cursor),
+    )
+
+    assert created_at.isoformat() == "2026-10-18T12:00:00+00:00"
+    assert parsed_id == individual_id
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["a", "b", 42],
+        ["a", "b", None],
+        ["a", "b", "not-a-uuid"],
+        ["a", "b"],
+    ],
+)
+def test_rejects_keys_that_do_not_fit_the_order(values: list[object]) -> None:
+    with pytest.raises(InvalidCursorError):
+        _parse_key(_ORDER_KEYS[IndividualOrder.NAME], values)
+
+
+def test_rejects_non_timestamp_key() -> None:
+    with pytest.raises(InvalidCursorError):
+        _parse_key(_ORDER_KEYS[IndividualOrder.CREATED], [42, str(uuid4())])
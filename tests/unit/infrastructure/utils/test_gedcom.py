@@ -0,0 +1,229 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import date
+
+import pytest
+
+from gtree.domain.entities._value_objects.date_precision import DatePrecision
+from gtree.infrastructure.utils.exceptions import GedcomParseError
+from gtree.infrastructure.utils.gedcom import (
+    GedcomNode,
+    decode_lines,
+    format_date,
+    format_line,
+    parse_date,
+    parse_records,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _decode(chunks: list[bytes]) -> list[str]:
+    async def stream() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    async def collect() -> list[str]:
+        return [line async for line in decode_lines(stream())]
+
+    return asyncio.run(collect())
+
+
+def _round_trip(value: str) -> str:
+    lines = [*format_line(0, "NOTE", value, xref="@N1@"), "0 TRLR\n"]
+    record = next(parse_records(lines))
+    return record.value
+
+
+class TestGedcomParser:
+    def test_nests_lines_by_level(self) -> None:
+        records = list(
+            parse_records(
+                [
+                    "0 HEAD\n",
+                    "0 @I1@ INDI\n",
+                    "1 NAME Ivan /Ivanov/\n",
+                    "1 BIRT\n",
+                    "2 DATE 12 MAR 1850\n",
+                    "2 PLAC Odessa\n",
+                    "1 SEX M\n",
+                    "0 TRLR\n",
+                ]
+            )
+        )
+
+        assert [record.tag for record in records] == ["HEAD", "INDI", "TRLR"]
+        individual = records[1]
+        assert individual.xref == "@I1@"
+        assert [child.tag for child in individual.children] == ["NAME", "BIRT", "SEX"]
+        assert individual.value_of("BIRT", "DATE") == "12 MAR 1850"
+        assert individual.value_of("BIRT", "PLAC") == "Odessa"
+        assert individual.value_of("DEAT", "DATE") is None
+
+    def test_joins_conc_and_cont_into_parent_value(self) -> None:
+        (record,) = parse_records(
+            [
+                "0 @N1@ NOTE First li\n",
+                "1 CONC ne\n",
+                "1 CONT\n",
+                "1 CONT Third line\n",
+            ]
+        )
+
+        assert record.value == "First line\n\nThird line"
+        assert record.children == []
+
+    def test_conc_continues_nested_value(self) -> None:
+        (record,) = parse_records(
+            ["0 @I1@ INDI\n", "1 NOTE Blacks\n", "2 CONC mith\n", "1 SEX M\n"]
+        )
+
+        assert record.value_of("NOTE") == "Blacksmith"
+        assert record.value_of("SEX") == "M"
+
+    def test_skips_blank_lines_and_byte_order_mark(self) -> None:
+        records = list(parse_records(["\ufeff0 HEAD\r\n", "\n", "  \n", "0 TRLR"]))
+
+        assert [record.tag for record in records] == ["HEAD", "TRLR"]
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            ["0 HEAD\n", "x SOUR gtree\n"],
+            ["0 HEAD\n", "2 SOUR gtree\n"],
+            ["1 SOUR gtree\n"],
+            ["0 @I1@\n"],
+        ],
+    )
+    def test_rejects_malformed_lines(self, lines: list[str]) -> None:
+        with pytest.raises(GedcomParseError):
+            list(parse_records(lines))
+
+
+class TestFormatLine:
+    def test_short_value_is_one_line(self) -> None:
+        assert list(format_line(1, "NAME", "Ivan /Ivanov/")) == [
+            "1 NAME Ivan /Ivanov/\n"
+        ]
+
+    def test_empty_value_has_no_trailing_space(self) -> None:
+        assert list(format_line(0, "INDI", xref="@I1@")) == ["0 @I1@ INDI\n"]
+
+    def test_long_value_is_split_in_conc_lines(self) -> None:
+        lines = list(format_line(1, "NOTE", "x" * 500))
+
+        assert [line.split(" ")[1] for line in lines] == ["NOTE", "CONC", "CONC"]
+        assert all(len(line) <= 255 for line in lines)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "single line",
+            "first line\nsecond line",
+            "paragraph\n\nafter a blank line",
+            "\nleading newline",
+            "word " * 100,
+            "Кузнец в Одессе. " * 40,
+            "x" * 240 + " starts with a space",
+            ("a" * 239 + "\n") * 3 + "end",
+        ],
+    )
+    def test_round_trips_through_parser(self, value: str) -> None:
+        assert _round_trip(value) == value
+
+
+class TestDecodeLines:
+    def test_splits_on_every_line_ending(self) -> None:
+        assert _decode([b"0 HEAD\r\n1 SOUR a\r1 NAME b\n0 TRLR"]) == [
+            "0 HEAD",
+            "1 SOUR a",
+            "1 NAME b",
+            "0 TRLR",
+        ]
+
+    def test_joins_lines_split_across_chunks(self) -> None:
+        assert _decode([b"0 HE", b"AD\n0 TR", b"LR\n"]) == ["0 HEAD", "0 TRLR", ""]
+
+    def test_crlf_split_across_chunks_only_adds_blank_line(self) -> None:
+        lines = _decode([b"0 HEAD\r", b"\n0 TRLR\r\n"])
+
+        assert [line for line in lines if line] == ["0 HEAD", "0 TRLR"]
+        assert [record.tag for record in parse_records(lines)] == ["HEAD", "TRLR"]
+
+    def test_decodes_multibyte_character_split_across_chunks(self) -> None:
+        data = "1 PLAC Одесса\n".encode()
+        split = data.index("О".encode()) + 1
+
+        assert _decode([data[:split], data[split:]]) == ["1 PLAC Одесса", ""]
+
+    def test_strips_byte_order_mark(self) -> None:
+        assert _decode([b"\xef\xbb", b"\xbf0 HEAD"]) == ["0 HEAD"]
+
+
+class TestParseDate:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("12 MAR 1850", (date(1850, 3, 12), DatePrecision.DAY)),
+            ("MAR 1850", (date(1850, 3, 1), DatePrecision.MONTH)),
+            ("1850", (date(1850, 1, 1), DatePrecision.YEAR)),
+            ("1699/00", (date(1699, 1, 1), DatePrecision.YEAR)),
+            ("@#DGREGORIAN@ 2 FEB 1900", (date(1900, 2, 2), DatePrecision.DAY)),
+            ("abt 1850", (date(1850, 1, 1), DatePrecision.ABOUT)),
+            ("CAL 1850", (date(1850, 1, 1), DatePrecision.ABOUT)),
+            ("EST MAR 1850", (date(1850, 3, 1), DatePrecision.ABOUT)),
+            ("INT 1850 (from the census)", (date(1850, 1, 1), DatePrecision.ABOUT)),
+            ("BEF 1 JAN 1900", (date(1900, 1, 1), DatePrecision.BEFORE)),
+            ("TO 1900", (date(1900, 1, 1), DatePrecision.BEFORE)),
+            ("AFT 1900", (date(1900, 1, 1), DatePrecision.AFTER)),
+            ("BET 1850 AND 1860", (date(1850, 1, 1), DatePrecision.AFTER)),
+            ("FROM 1 JAN 1850 TO 1860", (date(1850, 1, 1), DatePrecision.AFTER)),
+        ],
+    )
+    def test_parses_dates(
+        self, value: str, expected: tuple[date, DatePrecision]
+    ) -> None:
+        assert parse_date(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "",
+            "(sometime in spring)",
+            "INT (unknown)",
+            "@#DJULIAN@ 1700",
+            "30 FEB 1900",
+            "12 XYZ 1850",
+            "44 B.C.",
+            "1 2 MAR 1850",
+        ],
+    )
+    def test_unrepresentable_dates_yield_nothing(self, value: str | None) -> None:
+        assert parse_date(value) == (None, None)
+
+    @pytest.mark.parametrize(
+        ("value", "precision"),
+        [
+            (date(1850, 3, 12), DatePrecision.DAY),
+            (date(1850, 3, 1), DatePrecision.MONTH),
+            (date(1850, 1, 1), DatePrecision.YEAR),
+            (date(1850, 1, 1), DatePrecision.ABOUT),
+            (date(1850, 1, 1), DatePrecision.BEFORE),
+            (date(1850, 1, 1), DatePrecision.AFTER),
+        ],
+    )
+    def test_round_trips_formatted_dates(
+        self, value: date, precision: DatePrecision
+    ) -> None:
+        assert parse_date(format_date(value, precision)) == (value, precision)
+
+    def test_formats_missing_or_unknown_precision_as_day(self) -> None:
+        assert format_date(date(1850, 3, 12), None) == "12 MAR 1850"
+        assert format_date(date(1850, 3, 12), "fortnight") == "12 MAR 1850"
+
+
+def test_value_of_treats_empty_values_as_missing() -> None:
+    node = GedcomNode("INDI", children=[GedcomNode("NAME", "")])
+
+    assert node.value_of("NAME") is None
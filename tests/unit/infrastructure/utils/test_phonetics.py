@@ -0,0 +1,75 @@
+import pytest
+
+from gtree.infrastructure.utils.phonetics import name_codes, query_codes, soundex_codes
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    ("word", "codes"),
+    [
+        # Reference codes of the Daitch–Mokotoff Soundex.
+        ("Schwarzenegger", {"474659", "479465"}),
+        ("Lipshitz", {"874400"}),
+        ("Lippszyc", {"874400", "874500"}),
+        ("Moskowitz", {"645740"}),
+        ("Auerbach", {"097400", "097500"}),
+        ("Jackson", {"154600", "454600", "145460", "445460"}),
+        ("Szlamawicz", {"486740"}),
+        ("Lewinsky", {"876450"}),
+        ("Peters", {"734000", "739400"}),
+    ],
+)
+def test_reference_codes(word: str, codes: set[str]) -> None:
+    assert soundex_codes(word) == codes
+
+
+@pytest.mark.parametrize(
+    "spellings",
+    [
+        ("Ivanov", "Iwanow", "Иванов", "IVANOV"),
+        ("Moskowitz", "Moskovitz"),
+        ("Auerbach", "Ohrbach"),
+        ("Lewinsky", "Levinsky"),
+        ("Szlamawicz", "Shlamovitz"),
+        ("Kikhtenko", "Кихтенко"),
+        ("Müller", "Muller"),
+    ],
+)
+def test_spellings_of_a_name_share_codes(spellings: tuple[str, ...]) -> None:
+    first, *others = spellings
+    for other in others:
+        assert soundex_codes(first) & soundex_codes(other), other
+
+
+def test_ivanov_code() -> None:
+    assert soundex_codes("Иванов") == {"076700"}
+
+
+def test_lipshitz_spellings_overlap() -> None:
+    assert soundex_codes("Lipshitz") & soundex_codes("Lippszyc") == {"874400"}
+
+
+@pytest.mark.parametrize("word", ["", "123", "-", "  "])
+def test_words_without_letters_have_no_codes(word: str) -> None:
+    assert soundex_codes(word) == set()
+
+
+def test_codes_are_padded_and_truncated_to_six_digits() -> None:
+    assert soundex_codes("Lee") == {"800000"}
+    assert all(len(code) == 6 for code in soundex_codes("Schwarzenegger"))
+
+
+def test_name_codes_cover_every_word_once() -> None:
+    codes = name_codes("Ivan", None, "Ivanov-Petrov", "Ivanov")
+
+    assert codes == sorted(
+        soundex_codes("Ivan") | soundex_codes("Ivanov") | soundex_codes("Petrov")
+    )
+
+
+def test_query_codes_keep_word_order_and_skip_words_without_letters() -> None:
+    assert query_codes("Iwanow 1850 Petrow") == [
+        sorted(soundex_codes("Iwanow")),
+        sorted(soundex_codes("Petrow")),
+    ]